@@ -0,0 +1,349 @@
+"""
+Asset pipeline shared by the HTML generators
+
+Images can be embedded in two ways:
+- inline: base64 data URIs, the page is a single self-contained file (default)
+- external: each image is copied once to a content-addressed file under
+  assets/build/ (e.g. joerg_osterrieder.3fa1c2d4.jpg) and referenced by URL
+
+Hashed filenames change whenever the content changes, so assets/build/ can be
+served with "Cache-Control: public, max-age=31536000, immutable" and repeat
+visitors only re-download the HTML shell after a content edit.
+
+Encoded forms of an image (e.g. its base64 payload) are memoized in-process
+with an LRU and on disk in .build_cache/encoded/, keyed by content hash and
+target format, so every generator and every run shares one encode per
+content change.
+
+Committee photos are derived into right-sized square thumbnails (1x/2x) in
+JPEG, WebP and, where supported, AVIF (requires Pillow; without it the
+original files are used unchanged):
+- inline mode embeds a single 2x JPEG thumbnail (data URIs cannot be fetched
+  selectively, so extra variants would only add bytes)
+- external mode emits <picture> markup with AVIF/WebP sources and srcset, so
+  browsers download only the smallest variant they support
+
+With lazy images (--lazy-images), below-the-fold images get
+loading="lazy"/decoding="async", explicit dimensions (no layout shift once
+they load) and, with Pillow, a tiny blurred preview as their background.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import re
+import shutil
+import struct
+from functools import lru_cache, partial
+from pathlib import Path
+
+from build_profiler import profiled
+
+try:
+    from PIL import Image, ImageFilter, ImageOps, features
+except ImportError:  # thumbnails are optional
+    Image = None
+
+BASE_DIR = Path(__file__).parent
+BUILD_DIR = BASE_DIR / "assets" / "build"
+ENCODE_CACHE_DIR = BASE_DIR / ".build_cache" / "encoded"
+
+ASSET_MODES = ("inline", "external")
+HASH_LENGTH = 8
+
+LAZY_ATTRS = 'loading="lazy" decoding="async"'
+# Blurred 16px preview shown while a lazy image loads (about 150 bytes)
+PLACEHOLDER_FORMAT = "16px.blur.webp"
+
+MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp',
+    '.avif': 'image/avif',
+}
+
+
+def mime_type(filepath):
+    """Return the MIME type for an image file (defaults to JPEG)"""
+    return MIME_TYPES.get(Path(filepath).suffix.lower(), 'image/jpeg')
+
+
+@lru_cache(maxsize=1024)
+def _hash_file(path, mtime_ns, size):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_hash(filepath):
+    """Return the SHA-256 hex digest of a file's content
+
+    Memoized per (path, mtime, size), so each file is hashed once per process.
+    """
+    st = os.stat(filepath)
+    return _hash_file(str(filepath), st.st_mtime_ns, st.st_size)
+
+
+def hashed_name(filepath):
+    """Content-addressed filename, e.g. joerg_osterrieder.3fa1c2d4.jpg"""
+    filepath = Path(filepath)
+    return f"{filepath.stem}.{file_hash(filepath)[:HASH_LENGTH]}{filepath.suffix.lower()}"
+
+
+# Thumbnail extension -> (Pillow format, save options)
+THUMBNAIL_FORMATS = {
+    'jpg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+    'webp': ('WEBP', {'quality': 80, 'method': 6}),
+    'avif': ('AVIF', {'quality': 60}),
+}
+
+
+def thumbnails_available():
+    return Image is not None
+
+
+@lru_cache(maxsize=None)
+def avif_available():
+    try:
+        return Image is not None and features.check('avif')
+    except (ValueError, KeyError):
+        return False
+
+
+@profiled("encode")
+def _encode_thumbnail(filepath, size, ext, blur=False):
+    """Centre-crop an image to a size x size square (never upscaled)"""
+    pil_format, options = THUMBNAIL_FORMATS[ext]
+    with Image.open(filepath) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        size = min(size, *img.size)
+        thumb = ImageOps.fit(img, (size, size), Image.LANCZOS)
+    if blur:
+        thumb = thumb.filter(ImageFilter.GaussianBlur(1))
+    buf = io.BytesIO()
+    thumb.save(buf, pil_format, **options)
+    return buf.getvalue()
+
+
+def _thumbnail_encoder(fmt):
+    """Encoder for a thumbnail format such as "160px.webp" or "16px.blur.jpg", returning bytes"""
+    size, blur, ext = re.fullmatch(r"(\d+)px(\.blur)?\.(\w+)", fmt).groups()
+    return partial(_encode_thumbnail, size=int(size), ext=ext, blur=bool(blur))
+
+
+def _write_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+@profiled("encode")
+def _write_base64_stream(src, dest):
+    """Base64-encode src into dest in fixed-size chunks (multiples of 3 bytes)"""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+    with open(src, 'rb') as fin, open(tmp, 'wb') as fout:
+        for chunk in iter(lambda: fin.read(3 * 16384), b''):
+            fout.write(base64.b64encode(chunk))
+    os.replace(tmp, dest)
+
+
+def encoded_file(filepath, fmt):
+    """Path of the on-disk cache entry for a file's encoded form, creating it if needed
+
+    fmt is 'b64' (base64 payload) or a thumbnail format such as '160px.webp'.
+    """
+    cache_file = ENCODE_CACHE_DIR / f"{file_hash(filepath)}.{fmt}"
+    if not cache_file.exists():
+        if fmt == 'b64':
+            _write_base64_stream(filepath, cache_file)
+        else:
+            _write_atomic(cache_file, _thumbnail_encoder(fmt)(Path(filepath)))
+    return cache_file
+
+
+@lru_cache(maxsize=256)
+def _cached_encode(digest, fmt, path):
+    with open(encoded_file(path, fmt), 'rb') as f:
+        return f.read()
+
+
+def encode(filepath, fmt):
+    """Return the encoded form of a file (bytes), memoized in memory and on disk"""
+    return _cached_encode(file_hash(filepath), fmt, str(filepath))
+
+
+def publish_asset(filepath):
+    """Copy a file into assets/build/ under its hashed name and return its URL
+
+    The copy only happens once per content version; the returned URL is
+    relative to the site root, where all generated pages live.
+    """
+    filepath = Path(filepath)
+    dest = BUILD_DIR / hashed_name(filepath)
+    if not dest.exists():
+        BUILD_DIR.mkdir(parents=True, exist_ok=True)
+        # Per-process temp name: several pages may publish the same image in parallel
+        tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+        shutil.copyfile(filepath, tmp)
+        os.replace(tmp, dest)
+    return dest.relative_to(BASE_DIR).as_posix()
+
+
+def publish_content(name, data):
+    """Write generated content (bytes) to assets/build/ under a hashed name and return its URL
+
+    name is the unhashed filename, e.g. 'site.css' -> assets/build/site.3fa1c2d4.css
+    """
+    name = Path(name)
+    dest = BUILD_DIR / f"{name.stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{name.suffix}"
+    if not dest.exists():
+        _write_atomic(dest, data)
+    return dest.relative_to(BASE_DIR).as_posix()
+
+
+def data_uri(filepath):
+    """Return a file as a base64 data URI"""
+    return f"data:{mime_type(filepath)};base64,{encode(filepath, 'b64').decode('ascii')}"
+
+
+class DataUri:
+    """Lazy base64 data URI for a file
+
+    Formatting it (str() or an f-string) renders the full URI. When yielded
+    as a chunk of its own, html_writer streams it from the encode cache
+    instead, so large images never sit in memory as one string.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = Path(filepath)
+
+    def __str__(self):
+        return data_uri(self.filepath)
+
+    def prefix(self):
+        return f"data:{mime_type(self.filepath)};base64,"
+
+    def open_payload(self):
+        """Open the cached base64 payload for reading (binary)"""
+        return open(encoded_file(self.filepath, 'b64'), 'rb')
+
+
+def derivative_src(filepath, fmt, asset_mode="inline"):
+    """<img src> value for a derived variant of a file, e.g. fmt='160px.webp'"""
+    filepath = Path(filepath)
+    data = encode(filepath, fmt)
+    ext = fmt.rsplit('.', 1)[-1]
+    if asset_mode == "external":
+        dest = BUILD_DIR / f"{filepath.stem}.{file_hash(filepath)[:HASH_LENGTH]}.{fmt}"
+        if not dest.exists():
+            _write_atomic(dest, data)
+        return dest.relative_to(BASE_DIR).as_posix()
+    return f"data:{MIME_TYPES['.' + ext]};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def image_size(filepath):
+    """(width, height) of a raster image, or None if unknown
+
+    Uses Pillow when available, otherwise reads the PNG header.
+    """
+    try:
+        if Image is not None:
+            with Image.open(filepath) as img:
+                return img.size
+        with open(filepath, 'rb') as f:
+            header = f.read(24)
+        if header[:8] == b'\x89PNG\r\n\x1a\n':
+            return struct.unpack('>II', header[16:24])
+    except OSError:
+        pass
+    return None
+
+
+def lazy_attrs(filepath=None, size=None):
+    """Attributes for a lazily loaded <img>: explicit dimensions, loading and decoding hints
+
+    size is the (width, height) to reserve; by default the image's own size.
+    """
+    size = size or (image_size(filepath) if filepath else None)
+    dims = f'width="{size[0]}" height="{size[1]}" ' if size else ''
+    return dims + LAZY_ATTRS
+
+
+def placeholder_style(filepath):
+    """style attribute showing a blurred preview behind a lazy image ('' without Pillow)"""
+    if not thumbnails_available():
+        return ''
+    return f' style="background: url({derivative_src(filepath, PLACEHOLDER_FORMAT)}) center / cover"'
+
+
+@profiled("image")
+def photo_html(filepath, alt, size, asset_mode="inline", lazy=False):
+    """<img>/<picture> markup for a photo displayed at size x size CSS pixels
+
+    Lazy photos are loaded and decoded off the critical path, with a blurred
+    placeholder. Returns None if the file is missing.
+    """
+    filepath = Path(filepath)
+    if not filepath.exists():
+        return None
+    dims = f'width="{size}" height="{size}"'
+    if lazy:
+        dims += f' {LAZY_ATTRS}{placeholder_style(filepath)}'
+    if not thumbnails_available():
+        attrs = f' {dims}' if lazy else ''
+        return f'<img src="{image_src(filepath, asset_mode)}" alt="{alt}"{attrs}>'
+
+    if asset_mode != "external":
+        return f'<img src="{derivative_src(filepath, f"{2 * size}px.jpg")}" alt="{alt}" {dims}>'
+
+    def srcset(ext):
+        return (f"{derivative_src(filepath, f'{size}px.{ext}', asset_mode)} 1x, "
+                f"{derivative_src(filepath, f'{2 * size}px.{ext}', asset_mode)} 2x")
+
+    sources = ''
+    for ext in (['avif'] if avif_available() else []) + ['webp']:
+        sources += f'<source type="{MIME_TYPES["." + ext]}" srcset="{srcset(ext)}">'
+    fallback = derivative_src(filepath, f"{size}px.jpg", asset_mode)
+    return f'<picture>{sources}<img src="{fallback}" srcset="{srcset("jpg")}" alt="{alt}" {dims}></picture>'
+
+
+@profiled("image")
+def image_src(filepath, asset_mode="inline"):
+    """Return the value for an <img src> attribute, or None if the file is missing
+
+    In inline mode this is a DataUri, which formats as the full URI but can
+    also be streamed by html_writer.
+    """
+    filepath = Path(filepath)
+    if not filepath.exists():
+        return None
+    if asset_mode == "external":
+        return publish_asset(filepath)
+    return DataUri(filepath)
+
+
+def add_lazy_images_argument(parser):
+    """Add the shared --lazy-images option to a generator's argument parser"""
+    parser.add_argument(
+        '--lazy-images', action='store_true',
+        help="lazy-load below-the-fold images with dimensions and blurred placeholders"
+    )
+
+
+def add_asset_mode_argument(parser):
+    """Add the shared --assets option to a generator's argument parser"""
+    parser.add_argument(
+        '--assets', dest='asset_mode', choices=ASSET_MODES, default='inline',
+        help="inline images as base64 (default) or publish them to assets/build/ with hashed names"
+    )
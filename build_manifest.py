@@ -0,0 +1,163 @@
+"""
+Incremental build support for the HTML generators
+
+Every generated page is recorded in .build_cache/manifest.json together with
+the fingerprints (mtime, size, SHA-256) of the inputs it was built from:
+JSON data, photos, logos and the generator source itself. A page is only
+rebuilt when one of its inputs changed, so a no-op rebuild is a handful of
+stat() calls.
+
+Inputs are compared by mtime/size first; only when those differ is the file
+re-hashed, so touching a file (e.g. a git checkout) does not force a rebuild.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from build_profiler import profiled
+
+BASE_DIR = Path(__file__).parent
+CACHE_DIR = BASE_DIR / ".build_cache"
+MANIFEST_FILE = CACHE_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _key(path):
+    """Manifest key for a path: relative to the repository root when possible"""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(path, previous=None):
+    """Return {'mtime_ns', 'size', 'sha256'} for a file, or None if it doesn't exist
+
+    If a previous fingerprint with the same mtime and size is given, its hash
+    is reused instead of reading the file again.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if previous and previous.get('mtime_ns') == st.st_mtime_ns and previous.get('size') == st.st_size:
+        return previous
+    return {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': _sha256(path)}
+
+
+def build_params(css_mode, asset_mode=None, lazy_images=False, minify=False):
+    """Build options recorded with a page, the same whichever script builds it
+
+    Pages without images pass only css_mode. minify is recorded only when
+    set, so a page built by its own generator and by generate_html_pages.py
+    without --minify is up to date for both.
+    """
+    params = {'css_mode': css_mode}
+    if asset_mode is not None:
+        params.update(asset_mode=asset_mode, lazy_images=lazy_images)
+    if minify:
+        params['minify'] = True
+    return params
+
+
+def module_sources(*modules):
+    """Source files of the given repository modules, to record as a page's code inputs
+
+    List every local module whose code changes the output (directly or through
+    the modules it imports), so editing one of them rebuilds the page.
+    """
+    return [BASE_DIR / f"{module}.py" for module in modules]
+
+
+class BuildManifest:
+    """Output -> input fingerprints, persisted between generator runs"""
+
+    def __init__(self, path=MANIFEST_FILE):
+        self.path = Path(path)
+        self.outputs = {}
+        self._dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    self.outputs = data.get('outputs', {})
+            except (OSError, ValueError):
+                self.outputs = {}
+
+    @profiled("manifest")
+    def is_fresh(self, output, params=None):
+        """True if output is untouched since its build and none of its inputs changed"""
+        entry = self.outputs.get(_key(output))
+        if entry is None or entry.get('params') != (params or {}):
+            return False
+        try:
+            st = os.stat(output)
+        except FileNotFoundError:
+            return False
+        if entry.get('output') != [st.st_mtime_ns, st.st_size]:
+            return False
+        for key, recorded in entry['inputs'].items():
+            path = BASE_DIR / key
+            if recorded is None:
+                if path.exists():
+                    return False
+                continue
+            current = fingerprint(path, recorded)
+            if current is None or current['sha256'] != recorded['sha256']:
+                return False
+            if current is not recorded:
+                # Touched but unchanged: remember the new stat to skip hashing next time
+                entry['inputs'][key] = current
+                self._dirty = True
+        return True
+
+    @profiled("manifest")
+    def record(self, output, inputs, params=None):
+        """Record the inputs an output was just built from (call after writing it)
+
+        Missing inputs are recorded too, so that a file appearing later (e.g. a
+        newly downloaded photo) triggers a rebuild.
+        """
+        previous = self.outputs.get(_key(output), {}).get('inputs', {})
+        fingerprints = {}
+        for path in inputs:
+            key = _key(path)
+            fingerprints[key] = fingerprint(path, previous.get(key))
+        st = os.stat(output)
+        self.outputs[_key(output)] = {
+            'params': params or {},
+            'output': [st.st_mtime_ns, st.st_size],
+            'inputs': fingerprints,
+        }
+        self._dirty = True
+
+    @profiled("manifest")
+    def save(self):
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'outputs': self.outputs}, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def add_force_argument(parser):
+    """Add the shared --force option to a generator's argument parser"""
+    parser.add_argument(
+        '--force', action='store_true',
+        help="rebuild every page even if its inputs are unchanged"
+    )
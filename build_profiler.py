@@ -0,0 +1,193 @@
+"""
+Per-stage build profiling for the page generators (--profile)
+
+With --profile, a generator records every build stage as a Chrome trace
+event (open the JSON in chrome://tracing or https://ui.perfetto.dev):
+  load     JSON and people store loads
+  image    committee photo / image markup (asset_pipeline.photo_html, image_src)
+  encode   actual encodes (thumbnails, base64): encode cache misses only
+  render   each section a page generator yields
+  write    each page written (html_writer.write_html)
+  verify   the committee data gate (committee_checks.gate)
+  manifest build manifest checks and input fingerprinting
+Pages are streamed, so a page's render and image events nest inside its
+write event; the write event's self time is the I/O.
+
+Each event carries wall time, the bytes the process read and wrote during it
+(from /proc/self/io; null where that is unavailable) and the peak of traced
+Python memory (tracemalloc) while it ran. Tracing allocations slows the build
+down, so absolute times under --profile are higher than without; compare
+traces with each other, not with unprofiled runs.
+
+Traces go to .build_cache/profiles/<generator>-<timestamp>.json by default,
+so runs of different commits can be compared side by side when bisecting a
+regression. Without --profile, stage() and @profiled cost one global lookup.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: no max RSS in the trace
+    resource = None
+
+BASE_DIR = Path(__file__).parent
+PROFILE_DIR = BASE_DIR / ".build_cache" / "profiles"
+
+_active = None  # the running Profiler, if any
+_DONE = object()
+
+
+def _io_counters():
+    """(bytes read, bytes written) by this process so far, or None if unknown (non-Linux)"""
+    try:
+        with open('/proc/self/io', 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    counters = dict(line.split(b': ') for line in data.splitlines())
+    return int(counters[b'rchar']), int(counters[b'wchar']), len(data)
+
+
+class Profiler:
+    """Collects stage events for one generator run"""
+
+    def __init__(self, name):
+        self.name = name
+        self.events = []
+        self.pid = os.getpid()
+        self._peaks = []        # running peak memory of the enclosing stages
+        self._io_overhead = 0   # bytes read from /proc/self/io itself
+        self._start = time.perf_counter_ns()
+        tracemalloc.start()
+
+    def _io(self):
+        counters = _io_counters()
+        if counters is None:
+            return None
+        read, written, own = counters
+        self._io_overhead += own
+        return read - self._io_overhead, written
+
+    @contextmanager
+    def stage(self, name, category, **args):
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+        self._peaks.append(0)
+        tracemalloc.reset_peak()
+        io_before = self._io()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            io_after = self._io()
+            peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self.events.append({
+                'name': name, 'cat': category, 'ph': 'X', 'pid': self.pid, 'tid': threading.get_ident(),
+                'ts': (start - self._start) / 1000, 'dur': (end - start) / 1000,
+                'args': {
+                    **args,
+                    'bytes_read': io_after[0] - io_before[0] if io_before else None,
+                    'bytes_written': io_after[1] - io_before[1] if io_before else None,
+                    'peak_memory': peak,
+                },
+            })
+
+    def trace(self):
+        """The run as a Chrome trace (JSON object format)"""
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'args': {'name': self.name}}]
+        return {
+            'traceEvents': metadata + sorted(self.events, key=lambda e: e['ts']),
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'generator': self.name,
+                'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+            },
+        }
+
+    def summary(self):
+        """{category: (events, total ms, max peak memory)}; nested events are counted in each category"""
+        totals = {}
+        for event in self.events:
+            count, ms, peak = totals.get(event['cat'], (0, 0.0, 0))
+            totals[event['cat']] = (count + 1, ms + event['dur'] / 1000, max(peak, event['args']['peak_memory']))
+        return totals
+
+
+def stage(name, category, **args):
+    """Context manager timing a stage of the running profile (a no-op without --profile)"""
+    if _active is None:
+        return nullcontext()
+    return _active.stage(name, category, **args)
+
+
+def profiled(category):
+    """Decorator: record each call as a stage named after the function (and its first path argument)"""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return fn(*args, **kwargs)
+            path = next((arg for arg in args if isinstance(arg, (str, Path))), None)
+            with _active.stage(fn.__name__, category, **({'file': Path(path).name} if path else {})):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def profile_chunks(chunks, page):
+    """Yield chunks, recording the time spent producing each one as a render stage"""
+    if _active is None:
+        yield from chunks
+        return
+    chunks = iter(chunks)
+    for section in itertools.count():
+        with _active.stage(f"render {page}", "render", section=section):
+            chunk = next(chunks, _DONE)
+        if chunk is _DONE:
+            return
+        yield chunk
+
+
+def add_profile_argument(parser):
+    """Add the shared --profile option to a generator's argument parser"""
+    parser.add_argument(
+        '--profile', nargs='?', const='', default=None, metavar='TRACE',
+        help="record per-stage timing, I/O and memory as a Chrome trace JSON "
+             f"(default: {PROFILE_DIR.relative_to(BASE_DIR)}/<generator>-<time>.json)"
+    )
+
+
+@contextmanager
+def profile_run(trace_path, name):
+    """Profile the enclosed build if trace_path is not None ('' for the default path), then write the trace"""
+    global _active
+    if trace_path is None:
+        yield None
+        return
+    _active = profiler = Profiler(name)
+    try:
+        with profiler.stage(name, "build"):
+            yield profiler
+    finally:
+        _active = None
+        tracemalloc.stop()
+        path = Path(trace_path or PROFILE_DIR / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(profiler.trace()), encoding='utf-8')
+        print(f"\nProfile ({path}):")
+        for category, (count, ms, peak) in profiler.summary().items():
+            print(f"  {category:<8} {count:5} events {ms:9.1f} ms   peak {peak / 1024 / 1024:7.2f} MB")
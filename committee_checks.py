@@ -0,0 +1,149 @@
+"""
+Committee data verification, fast enough to gate every build
+
+All person data is already joined in the people store (people_store.py) and
+every photo is rated in the photo index (photo_index.py). Each check here is
+one SQL query over those two tables (the index is ATTACHed to the store), so
+a full verification is a handful of indexed joins and set differences, not a
+reload and re-join of the JSON files per name. Running the checks costs a few
+milliseconds on top of the freshness checks of the two stores.
+
+Severities:
+  error    the page would be wrong or incomplete: the build stops
+  warning  the page falls back (e.g. initials for a silhouette) or the data
+           is suspicious; fails the gate only with --strict
+  info     listed in the report only
+
+run_checks() returns a JSON-serializable report; gate() runs it before a
+build, writes it to .build_cache/verification.json and exits on failure.
+The generators call gate() unless --no-verify is given.
+scripts/verify_committee_data.py prints the report.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from build_profiler import profiled
+from people_store import open_store
+from photo_index import USABLE_STATUSES, open_index
+
+BASE_DIR = Path(__file__).parent
+REPORT_PATH = BASE_DIR / ".build_cache" / "verification.json"
+
+SEVERITIES = ("error", "warning", "info")
+
+_USABLE = ", ".join(f"'{status}'" for status in USABLE_STATUSES)
+
+# (check, severity, description, query returning (subject, detail) rows)
+CHECKS = [
+    ("committee_no_photo", "error", "Committee member without a photo mapping",
+     "SELECT name, NULL FROM people WHERE committee_rank IS NOT NULL AND photo IS NULL ORDER BY committee_rank"),
+    ("committee_photo_missing", "error", "Committee photo mapped to a file that doesn't exist",
+     "SELECT p.name, p.photo FROM people p LEFT JOIN idx.photos f ON f.filename = p.photo "
+     "WHERE p.committee_rank IS NOT NULL AND p.photo IS NOT NULL AND f.filename IS NULL ORDER BY p.committee_rank"),
+    ("committee_no_affiliation", "error", "Committee member without an affiliation",
+     "SELECT name, NULL FROM people WHERE committee_rank IS NOT NULL AND affiliation IS NULL ORDER BY committee_rank"),
+    ("committee_photo_unusable", "warning", "Committee photo is a silhouette or placeholder (initials are shown)",
+     "SELECT p.name, p.photo || ' (' || f.status || ')' FROM people p JOIN idx.photos f ON f.filename = p.photo "
+     f"WHERE p.committee_rank IS NOT NULL AND f.status NOT IN ({_USABLE}) ORDER BY p.committee_rank"),
+    ("committee_photo_conflict", "warning", "Committee member's face is also saved under another name",
+     "SELECT p.name, p.photo || ' = ' || group_concat(o.filename, ', ') FROM people p "
+     "JOIN idx.photos f ON f.filename = p.photo JOIN idx.photos o ON o.cluster = f.cluster AND o.filename != f.filename "
+     "WHERE p.committee_rank IS NOT NULL AND f.status = 'conflict' GROUP BY p.id ORDER BY p.committee_rank"),
+    ("shared_photo", "warning", "Different people mapped to the same picture",
+     "SELECT group_concat(name, ', '), group_concat(photo, ', ') FROM people WHERE photo_hash IS NOT NULL "
+     "GROUP BY photo_hash HAVING COUNT(*) > 1 ORDER BY MIN(name)"),
+    ("photo_missing", "warning", "Photo mapped to a file that doesn't exist",
+     "SELECT p.name, p.photo FROM people p LEFT JOIN idx.photos f ON f.filename = p.photo "
+     "WHERE p.committee_rank IS NULL AND p.photo IS NOT NULL AND f.filename IS NULL ORDER BY p.name"),
+    ("committee_no_bio", "info", "Committee member without a bio",
+     "SELECT name, NULL FROM people WHERE committee_rank IS NOT NULL AND bio IS NULL ORDER BY committee_rank"),
+    ("unmapped_photo", "info", "Named photo file not mapped to any person",
+     "SELECT f.filename, f.status FROM idx.photos f LEFT JOIN people p ON p.photo = f.filename "
+     "WHERE p.id IS NULL AND f.filename NOT GLOB 'person_[0-9]*' ORDER BY f.filename"),
+]
+
+SUMMARY = {
+    'people': "SELECT COUNT(*) FROM people",
+    'committee': "SELECT COUNT(*) FROM people WHERE committee_rank IS NOT NULL",
+    'committee_with_photos': "SELECT COUNT(*) FROM people p JOIN idx.photos f ON f.filename = p.photo "
+                             f"WHERE p.committee_rank IS NOT NULL AND f.status IN ({_USABLE})",
+    'committee_with_affiliations': "SELECT COUNT(*) FROM people WHERE committee_rank IS NOT NULL "
+                                   "AND affiliation IS NOT NULL",
+    'photo_files': "SELECT COUNT(*) FROM idx.photos",
+}
+
+
+def run_checks(strict=False):
+    """Run every check, return the report
+
+    {'ok', 'strict', 'errors', 'warnings', 'summary', 'checks': [{check,
+    severity, description, count, items: [{subject, detail}]}], 'ms'}
+    'ok' is False if an error (or, with strict, a warning) was found.
+    """
+    start = time.perf_counter()
+    with open_index() as index:
+        index_path = index.path
+    with open_store() as store:
+        db = store.db
+        db.execute("ATTACH DATABASE ? AS idx", (str(index_path),))
+        summary = {key: db.execute(query).fetchone()[0] for key, query in SUMMARY.items()}
+        checks = []
+        for check, severity, description, query in CHECKS:
+            items = [{'subject': subject, 'detail': detail} for subject, detail in db.execute(query)]
+            checks.append({'check': check, 'severity': severity, 'description': description,
+                           'count': len(items), 'items': items})
+
+    counts = {severity: sum(c['count'] for c in checks if c['severity'] == severity) for severity in SEVERITIES}
+    return {
+        'ok': not counts['error'] and not (strict and counts['warning']),
+        'strict': strict,
+        'errors': counts['error'],
+        'warnings': counts['warning'],
+        'summary': summary,
+        'checks': checks,
+        'ms': round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+def save_report(report, path=REPORT_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def print_findings(report, severities=SEVERITIES):
+    """Print the non-empty checks of the given severities"""
+    for check in report['checks']:
+        if check['count'] and check['severity'] in severities:
+            print(f"  [{check['severity'].upper()}] {check['description']} ({check['count']}):")
+            for item in check['items']:
+                detail = f": {item['detail']}" if item['detail'] else ""
+                print(f"      - {item['subject']}{detail}".encode('ascii', 'replace').decode())
+
+
+def add_verify_arguments(parser):
+    """Add the shared --no-verify/--strict options to a generator's argument parser"""
+    parser.add_argument('--no-verify', action='store_true', help="skip the committee data checks before building")
+    parser.add_argument('--strict', action='store_true', help="fail the committee data checks on warnings too")
+
+
+@profiled("verify")
+def gate(args):
+    """Pre-build check: run the checks unless --no-verify, exit with status 1 if they fail"""
+    if args.no_verify:
+        return None
+    report = run_checks(strict=args.strict)
+    save_report(report)
+    print(f"Verified committee data in {report['ms']:.0f} ms: "
+          f"{report['errors']} errors, {report['warnings']} warnings")
+    if not report['ok']:
+        print_findings(report, ("error", "warning") if args.strict else ("error",))
+        print(f"Error: committee data checks failed (report: {REPORT_PATH}); use --no-verify to build anyway")
+        sys.exit(1)
+    return report
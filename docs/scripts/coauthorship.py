@@ -0,0 +1,183 @@
+"""
+Co-authorship between the members of the scientific committee
+
+Committee members are matched to OpenAlex authors by ID, not by name: the
+IDs are kept in docs/data/committee_authors.json ({name: author ID or null}),
+which --resolve fills in for unresolved names from the OpenAlex author
+search. A name is only resolved when a candidate's display name (or one of
+its alternative names) matches it, accents and case aside. Check the
+result, and fix ambiguous names by hand.
+
+Before any search, missing IDs are read from the works already harvested
+(docs/data/openalex_works.jsonl and the committee store): a member whose
+exact name appears in an authorship gets that authorship's ID
+(fetch_publications.infer_author_id). Only Joerg Osterrieder's ID is
+recorded in committee_authors.json so far; --resolve saves the others.
+
+The works of all resolved members are synced into a local store
+(docs/data/committee_works.jsonl, see fetch_publications.py), indexed by
+author ID in one pass, and every pair of members with joint works is
+written to docs/data/committee_coauthorship.json.
+
+Usage: python coauthorship.py [--resolve] [--incremental] [--base-url URL]
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(BASE_DIR))
+from name_index import name_key
+
+from fetch_publications import STORE_NAME as WORKS_STORE_NAME
+from fetch_publications import (
+    AUTHOR_IDS_PATH, DATA_DIR, add_client_arguments, client_from_args, infer_author_id, load_author_ids,
+    load_store, short_id, sync_store,
+)
+
+COMMITTEE_PATH = BASE_DIR / "data" / "scientific_committee.json"
+STORE_NAME = "committee_works.jsonl"
+OUTPUT_NAME = "committee_coauthorship.json"
+
+
+class CoauthorshipIndex:
+    """Works of a set of authors, indexed by OpenAlex author ID and by pair of authors"""
+
+    def __init__(self, author_ids):
+        self.author_ids = frozenset(author_ids)
+        self.works = {}                          # openalex_id -> record
+        self.works_by_author = defaultdict(set)  # author ID -> openalex_ids
+        self.works_by_pair = defaultdict(set)    # (author ID, author ID), sorted -> openalex_ids
+
+    @classmethod
+    def from_records(cls, author_ids, records):
+        index = cls(author_ids)
+        for record in records:
+            index.add(record)
+        return index
+
+    def add(self, record):
+        """Index a work (a store record with author_ids)"""
+        members = sorted(self.author_ids.intersection(record["author_ids"]))
+        if not members:
+            return
+        work_id = record["openalex_id"]
+        self.works[work_id] = record
+        for author_id in members:
+            self.works_by_author[author_id].add(work_id)
+        for pair in combinations(members, 2):
+            self.works_by_pair[pair].add(work_id)
+
+    def _records(self, work_ids):
+        return sorted((self.works[work_id] for work_id in work_ids),
+                      key=lambda r: (-(r["year"] or 0), r["openalex_id"]))
+
+    def works_of(self, author_id):
+        return self._records(self.works_by_author.get(author_id, ()))
+
+    def coauthored(self, author_a, author_b):
+        """Works co-authored by two authors, newest first"""
+        return self._records(self.works_by_pair.get(tuple(sorted((author_a, author_b))), ()))
+
+    def pairs(self):
+        """{(author ID, author ID): joint works} for every pair with joint works, most joint works first"""
+        ranked = sorted(self.works_by_pair.items(), key=lambda item: (-len(item[1]), item[0]))
+        return {pair: self._records(work_ids) for pair, work_ids in ranked}
+
+
+def resolve_author_id(client, name):
+    """OpenAlex author ID whose name matches `name`, the one with most works if several"""
+    results = client.get("authors", search=name, per_page=25,
+                         select="id,display_name,display_name_alternatives,works_count").get("results", [])
+    target = name_key(name)
+    matches = [author for author in results
+               if target in {name_key(n) for n in [author.get("display_name") or ""]
+                             + (author.get("display_name_alternatives") or [])}]
+    if not matches:
+        return None
+    if len(matches) > 1:
+        print(f"  {name}: {len(matches)} matching authors, using the one with most works")
+    return short_id(max(matches, key=lambda author: author.get("works_count") or 0)["id"])
+
+
+def load_committee():
+    with open(COMMITTEE_PATH, encoding='utf-8') as f:
+        return json.load(f)["selected"]
+
+
+def save_json(data, path):
+    Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+
+
+def coauthorship_report(index, names_by_id):
+    """JSON-ready summary of every pair of members with joint works"""
+    return [
+        {
+            "authors": [names_by_id[a], names_by_id[b]],
+            "author_ids": [a, b],
+            "joint_works": len(works),
+            "works": [{"title": w["title"], "year": w["year"], "openalex_id": w["openalex_id"]}
+                      for w in works],
+        }
+        for (a, b), works in index.pairs().items()
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Co-authorship between the scientific committee members")
+    add_client_arguments(parser)
+    parser.add_argument('--resolve', action='store_true',
+                        help=f"look up missing author IDs in OpenAlex and save them to {AUTHOR_IDS_PATH.name}")
+    args = parser.parse_args()
+
+    client = client_from_args(args)
+    committee = load_committee()
+    author_ids = load_author_ids()
+    for name in committee:
+        author_ids.setdefault(name, None)
+
+    # IDs visible in the works already harvested need no search
+    local_records = [record for path in (DATA_DIR / WORKS_STORE_NAME, DATA_DIR / STORE_NAME)
+                     for record in load_store(path).values()]
+    for name in committee:
+        if not author_ids[name]:
+            author_ids[name] = infer_author_id(local_records, name)
+            if author_ids[name]:
+                print(f"  {name}: {author_ids[name]} (from the harvested works)")
+
+    if args.resolve:
+        print("Resolving OpenAlex author IDs...")
+        for name in committee:
+            if not author_ids[name]:
+                author_ids[name] = resolve_author_id(client, name)
+                print(f"  {name}: {author_ids[name] or 'not found'}")
+        save_json(author_ids, AUTHOR_IDS_PATH)
+
+    names_by_id = {author_id: name for name, author_id in author_ids.items()
+                   if author_id and name in committee}
+    unresolved = [name for name in committee if not author_ids[name]]
+    if unresolved:
+        print(f"No OpenAlex author ID for {len(unresolved)} member(s): {', '.join(unresolved)}")
+    if len(names_by_id) < 2:
+        print(f"Need at least two author IDs in {AUTHOR_IDS_PATH} (run with --resolve)")
+        return 1
+
+    store = sync_store(client, DATA_DIR / STORE_NAME, args.incremental, names_by_id)
+    index = CoauthorshipIndex.from_records(names_by_id, store.values())
+    report = coauthorship_report(index, names_by_id)
+    save_json({"authors": names_by_id, "unresolved": unresolved, "pairs": report}, DATA_DIR / OUTPUT_NAME)
+
+    print(f"\n{len(index.works)} works by {len(names_by_id)} members, {len(report)} co-authoring pairs:")
+    for pair in report:
+        print(f"  {pair['joint_works']:4}  {pair['authors'][0]} - {pair['authors'][1]}")
+    print(f"Saved to {DATA_DIR / OUTPUT_NAME}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,74 +1,380 @@
 """
 Fetch joint publications from OpenAlex API
 Authors: Joerg Osterrieder AND Stephen Chan
+
+Works are harvested with OpenAlex cursor pagination, so authors with more
+than one page (200 works) are fetched completely. When a query spans several
+pages (a per_page=1 count probe tells) it is split into one cursor stream
+per publication year, and the streams are fetched concurrently over a pooled
+session. Requests are spaced to stay within --rate requests per second, and
+failed requests (connection errors, 429 and 5xx responses) are retried with
+exponential backoff, honoring Retry-After.
+
+All of the author's works are kept in a local store (docs/data/openalex_works.jsonl,
+one work per line keyed by openalex_id), from which publications.json is
+written. With --incremental only works updated since the last sync are
+requested (from_updated_date filter) and merged into the store, so a nightly
+refresh transfers a few KB instead of the full list.
+
+Joint publications are matched by Stephen Chan's OpenAlex author ID when it
+is known (--coauthor-id, or docs/data/committee_authors.json, see
+coauthorship.py). His ID is not recorded in committee_authors.json yet, so
+it is read from the harvested works where his exact name appears; only if
+that fails are works matched by author name.
+
+--base-url (or OPENALEX_BASE_URL) points the harvester at another server,
+e.g. openalex_stub.py, which replays recorded responses (see
+tests/fixtures/openalex/). Responses go through the shared HTTP cache
+(http_cache.py): unchanged pages are revalidated instead of downloaded
+again, and --offline replays the cached responses.
+
+Usage: python fetch_publications.py [--incremental] [--base-url URL] [--rate N] [--workers N]
 """
 
-import requests
+import argparse
 import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# OpenAlex API endpoints
-OPENALEX_WORKS = "https://api.openalex.org/works"
-OPENALEX_AUTHORS = "https://api.openalex.org/authors"
-
-# Joerg Osterrieder's OpenAlex author ID (136 works)
-OSTERRIEDER_ID = "A5032430973"
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def search_publications():
-    """Search OpenAlex for joint publications"""
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from http_cache import CachedSession, add_offline_argument
+from name_index import name_key
 
-    print("Fetching publications by Joerg Osterrieder...")
+# OpenAlex API (override with --base-url or OPENALEX_BASE_URL)
+OPENALEX_API = "https://api.openalex.org"
 
-    # Search by author ID
-    params = {
-        "filter": f"author.id:{OSTERRIEDER_ID}",
-        "per_page": 200,
-        "sort": "publication_year:desc"
-    }
+# Joerg Osterrieder's OpenAlex author ID (136 works)
+OSTERRIEDER_ID = "A5032430973"
 
-    response = requests.get(OPENALEX_WORKS, params=params)
+PER_PAGE = 200        # OpenAlex maximum
+DEFAULT_RATE = 10     # requests per second (OpenAlex polite limit)
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+MAX_OR_VALUES = 50    # author IDs per OR filter
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+# Local store of all harvested works (JSON Lines keyed by openalex_id), next to publications.json
+STORE_NAME = "openalex_works.jsonl"
+# Store fields not written to publications.json
+STORE_ONLY_FIELDS = ("author_ids", "updated_date")
+# OpenAlex author IDs of the scientific committee (see coauthorship.py)
+AUTHOR_IDS_PATH = DATA_DIR / "committee_authors.json"
+
+# Fields used by extract_publication_data (and the co-author filter)
+WORK_FIELDS = (
+    "id", "title", "publication_year", "doi", "primary_location", "authorships",
+    "concepts", "cited_by_count", "open_access", "updated_date",
+)
+
+
+class RateLimiter:
+    """Spaces out calls to wait() across threads to at most `rate` per second"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class OpenAlexClient:
+    """Pooled, rate-limited and retrying access to the OpenAlex works API"""
+
+    def __init__(self, base_url=None, rate=DEFAULT_RATE, workers=DEFAULT_WORKERS,
+                 retries=DEFAULT_RETRIES, mailto=None, offline=None):
+        self.base_url = (base_url or os.environ.get("OPENALEX_BASE_URL") or OPENALEX_API).rstrip("/")
+        self.workers = workers
+        self.limiter = RateLimiter(rate)
+        self.mailto = mailto or os.environ.get("OPENALEX_MAILTO")
+        self.requests = 0
+        self.bytes_received = 0
+        self.counter_lock = threading.Lock()  # get() runs in the shard threads
+
+        retry = Retry(
+            total=retries, backoff_factor=0.5, status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}), respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry)
+        self.session = CachedSession(offline=offline)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, path, **params):
+        """GET base_url/path and return the decoded JSON body"""
+        if self.mailto:
+            params["mailto"] = self.mailto  # OpenAlex polite pool
+        self.limiter.wait()
+        with self.counter_lock:
+            self.requests += 1
+        response = self.session.get(f"{self.base_url}/{path}", params=params, timeout=30)
+        if not response.from_cache:
+            with self.counter_lock:
+                self.bytes_received += len(response.content)
+        response.raise_for_status()
+        return response.json()
+
+    def iter_pages(self, filter, cursor="*"):
+        """Yield (meta, results) for each page of a filter, following next_cursor"""
+        while cursor:
+            data = self.get("works", filter=filter, per_page=PER_PAGE, cursor=cursor,
+                            select=",".join(WORK_FIELDS))
+            meta = data.get("meta", {})
+            yield meta, data.get("results", [])
+            cursor = meta.get("next_cursor")
+
+    def count(self, filter):
+        """Number of works matching filter (a one-result probe)"""
+        return self.get("works", filter=filter, per_page=1, select="id").get("meta", {}).get("count", 0)
+
+    def year_shards(self, filter, total):
+        """Split filter into one filter per publication year, or None if the years don't cover all works"""
+        groups = self.get("works", filter=filter, group_by="publication_year").get("group_by", [])
+        years = [group["key"] for group in groups if str(group.get("key", "")).isdigit()]
+        if sum(group["count"] for group in groups if group["key"] in years) != total:
+            return None
+        return [f"{filter},publication_year:{year}" for year in years]
+
+    def harvest(self, filter):
+        """All works matching filter, without duplicates
+
+        A count probe decides the plan before any page is fetched: one cursor
+        stream if the works fit on one page (or can't be split by year),
+        otherwise one concurrent stream per publication year.
+        """
+        total = self.count(filter)
+        shards = self.year_shards(filter, total) if total > PER_PAGE else None
+        works = []
+        if shards is None:
+            works = self._harvest_stream(filter)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for shard_works in pool.map(self._harvest_stream, shards):
+                    works += shard_works
+
+        unique = {}
+        for work in works:
+            unique.setdefault(work.get("id"), work)
+        works = list(unique.values())
+        if len(works) < total:
+            print(f"Warning: OpenAlex reported {total} works, harvested {len(works)}")
+        return works
+
+    def _harvest_stream(self, filter):
+        return [work for _, results in self.iter_pages(filter) for work in results]
+
+
+def short_id(openalex_id):
+    """'https://openalex.org/A5032430973' -> 'A5032430973'"""
+    return (openalex_id or "").rsplit("/", 1)[-1]
+
+
+def load_author_ids(path=None):
+    """{name: OpenAlex author ID or None} from docs/data/committee_authors.json"""
+    path = Path(path or AUTHOR_IDS_PATH)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def infer_author_id(records, name):
+    """OpenAlex author ID of `name` in store records (with author_ids), or None
+
+    The ID is read from the authorships of works where the name itself
+    appears (accents, case and titles aside), so a different author with a
+    similar name (another "S. Chan") is not taken for the person. None if
+    the name never appears or appears with more than one ID.
+    """
+    target = name_key(name)
+    ids = Counter(
+        author_id
+        for record in records
+        for author, author_id in zip(record['authors'], record['author_ids'])
+        if author_id and name_key(author) == target
+    )
+    return next(iter(ids)) if len(ids) == 1 else None
+
+
+def is_joint(author_names):
+    """True if Stephen Chan is among the authors (name test, used when his author ID is unknown)"""
+    return any(
+        "chan" in name.lower() and ("stephen" in name.lower() or "s." in name.lower())
+        for name in author_names
+    )
+
+
+def select_joint_publications(records, coauthor_id=None):
+    """Publications (extract_publication_data records) co-authored with Stephen Chan
+
+    With coauthor_id (his OpenAlex author ID) works are matched by author ID.
+    Without it, his ID is inferred from the records (infer_author_id); only
+    if that fails are works matched by the author name test of is_joint().
+    """
+    records = list(records)
+    joint_publications = []
+    seen_titles = set()  # To avoid duplicates
 
-    if response.status_code != 200:
-        print(f"Error: {response.status_code}")
-        print(f"Response: {response.text[:500]}")
-        return []
+    print("\nFiltering for joint publications with Stephen Chan...")
+    if not coauthor_id:
+        coauthor_id = infer_author_id(records, "Stephen Chan")
+        if coauthor_id:
+            print(f"  (author ID {coauthor_id} of Stephen Chan taken from the works; "
+                  f"add it to {AUTHOR_IDS_PATH.name})")
+        else:
+            print(f"  (matching by name: no author ID for Stephen Chan in {AUTHOR_IDS_PATH.name})")
+
+    for record in sorted(records, key=lambda r: (-(r['year'] or 0), r['openalex_id'])):
+        if coauthor_id:
+            if coauthor_id not in record['author_ids']:
+                continue
+        elif not is_joint(record['authors']):
+            continue
+        # Skip duplicates (same title)
+        title_key = record['title'].lower().replace(" ", "")[:50]
+        if title_key in seen_titles:
+            continue
+        seen_titles.add(title_key)
+
+        pub = {key: value for key, value in record.items() if key not in STORE_ONLY_FIELDS}
+        joint_publications.append(pub)
+        print(f"  [{pub['year']}] {pub['title'][:60]}...")
 
-    data = response.json()
-    all_works = data.get("results", [])
+    print(f"\nTotal joint publications: {len(joint_publications)}")
 
-    print(f"Found {len(all_works)} total works")
+    return joint_publications
 
-    # Filter for works that also have Stephen Chan as co-author
-    joint_publications = []
-    seen_titles = set()  # To avoid duplicates
 
-    print("\nFiltering for joint publications with Stephen Chan...")
+def fetch_works(client, since=None, author_ids=(OSTERRIEDER_ID,)):
+    """Records of the works of any of author_ids, only those updated on or after `since` if given"""
+    works = {}
+    author_ids = sorted(author_ids)
+    for i in range(0, len(author_ids), MAX_OR_VALUES):
+        filter = f"author.id:{'|'.join(author_ids[i:i + MAX_OR_VALUES])}"
+        if since:
+            filter += f",from_updated_date:{since}"
+        for work in client.harvest(filter):
+            works[work.get("id")] = work
+    return [extract_store_record(work) for work in works.values()]
 
-    for work in all_works:
-        authors = work.get("authorships", [])
-        author_names = [a.get("author", {}).get("display_name", "") for a in authors]
 
-        # Check if Stephen Chan is a co-author
-        has_chan = any(
-            "chan" in name.lower() and ("stephen" in name.lower() or "s." in name.lower())
-            for name in author_names
-        )
+def search_publications(client=None):
+    """Search OpenAlex for joint publications"""
 
-        if has_chan:
-            title = work.get("title", "")
-            # Skip duplicates (same title)
-            title_key = title.lower().replace(" ", "")[:50]
-            if title_key in seen_titles:
-                continue
-            seen_titles.add(title_key)
+    client = client or OpenAlexClient()
+    print("Fetching publications by Joerg Osterrieder...")
 
-            pub = extract_publication_data(work)
-            joint_publications.append(pub)
-            print(f"  [{pub['year']}] {pub['title'][:60]}...")
+    try:
+        records = fetch_works(client)
+    except requests.RequestException as e:
+        print(f"Error: {e}")
+        return []
 
-    print(f"\nTotal joint publications: {len(joint_publications)}")
+    print(f"Found {len(records)} total works ({client.requests} requests)")
+    return select_joint_publications(records, load_author_ids().get("Stephen Chan"))
+
+
+def load_store(store_path):
+    """Works in the local store, {openalex_id: record}"""
+    store = {}
+    if Path(store_path).exists():
+        with open(store_path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    store[record['openalex_id']] = record
+    return store
+
+
+def save_store(store, store_path):
+    """Write the store as JSON Lines (one work per line, sorted by id), atomically"""
+    store_path = Path(store_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = store_path.with_name(f"{store_path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for openalex_id in sorted(store):
+            f.write(json.dumps(store[openalex_id], ensure_ascii=False, sort_keys=True) + "\n")
+    os.replace(tmp, store_path)
+
+
+def sync_state_path(store_path):
+    return Path(store_path).with_suffix(".sync.json")
+
+
+def sync_store(client, store_path, incremental=True, author_ids=(OSTERRIEDER_ID,)):
+    """Update a local store with the works of author_ids from OpenAlex and return it
+
+    An incremental sync asks only for works updated since the previous sync
+    (OpenAlex from_updated_date filter) and merges them into the store by
+    openalex_id. Without a previous sync, or with incremental=False, all
+    works are fetched and replace the store. The store is returned unchanged
+    if OpenAlex can't be reached.
+    """
+    state_file = sync_state_path(store_path)
+    state = json.loads(state_file.read_text(encoding='utf-8')) if state_file.exists() else {}
+    store = load_store(store_path)
+    author_ids = sorted(author_ids)
+    # Works of authors added since the last sync would be missed by an incremental sync
+    since = state.get("last_sync") if incremental and store and state.get("author_ids") == author_ids else None
+    # Dates are inclusive: works updated later on the day of this sync are fetched again next time
+    today = time.strftime("%Y-%m-%d", time.gmtime())
+
+    try:
+        if since:
+            print(f"Fetching works updated since {since}...")
+            try:
+                records = fetch_works(client, since, author_ids)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code >= 500:
+                    raise
+                # from_updated_date is limited to some API plans: fall back to a full fetch
+                print(f"  Incremental filter rejected ({e.response.status_code}), fetching all works")
+                since = None
+        if not since:
+            print(f"Fetching all works of {len(author_ids)} author(s)...")
+            records = fetch_works(client, author_ids=author_ids)
+    except requests.RequestException as e:
+        print(f"Error: {e} (store left unchanged)")
+        return store
+
+    added = [r for r in records if r['openalex_id'] not in store]
+    changed = [r for r in records if r['openalex_id'] in store and r != store[r['openalex_id']]]
+    cited = [r for r in changed if r['citations'] != store[r['openalex_id']]['citations']]
+    if not since:
+        store = {}
+    store.update((record['openalex_id'], record) for record in records)
+    save_store(store, store_path)
+    state_file.write_text(json.dumps({"last_sync": today, "author_ids": author_ids}, indent=2) + "\n",
+                          encoding='utf-8')
+
+    print(f"Received {len(records)} works ({client.requests} requests, {client.bytes_received / 1024:.1f} KB): "
+          f"{len(added)} new, {len(changed)} changed ({len(cited)} citation counts)")
+    print(client.session.summary())
+    print(f"Store: {len(store)} works in {store_path}")
+    return store
+
+
+def sync_publications(client, store_path, incremental=True, coauthor_id=None):
+    """Sync Joerg Osterrieder's works into the store and return the joint publications"""
+    store = sync_store(client, store_path, incremental)
+    return select_joint_publications(store.values(), coauthor_id)
 
-    return joint_publications
 
 def extract_publication_data(work):
     """Extract relevant fields from OpenAlex work object"""
@@ -105,6 +411,14 @@ def extract_publication_data(work):
         "openalex_id": work.get("id", "")
     }
 
+def extract_store_record(work):
+    """extract_publication_data record plus the fields only kept in the store"""
+    record = extract_publication_data(work)
+    record["author_ids"] = [short_id(a.get("author", {}).get("id")) for a in work.get("authorships", [])]
+    record["updated_date"] = work.get("updated_date")
+    return record
+
+
 def save_publications(publications, output_path):
     """Save publications to JSON file"""
 
@@ -134,13 +448,42 @@ def generate_markdown_table(publications):
 
     return "\n".join(lines)
 
+def add_client_arguments(parser):
+    """Add the OpenAlex client and sync options shared by the publication scripts"""
+    parser.add_argument('--base-url', help=f"OpenAlex API base URL (default: $OPENALEX_BASE_URL or {OPENALEX_API})")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f"maximum requests per second (default: {DEFAULT_RATE})")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"concurrent page streams and pooled connections (default: {DEFAULT_WORKERS})")
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help=f"retries per request, with exponential backoff (default: {DEFAULT_RETRIES})")
+    parser.add_argument('--mailto', help="contact email for the OpenAlex polite pool (default: $OPENALEX_MAILTO)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only fetch works updated since the last sync and merge them into the store")
+    add_offline_argument(parser)
+
+
+def client_from_args(args):
+    return OpenAlexClient(args.base_url, rate=args.rate, workers=args.workers,
+                          retries=args.retries, mailto=args.mailto, offline=args.offline)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Fetch joint publications from OpenAlex")
+    add_client_arguments(parser)
+    parser.add_argument('--store', type=Path, help=f"local work store (default: docs/data/{STORE_NAME})")
+    parser.add_argument('--coauthor-id', help="Stephen Chan's OpenAlex author ID "
+                                              f"(default: from docs/data/{AUTHOR_IDS_PATH.name})")
+    args = parser.parse_args()
+
     # Output paths
-    script_dir = Path(__file__).parent
-    data_dir = script_dir.parent / "data"
+    data_dir = DATA_DIR
 
     # Fetch publications
-    publications = search_publications()
+    client = client_from_args(args)
+    coauthor_id = args.coauthor_id or load_author_ids().get("Stephen Chan")
+    publications = sync_publications(client, args.store or data_dir / STORE_NAME,
+                                     incremental=args.incremental, coauthor_id=coauthor_id)
 
     # Save to JSON
     json_path = data_dir / "publications.json"
@@ -0,0 +1,152 @@
+"""
+Local stand-in for the OpenAlex API, replaying recorded responses
+
+Each fixture file (*.json) in the fixture directory holds one recorded
+exchange:
+  {"path": "works", "match": {query parameters},
+   "responses": [{"status": 200, "headers": {...}, "body": {...}}, ...]}
+A request is answered by the fixture with the same path whose "match"
+parameters all equal the request's (the most specific fixture if several
+do; "mailto" is ignored). Its responses are replayed in order and the last
+one repeats, so a fixture can start with 429/503 replies to exercise the
+client's retries. Unmatched requests get a 404 naming the request.
+
+With --record URL, unmatched requests are forwarded to URL (e.g.
+https://api.openalex.org) and each reply is saved as a new fixture.
+
+Usage: python openalex_stub.py FIXTURE_DIR [--port N] [--record URL]
+       python fetch_publications.py --base-url http://127.0.0.1:N
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+IGNORED_PARAMS = ("mailto",)
+
+
+class Fixture:
+    """A recorded exchange, replaying its responses in order"""
+
+    def __init__(self, path, data):
+        self.path = path
+        self.url_path = data["path"].strip("/")
+        self.match = {key: str(value) for key, value in data.get("match", {}).items()}
+        self.responses = data["responses"]
+        self.served = 0
+
+    def matches(self, url_path, params):
+        return url_path == self.url_path and all(params.get(k) == v for k, v in self.match.items())
+
+    def next_response(self):
+        response = self.responses[min(self.served, len(self.responses) - 1)]
+        self.served += 1
+        return response
+
+
+class ReplayServer:
+    """OpenAlex stub on 127.0.0.1 serving the fixtures of a directory
+
+    Use as a context manager (serves in a background thread); base_url is the
+    value for --base-url, and requests lists every (path, params) received.
+    """
+
+    def __init__(self, fixture_dir, port=0, record_url=None):
+        self.fixture_dir = Path(fixture_dir)
+        self.record_url = record_url.rstrip("/") if record_url else None
+        self.fixtures = [Fixture(path, json.loads(path.read_text(encoding="utf-8")))
+                         for path in sorted(self.fixture_dir.glob("*.json"))]
+        self.requests = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                params = {k: v for k, v in parse_qsl(url.query) if k not in IGNORED_PARAMS}
+                status, headers, body = stub.respond(url.path.strip("/"), params)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                for name, value in {"Content-Type": "application/json", **headers}.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+    def respond(self, url_path, params):
+        """(status, headers, JSON body) for a request"""
+        with self.lock:
+            self.requests.append((url_path, params))
+            candidates = [f for f in self.fixtures if f.matches(url_path, params)]
+            if candidates:
+                response = max(candidates, key=lambda f: len(f.match)).next_response()
+                return response.get("status", 200), response.get("headers", {}), response.get("body")
+        if self.record_url:
+            return self.record(url_path, params)
+        return 404, {}, {"error": "no recorded response", "path": url_path, "params": params}
+
+    def record(self, url_path, params):
+        """Forward a request upstream and save the reply as a fixture"""
+        response = requests.get(f"{self.record_url}/{url_path}", params=params, timeout=30)
+        body = response.json()
+        headers = {name: response.headers[name] for name in ("Retry-After",) if name in response.headers}
+        data = {"path": url_path, "match": params,
+                "responses": [{"status": response.status_code, "headers": headers, "body": body}]}
+        key = hashlib.sha256(json.dumps([url_path, sorted(params.items())]).encode("utf-8")).hexdigest()[:16]
+        path = self.fixture_dir / f"recorded-{key}.json"
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+        with self.lock:
+            self.fixtures.append(Fixture(path, data))
+        return response.status_code, headers, body
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded OpenAlex responses on a local port")
+    parser.add_argument('fixture_dir', type=Path, help="directory of recorded exchanges (*.json)")
+    parser.add_argument('--port', type=int, default=8080, help="port to listen on (default: 8080)")
+    parser.add_argument('--record', metavar='URL',
+                        help="forward unmatched requests to URL and save the replies as fixtures")
+    args = parser.parse_args()
+
+    stub = ReplayServer(args.fixture_dir, args.port, args.record)
+    print(f"Replaying {len(stub.fixtures)} fixtures from {args.fixture_dir} at {stub.base_url}"
+          + (f", recording from {args.record}" if args.record else ""))
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,20 +7,38 @@ Outputs:
 - budget_internal.html (internal only - budget details)
 """
 
-import base64
+import argparse
 import json
 from pathlib import Path
 
+from asset_pipeline import add_asset_mode_argument, add_lazy_images_argument, image_src, lazy_attrs, photo_html
+from build_manifest import BuildManifest, add_force_argument, build_params, module_sources
+from build_profiler import add_profile_argument, profile_run, profiled
+from committee_checks import add_verify_arguments, gate
+from html_writer import render, write_html
+from people_store import open_store, store_inputs
+from photo_index import USABLE_STATUSES
+from stylesheet import add_css_mode_argument, page_class, style_tags, stylesheet_inputs
+from template_engine import render_template, template_inputs
+
 # Paths
 BASE_DIR = Path(__file__).parent
 DOCS_DIR = BASE_DIR / "docs"
 IMAGES_DIR = DOCS_DIR / "images"
 DATA_DIR = DOCS_DIR / "data"
-PEOPLE_DATA_DIR = BASE_DIR / "data"
 PEOPLE_ASSETS_DIR = BASE_DIR / "assets" / "people"
 OUTPUT_PUBLIC = BASE_DIR / "ai_digital_finance.html"
 OUTPUT_BUDGET = BASE_DIR / "budget_internal.html"
 
+# Committee photos are displayed at 80x80 CSS pixels
+COMMITTEE_PHOTO_SIZE = 80
+
+# Code every page depends on, including the local modules it imports (tracked by the incremental build manifest)
+GENERATOR_SOURCES = [Path(__file__)] + module_sources(
+    "asset_pipeline", "build_manifest", "html_minifier", "html_writer", "name_index", "people_store",
+    "photo_index", "template_engine",
+) + stylesheet_inputs()
+
 # Official Budget Data (from Excel - CHF 18,000 total)
 BUDGET_DATA = {
     "total": 18000,
@@ -40,6 +58,7 @@ BUDGET_DATA = {
 }
 
 # Publications data
+@profiled("load")
 def load_publications():
     pub_file = DATA_DIR / "publications.json"
     if pub_file.exists():
@@ -48,52 +67,19 @@ def load_publications():
     return []
 
 # Load Scientific Committee
+@profiled("load")
 def load_scientific_committee():
-    committee_file = PEOPLE_DATA_DIR / "scientific_committee.json"
-    if committee_file.exists():
-        with open(committee_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('selected', [])
-    return []
-
-# Load photo mappings
-def load_photo_mappings():
-    """Load name-to-photo mappings from named scrape"""
-    photo_file = PEOPLE_DATA_DIR / "msca_people_named.json"
-    if photo_file.exists():
-        with open(photo_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Create name -> filename mapping (lowercase for matching)
-            mapping = {}
-            for person in data.get('people', []):
-                name_lower = person['name'].lower()
-                mapping[name_lower] = person['filename']
-            return mapping
-    return {}
-
-# Load photo as base64
-def load_photo_base64(filename):
-    """Load a photo file and return base64 encoded string"""
-    photo_path = PEOPLE_ASSETS_DIR / filename
-    if photo_path.exists():
-        with open(photo_path, 'rb') as f:
-            ext = photo_path.suffix.lower()
-            mime = 'image/jpeg'
-            if ext == '.png':
-                mime = 'image/png'
-            return f"data:{mime};base64,{base64.b64encode(f.read()).decode('utf-8')}"
+    """Committee members (name, photo, affiliation, ...) from the people store, in page order"""
+    with open_store() as store:
+        return store.committee()
+
+# Load photo as right-sized <img>/<picture> markup
+def load_photo_html(member, asset_mode="inline", lazy=False):
+    """Load a committee photo and return its markup (None if missing or not a real portrait)"""
+    if member['photo'] and member['photo_status'] in USABLE_STATUSES:
+        return photo_html(PEOPLE_ASSETS_DIR / member['photo'], member['name'], COMMITTEE_PHOTO_SIZE, asset_mode, lazy)
     return None
 
-# Load affiliations
-def load_affiliations():
-    """Load affiliations from MSCA bios file"""
-    bios_file = PEOPLE_DATA_DIR / "msca_bios.json"
-    if bios_file.exists():
-        with open(bios_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('affiliations', {})
-    return {}
-
 # Important dates for the conference
 IMPORTANT_DATES = [
     {"label": "Submission Deadline", "date": "February 15, 2026"},
@@ -102,13 +88,13 @@ IMPORTANT_DATES = [
     {"label": "Workshop", "date": "April 21-23, 2026"}
 ]
 
-# Load and encode network map
-def load_network_map_base64():
-    img_path = IMAGES_DIR / "network_map.png"
-    if img_path.exists():
-        with open(img_path, 'rb') as f:
-            return base64.b64encode(f.read()).decode('utf-8')
-    return ""
+# Load network map as base64 data URI or hashed asset URL
+def load_network_map_src(asset_mode="inline"):
+    return image_src(IMAGES_DIR / "network_map.png", asset_mode) or ""
+
+def network_map_attrs(lazy=False):
+    """Extra <img> attributes for the network map (dimensions and lazy loading)"""
+    return f' {lazy_attrs(IMAGES_DIR / "network_map.png")}' if lazy else ''
 
 # Workshop topics
 WORKSHOP_TOPICS = [
@@ -154,897 +140,81 @@ VENUE_INFO = {
     ]
 }
 
-# Common CSS styles
-def get_common_styles():
-    return '''
-        :root {
-            --swiss-blue: #2E5090;
-            --uae-burgundy: #8B1538;
-            --gold: #D4AF37;
-            --dark-gray: #333333;
-            --light-gray: #f8f9fa;
-            --border-gray: #e0e0e0;
-        }
-
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.6;
-            color: var(--dark-gray);
-            background: #ffffff;
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 20px;
-        }
-
-        /* Navigation */
-        nav {
-            background: var(--swiss-blue);
-            padding: 15px 0;
-            position: sticky;
-            top: 0;
-            z-index: 1000;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-
-        nav .container {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-
-        nav .logo {
-            color: white;
-            font-weight: 700;
-            font-size: 1.1rem;
-        }
-
-        nav ul {
-            display: flex;
-            list-style: none;
-            gap: 25px;
-        }
-
-        nav a {
-            color: white;
-            text-decoration: none;
-            font-size: 0.9rem;
-            opacity: 0.9;
-            transition: opacity 0.2s;
-        }
-
-        nav a:hover {
-            opacity: 1;
-        }
-
-        /* Hero Section */
-        .hero {
-            background: linear-gradient(135deg, var(--swiss-blue) 0%, #1a3a6e 100%);
-            color: white;
-            padding: 80px 0;
-            text-align: center;
-        }
-
-        .hero h1 {
-            font-size: 2.5rem;
-            margin-bottom: 15px;
-            font-weight: 700;
-        }
-
-        .hero .subtitle {
-            font-size: 1.3rem;
-            opacity: 0.9;
-            margin-bottom: 30px;
-        }
-
-        .hero-details {
-            display: flex;
-            justify-content: center;
-            gap: 40px;
-            flex-wrap: wrap;
-            margin-top: 30px;
-        }
-
-        .hero-detail {
-            text-align: center;
-        }
-
-        .hero-detail .label {
-            font-size: 0.85rem;
-            opacity: 0.8;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-
-        .hero-detail .value {
-            font-size: 1.1rem;
-            font-weight: 600;
-            margin-top: 5px;
-        }
-
-        /* Sections */
-        section {
-            padding: 60px 0;
-        }
-
-        section:nth-child(even) {
-            background: var(--light-gray);
-        }
-
-        h2 {
-            font-size: 1.8rem;
-            color: var(--swiss-blue);
-            margin-bottom: 30px;
-            padding-bottom: 10px;
-            border-bottom: 3px solid var(--gold);
-            display: inline-block;
-        }
-
-        h3 {
-            font-size: 1.3rem;
-            color: var(--dark-gray);
-            margin: 25px 0 15px;
-        }
-
-        p {
-            margin-bottom: 15px;
-        }
-
-        /* Stats Grid */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 25px;
-            margin: 40px 0;
-        }
-
-        .stat-card {
-            background: white;
-            padding: 25px;
-            border-radius: 8px;
-            text-align: center;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-            border-left: 4px solid var(--swiss-blue);
-        }
-
-        .stat-card .number {
-            font-size: 2rem;
-            font-weight: 700;
-            color: var(--swiss-blue);
-        }
-
-        .stat-card .label {
-            font-size: 0.9rem;
-            color: #666;
-            margin-top: 5px;
-        }
-
-        /* Aims List */
-        .aims-list {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }
-
-        .aim-item {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-        }
-
-        .aim-item h4 {
-            color: var(--swiss-blue);
-            margin-bottom: 10px;
-            font-size: 1.1rem;
-        }
-
-        .aim-item p {
-            font-size: 0.95rem;
-            color: #555;
-            margin: 0;
-        }
-
-        /* Schedule */
-        .schedule-day {
-            background: white;
-            border-radius: 8px;
-            margin-bottom: 30px;
-            overflow: hidden;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }
-
-        .day-header {
-            background: var(--swiss-blue);
-            color: white;
-            padding: 15px 20px;
-        }
-
-        .day-header h3 {
-            color: white;
-            margin: 0;
-            font-size: 1.2rem;
-        }
-
-        .day-header .date {
-            opacity: 0.9;
-            font-size: 0.9rem;
-        }
-
-        .session {
-            padding: 15px 20px;
-            border-bottom: 1px solid var(--border-gray);
-            display: flex;
-            gap: 20px;
-        }
-
-        .session:last-child {
-            border-bottom: none;
-        }
-
-        .session-time {
-            min-width: 100px;
-            font-weight: 600;
-            color: var(--swiss-blue);
-            font-size: 0.9rem;
-        }
-
-        .session-content {
-            flex: 1;
-        }
-
-        .session-title {
-            font-weight: 600;
-            margin-bottom: 5px;
-        }
-
-        .session-speaker {
-            font-size: 0.9rem;
-            color: #666;
-        }
-
-        .session-type {
-            display: inline-block;
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 0.75rem;
-            margin-left: 10px;
-        }
-
-        .session-type.keynote {
-            background: var(--gold);
-            color: white;
-        }
-
-        .session-type.panel {
-            background: var(--uae-burgundy);
-            color: white;
-        }
-
-        .session-type.workshop {
-            background: var(--swiss-blue);
-            color: white;
-        }
-
-        .session-type.break {
-            background: #e0e0e0;
-            color: #666;
-        }
-
-        /* Organizers */
-        .organizers-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
-            gap: 30px;
-        }
-
-        .organizer-card {
-            background: white;
-            border-radius: 8px;
-            padding: 30px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }
-
-        .organizer-card h3 {
-            color: var(--swiss-blue);
-            margin-top: 0;
-        }
-
-        .organizer-card .affiliation {
-            color: #666;
-            font-size: 0.95rem;
-            margin-bottom: 15px;
-        }
-
-        .organizer-card .bio {
-            font-size: 0.95rem;
-            margin-bottom: 15px;
-        }
-
-        .organizer-card .highlights {
-            list-style: none;
-            padding: 0;
-        }
-
-        .organizer-card .highlights li {
-            padding: 5px 0;
-            font-size: 0.9rem;
-            padding-left: 20px;
-            position: relative;
-        }
-
-        .organizer-card .highlights li::before {
-            content: "-";
-            position: absolute;
-            left: 0;
-            color: var(--swiss-blue);
-            font-weight: bold;
-        }
-
-        /* Network Map */
-        .network-map {
-            text-align: center;
-            margin: 30px 0;
-        }
-
-        .network-map img {
-            max-width: 100%;
-            height: auto;
-            border-radius: 8px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        }
-
-        /* Publications Table */
-        .publications-table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-            font-size: 0.9rem;
-        }
-
-        .publications-table th {
-            background: var(--swiss-blue);
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: 600;
-        }
-
-        .publications-table td {
-            padding: 12px;
-            border-bottom: 1px solid var(--border-gray);
-        }
-
-        .publications-table tr:hover {
-            background: var(--light-gray);
-        }
-
-        .publications-table a {
-            color: var(--swiss-blue);
-            text-decoration: none;
-        }
-
-        .publications-table a:hover {
-            text-decoration: underline;
-        }
-
-        /* Budget Section */
-        .budget-grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 30px;
-            margin: 30px 0;
-        }
-
-        .chart-container {
-            background: white;
-            padding: 25px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }
-
-        .chart-container h4 {
-            text-align: center;
-            margin-bottom: 20px;
-            color: var(--dark-gray);
-        }
-
-        .budget-table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 30px;
-            font-size: 0.9rem;
-        }
-
-        .budget-table th {
-            background: var(--swiss-blue);
-            color: white;
-            padding: 12px;
-            text-align: left;
-        }
-
-        .budget-table td {
-            padding: 12px;
-            border-bottom: 1px solid var(--border-gray);
-        }
-
-        .budget-table tr.subtotal {
-            background: var(--light-gray);
-            font-weight: 600;
-        }
-
-        .budget-table tr.total {
-            background: var(--swiss-blue);
-            color: white;
-            font-weight: 700;
-        }
-
-        .budget-table .amount {
-            text-align: right;
-            font-family: 'Courier New', monospace;
-        }
-
-        /* Timeline/Gantt */
-        .timeline {
-            position: relative;
-            margin: 40px 0;
-        }
-
-        .timeline-phase {
-            margin-bottom: 40px;
-        }
-
-        .phase-header {
-            background: var(--swiss-blue);
-            color: white;
-            padding: 12px 20px;
-            border-radius: 8px 8px 0 0;
-            font-weight: 600;
-        }
-
-        .phase-content {
-            background: white;
-            border: 1px solid var(--border-gray);
-            border-top: none;
-            border-radius: 0 0 8px 8px;
-            padding: 20px;
-        }
-
-        .milestone {
-            display: flex;
-            align-items: flex-start;
-            padding: 10px 0;
-            border-bottom: 1px dashed var(--border-gray);
-        }
-
-        .milestone:last-child {
-            border-bottom: none;
-        }
-
-        .milestone-date {
-            min-width: 120px;
-            font-weight: 600;
-            color: var(--swiss-blue);
-            font-size: 0.9rem;
-        }
-
-        .milestone-content {
-            flex: 1;
-        }
-
-        .milestone-title {
-            font-weight: 600;
-        }
-
-        .milestone-desc {
-            font-size: 0.9rem;
-            color: #666;
-            margin-top: 3px;
-        }
-
-        /* Footer */
-        footer {
-            background: var(--dark-gray);
-            color: white;
-            padding: 40px 0;
-            text-align: center;
-        }
-
-        footer a {
-            color: var(--gold);
-            text-decoration: none;
-        }
-
-        footer a:hover {
-            text-decoration: underline;
-        }
-
-        .footer-contacts {
-            display: flex;
-            justify-content: center;
-            gap: 60px;
-            margin-top: 20px;
-        }
-
-        .footer-contact {
-            text-align: center;
-        }
-
-        .footer-contact .name {
-            font-weight: 600;
-            margin-bottom: 5px;
-        }
-
-        /* Internal warning banner */
-        .internal-banner {
-            background: #dc3545;
-            color: white;
-            padding: 10px;
-            text-align: center;
-            font-weight: 600;
-        }
-
-        /* Topics Grid */
-        .topics-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(320px, 1fr));
-            gap: 25px;
-            margin-top: 30px;
-        }
-
-        .topic-card {
-            background: white;
-            border-radius: 8px;
-            padding: 25px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-            border-top: 4px solid var(--gold);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-
-        .topic-card:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        }
-
-        .topic-card h4 {
-            color: var(--swiss-blue);
-            margin-bottom: 12px;
-            font-size: 1.1rem;
-        }
-
-        .topic-card p {
-            font-size: 0.95rem;
-            color: #555;
-            margin: 0;
-            line-height: 1.5;
-        }
-
-        /* Scientific Committee Grid */
-        .committee-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(180px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }
-
-        .committee-member {
-            text-align: center;
-            padding: 15px;
-        }
-
-        .committee-member .name {
-            font-weight: 600;
-            color: var(--dark-gray);
-            font-size: 0.95rem;
-        }
-
-        .committee-member .affiliation {
-            font-size: 0.8rem;
-            color: #666;
-            margin-top: 5px;
-        }
-
-        /* Venue Section */
-        .venue-container {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 40px;
-            margin-top: 30px;
-        }
-
-        .venue-info {
-            background: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }
-
-        .venue-info h3 {
-            color: var(--swiss-blue);
-            margin-top: 0;
-            margin-bottom: 5px;
-        }
-
-        .venue-info .location {
-            color: #666;
-            font-size: 0.95rem;
-            margin-bottom: 20px;
-        }
-
-        .venue-features {
-            list-style: none;
-            padding: 0;
-            margin-top: 20px;
-        }
-
-        .venue-features li {
-            padding: 8px 0;
-            font-size: 0.95rem;
-            padding-left: 25px;
-            position: relative;
-        }
-
-        .venue-features li::before {
-            content: "*";
-            position: absolute;
-            left: 0;
-            color: var(--gold);
-            font-weight: bold;
-        }
-
-        .venue-map {
-            background: white;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }
-
-        .venue-map iframe {
-            width: 100%;
-            height: 100%;
-            min-height: 350px;
-            border: none;
-        }
-
-        /* Keynote Speakers */
-        .keynotes-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 25px;
-            margin-top: 30px;
-        }
-
-        .keynote-card {
-            background: white;
-            border-radius: 8px;
-            padding: 25px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-            text-align: center;
-            border-bottom: 4px solid var(--swiss-blue);
-        }
-
-        .keynote-card .placeholder-img {
-            width: 100px;
-            height: 100px;
-            background: linear-gradient(135deg, var(--swiss-blue) 0%, #1a3a6e 100%);
-            border-radius: 50%;
-            margin: 0 auto 15px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 2rem;
-            font-weight: 700;
-        }
-
-        .keynote-card h4 {
-            color: var(--dark-gray);
-            margin-bottom: 5px;
-        }
-
-        .keynote-card .role {
-            color: var(--swiss-blue);
-            font-size: 0.9rem;
-            margin-bottom: 10px;
-        }
-
-        .keynote-card .talk-title {
-            font-style: italic;
-            color: #666;
-            font-size: 0.9rem;
-        }
-
-        /* Important Dates */
-        .dates-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }
-
-        .date-card {
-            background: white;
-            padding: 25px;
-            border-radius: 8px;
-            text-align: center;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-            border-top: 4px solid var(--gold);
-        }
-
-        .date-card .date-label {
-            font-size: 0.9rem;
-            color: #666;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-
-        .date-card .date-value {
-            font-size: 1.2rem;
-            font-weight: 700;
-            color: var(--swiss-blue);
-            margin-top: 10px;
-        }
-
-        /* Registration Section */
-        .registration-cta {
-            background: linear-gradient(135deg, var(--swiss-blue) 0%, #1a3a6e 100%);
-            padding: 60px 0;
-            text-align: center;
-            color: white;
-        }
-
-        .registration-cta h2 {
-            color: white;
-            border-bottom-color: var(--gold);
-        }
-
-        .registration-cta p {
-            max-width: 600px;
-            margin: 0 auto 30px;
-            opacity: 0.9;
-        }
-
-        .register-button {
-            display: inline-block;
-            background: var(--gold);
-            color: var(--dark-gray);
-            padding: 15px 40px;
-            font-size: 1.1rem;
-            font-weight: 700;
-            text-decoration: none;
-            border-radius: 5px;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-
-        .register-button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        }
-
-        /* Committee with photos */
-        .committee-member img {
-            width: 80px;
-            height: 80px;
-            border-radius: 50%;
-            object-fit: cover;
-            margin-bottom: 10px;
-            border: 3px solid var(--swiss-blue);
-        }
-
-        .committee-member .initials {
-            width: 80px;
-            height: 80px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, var(--swiss-blue) 0%, #1a3a6e 100%);
-            color: white;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.5rem;
-            font-weight: 700;
-            margin: 0 auto 10px;
-        }
-
-        /* Responsive */
-        @media (max-width: 768px) {
-            .hero h1 {
-                font-size: 1.8rem;
-            }
-
-            .budget-grid {
-                grid-template-columns: 1fr;
-            }
-
-            .organizers-grid {
-                grid-template-columns: 1fr;
-            }
-
-            .venue-container {
-                grid-template-columns: 1fr;
-            }
-
-            nav ul {
-                display: none;
-            }
-
-            .session {
-                flex-direction: column;
-                gap: 5px;
-            }
-
-            .committee-grid {
-                grid-template-columns: repeat(2, 1fr);
-            }
-        }
-    '''
-
-def generate_public_html(publications, network_map_b64, scientific_committee, photo_mappings, affiliations):
-    """Generate the public HTML page (without budget)"""
+# Navigation links: (href, label, extra attributes)
+PUBLIC_NAV_LINKS = [
+    ("#overview", "Overview", ""),
+    ("#dates", "Dates", ""),
+    ("#topics", "Topics", ""),
+    ("#program", "Program", ""),
+    ("#keynotes", "Keynotes", ""),
+    ("#committee", "Committee", ""),
+    ("#venue", "Venue", ""),
+    ("#network", "Network", ""),
+    ("#register", "Register", ' style="background: var(--gold); padding: 8px 15px; border-radius: 4px; color: #333;"'),
+]
+
+BUDGET_NAV_LINKS = [
+    ("ai_digital_finance.html", "Back to Public Page", ""),
+]
+
+# Hero details: (label, value)
+PUBLIC_HERO_DETAILS = [
+    ("Dates", "April 21-23, 2026"),
+    ("Location", "American University of Sharjah, UAE"),
+    ("Participants", "80-100 Expected"),
+    ("Format", "60% Academic / 40% Industry"),
+]
+
+BUDGET_HERO_DETAILS = [
+    ("Total Budget", "CHF 18,000"),
+    ("CCG Request", "CHF 5,000"),
+    ("Co-funding Rate", "72%"),
+]
+
+# Templates the pages render through (tracked by the incremental build manifest)
+PAGE_TEMPLATES = ("head", "nav", "nav_link", "hero", "hero_detail", "committee_card", "publication_row", "footer")
+
+
+def render_nav(logo, links):
+    """Render the top navigation bar partial"""
+    items = ''.join(
+        '\n                ' + render_template('nav_link', href=href, label=label, attrs=attrs)
+        for href, label, attrs in links
+    )
+    return render_template('nav', logo=logo, links=items)
+
+
+def render_hero(title, subtitle, details, attrs=''):
+    """Render the hero banner partial"""
+    items = ''.join(
+        '\n                ' + render_template('hero_detail', label=label, value=value)
+        for label, value in details
+    )
+    return render_template('hero', title=title, subtitle=subtitle, details=items, attrs=attrs)
+
+
+def public_page_chunks(publications, network_map_src, scientific_committee, asset_mode="inline", css_mode="inline", lazy_images=False):
+    """Generate the public HTML page (without budget), section by section"""
 
     total_citations = sum(p.get('citations', 0) for p in publications)
-    styles = get_common_styles()
-
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI for Digital Finance: Swiss-MENA Research Network Workshop</title>
-    <style>{styles}</style>
-</head>
-<body>
+    nav = render_nav("AI for Digital Finance", PUBLIC_NAV_LINKS)
+    hero = render_hero("AI for Digital Finance", "Swiss-MENA Research Network Workshop", PUBLIC_HERO_DETAILS)
+
+    yield render_template(
+        'head', page_title="AI for Digital Finance: Swiss-MENA Research Network Workshop",
+        page_class=page_class('finance'), head_extra='', styles=style_tags('finance', css_mode, nav + hero)
+    )
+
+    yield f'''
     <!-- Navigation -->
-    <nav>
-        <div class="container">
-            <div class="logo">AI for Digital Finance</div>
-            <ul>
-                <li><a href="#overview">Overview</a></li>
-                <li><a href="#dates">Dates</a></li>
-                <li><a href="#topics">Topics</a></li>
-                <li><a href="#program">Program</a></li>
-                <li><a href="#keynotes">Keynotes</a></li>
-                <li><a href="#committee">Committee</a></li>
-                <li><a href="#venue">Venue</a></li>
-                <li><a href="#network">Network</a></li>
-                <li><a href="#register" style="background: var(--gold); padding: 8px 15px; border-radius: 4px; color: #333;">Register</a></li>
-            </ul>
-        </div>
-    </nav>
+    {nav}'''
+
+    yield f'''
 
     <!-- Hero Section -->
-    <section class="hero">
-        <div class="container">
-            <h1>AI for Digital Finance</h1>
-            <p class="subtitle">Swiss-MENA Research Network Workshop</p>
-            <div class="hero-details">
-                <div class="hero-detail">
-                    <div class="label">Dates</div>
-                    <div class="value">April 21-23, 2026</div>
-                </div>
-                <div class="hero-detail">
-                    <div class="label">Location</div>
-                    <div class="value">American University of Sharjah, UAE</div>
-                </div>
-                <div class="hero-detail">
-                    <div class="label">Participants</div>
-                    <div class="value">80-100 Expected</div>
-                </div>
-                <div class="hero-detail">
-                    <div class="label">Format</div>
-                    <div class="value">60% Academic / 40% Industry</div>
-                </div>
-            </div>
-        </div>
-    </section>
+    {hero}'''
+
+    yield f'''
 
     <!-- Overview Section -->
     <section id="overview">
@@ -1093,7 +263,9 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
                 </div>
             </div>
         </div>
-    </section>
+    </section>'''
+
+    yield f'''
 
     <!-- Important Dates Section -->
     <section id="dates">
@@ -1105,13 +277,13 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
 
     # Add important dates
     for date_item in IMPORTANT_DATES:
-        html += f'''
+        yield f'''
                 <div class="date-card">
                     <div class="date-label">{date_item["label"]}</div>
                     <div class="date-value">{date_item["date"]}</div>
                 </div>'''
 
-    html += '''
+    yield '''
             </div>
         </div>
     </section>
@@ -1126,13 +298,13 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
 
     # Add topics
     for topic in WORKSHOP_TOPICS:
-        html += f'''
+        yield f'''
                 <div class="topic-card">
                     <h4>{topic["title"]}</h4>
                     <p>{topic["desc"]}</p>
                 </div>'''
 
-    html += '''
+    yield '''
             </div>
 
             <h3 style="margin-top: 40px;">Call for Contributions</h3>
@@ -1355,7 +527,9 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
                 </div>
             </div>
         </div>
-    </section>
+    </section>'''
+
+    yield '''
 
     <!-- Keynote Speakers Section -->
     <section id="keynotes">
@@ -1386,7 +560,9 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
 
             <p style="margin-top: 30px; text-align: center; color: #666; font-style: italic;">Keynote speakers will be confirmed by February 2026</p>
         </div>
-    </section>
+    </section>'''
+
+    yield '''
 
     <!-- Scientific Committee Section -->
     <section id="committee">
@@ -1413,40 +589,16 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
 
     # Add scientific committee members with photos and affiliations
     for member in scientific_committee:
-        # Try to find photo for this member
-        member_lower = member.lower()
-        photo_filename = photo_mappings.get(member_lower)
-        affiliation = affiliations.get(member, '')
-
-        if photo_filename:
-            photo_b64 = load_photo_base64(photo_filename)
-            if photo_b64:
-                html += f'''
-                <div class="committee-member">
-                    <img src="{photo_b64}" alt="{member}">
-                    <div class="name">{member}</div>
-                    <div class="affiliation">{affiliation}</div>
-                </div>'''
-            else:
-                # Photo file not found, show initials
-                initials = ''.join(n[0].upper() for n in member.split()[:2] if n)
-                html += f'''
-                <div class="committee-member">
-                    <div class="initials">{initials}</div>
-                    <div class="name">{member}</div>
-                    <div class="affiliation">{affiliation}</div>
-                </div>'''
-        else:
-            # No photo mapping, show initials
-            initials = ''.join(n[0].upper() for n in member.split()[:2] if n)
-            html += f'''
-                <div class="committee-member">
-                    <div class="initials">{initials}</div>
-                    <div class="name">{member}</div>
-                    <div class="affiliation">{affiliation}</div>
-                </div>'''
+        name = member['name']
+        photo = load_photo_html(member, asset_mode, lazy_images)
+        if not photo:
+            # No photo mapping, file not found or a placeholder: show initials
+            initials = ''.join(n[0].upper() for n in name.split()[:2] if n)
+            photo = f'<div class="initials">{initials}</div>'
+
+        yield '\n                ' + render_template('committee_card', photo=photo, name=name, affiliation=member['affiliation'] or '')
 
-    html += f'''
+    yield f'''
             </div>
         </div>
     </section>
@@ -1465,10 +617,10 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
                     <ul class="venue-features">'''
 
     for feature in VENUE_INFO["features"]:
-        html += f'''
+        yield f'''
                         <li>{feature}</li>'''
 
-    html += '''
+    yield f'''
                     </ul>
                 </div>
                 <div class="venue-map">
@@ -1532,7 +684,9 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
                 </div>
             </div>
         </div>
-    </section>
+    </section>'''
+
+    yield f'''
 
     <!-- Network Section -->
     <section id="network">
@@ -1541,7 +695,12 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
             <p>The Swiss-MENA AI Finance Research Network connects leading institutions across Europe, Middle East, and Asia. FHGR (Switzerland) and AUS (UAE) serve as core partners, with satellite connections to Universities of Manchester (UK), Renmin (China), Babes-Bolyai (Romania), and Bern University of Applied Sciences (Switzerland).</p>
 
             <div class="network-map">
-                <img src="data:image/png;base64,{network_map_b64}" alt="Swiss-MENA AI Finance Research Network">
+                <img src="'''
+
+    # Largest blob on the page: yielded on its own so it is streamed from the encode cache
+    yield network_map_src
+
+    yield f'''" alt="Swiss-MENA AI Finance Research Network"{network_map_attrs(lazy_images)}>
             </div>
 
             <h3>Core Partners</h3>
@@ -1576,7 +735,9 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
                 </div>
             </div>
         </div>
-    </section>
+    </section>'''
+
+    yield f'''
 
     <!-- Publications Section -->
     <section id="publications">
@@ -1603,16 +764,12 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
             title += '...'
         doi_link = f'<a href="{pub["doi_url"]}" target="_blank">Link</a>' if pub.get('doi_url') else '-'
 
-        html += f'''
-                    <tr>
-                        <td>{pub.get('year', 'N/A')}</td>
-                        <td>{title}</td>
-                        <td>{pub.get('journal', 'Unknown')}</td>
-                        <td>{pub.get('citations', 0)}</td>
-                        <td>{doi_link}</td>
-                    </tr>'''
-
-    html += '''
+        yield '\n                    ' + render_template(
+            'publication_row', year=pub.get('year', 'N/A'), title=title,
+            journal=pub.get('journal', 'Unknown'), citations=pub.get('citations', 0), doi=doi_link
+        )
+
+    yield '''
                 </tbody>
             </table>
         </div>
@@ -1710,7 +867,9 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
                 </div>
             </div>
         </div>
-    </section>
+    </section>'''
+
+    yield '''
 
     <!-- Registration Section -->
     <section id="register" class="registration-cta">
@@ -1720,30 +879,14 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
             <a href="#" class="register-button" onclick="alert('Registration will open in January 2026'); return false;">Registration Opens January 2026</a>
             <p style="margin-top: 20px; font-size: 0.9rem; opacity: 0.8;">Early bird registration deadline: March 15, 2026</p>
         </div>
-    </section>
+    </section>'''
+
+    yield f'''
 
     <!-- Footer -->
-    <footer>
-        <div class="container">
-            <h3>AI for Digital Finance: Swiss-MENA Research Network</h3>
-            <p>A Connect & Collaborate Grant (CCG) Project | Leading House MENA</p>
-            <div class="footer-contacts">
-                <div class="footer-contact">
-                    <div class="name">Prof. Dr. Joerg Osterrieder</div>
-                    <div><a href="mailto:joerg.osterrieder@fhgr.ch">joerg.osterrieder@fhgr.ch</a></div>
-                    <div>FHGR, Switzerland</div>
-                </div>
-                <div class="footer-contact">
-                    <div class="name">Prof. Stephen Chan</div>
-                    <div><a href="mailto:schan@aus.edu">schan@aus.edu</a></div>
-                    <div>AUS, UAE</div>
-                </div>
-            </div>
-            <p style="margin-top: 30px; font-size: 0.85rem; opacity: 0.8;">
-                GitHub: <a href="https://github.com/Digital-AI-Finance/digital-ai-in-finance">Digital-AI-Finance/digital-ai-in-finance</a>
-            </p>
-        </div>
-    </footer>
+    {render_template('footer')}'''
+
+    yield '''
 
     <script>
         // Smooth scrolling for navigation
@@ -1763,60 +906,40 @@ def generate_public_html(publications, network_map_b64, scientific_committee, ph
 </body>
 </html>'''
 
-    return html
 
+def generate_public_html(publications, network_map_src, scientific_committee, asset_mode="inline", css_mode="inline", lazy_images=False):
+    """Generate the public HTML page (without budget) as a single string"""
+    return render(public_page_chunks(publications, network_map_src, scientific_committee, asset_mode, css_mode, lazy_images))
 
-def generate_budget_html():
-    """Generate the internal budget HTML page"""
 
-    styles = get_common_styles()
+def budget_page_chunks(css_mode="inline"):
+    """Generate the internal budget HTML page, section by section"""
 
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Budget Details (Internal) | AI for Digital Finance</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>{styles}</style>
-</head>
-<body>
-    <!-- Internal Warning Banner -->
-    <div class="internal-banner">
+    banner = '''<div class="internal-banner">
         INTERNAL DOCUMENT - NOT FOR PUBLIC DISTRIBUTION
-    </div>
+    </div>'''
+    nav = render_nav("AI for Digital Finance - Budget", BUDGET_NAV_LINKS)
+    hero = render_hero("Budget Overview", "Internal Document - CCG Grant Application", BUDGET_HERO_DETAILS, attrs=' style="padding: 50px 0;"')
+
+    yield render_template(
+        'head', page_title="Budget Details (Internal) | AI for Digital Finance",
+        page_class=page_class('finance'), styles=style_tags('finance', css_mode, banner + nav + hero),
+        head_extra='\n    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>'
+    )
+
+    yield f'''
+    <!-- Internal Warning Banner -->
+    {banner}
 
     <!-- Navigation -->
-    <nav>
-        <div class="container">
-            <div class="logo">AI for Digital Finance - Budget</div>
-            <ul>
-                <li><a href="ai_digital_finance.html">Back to Public Page</a></li>
-            </ul>
-        </div>
-    </nav>
+    {nav}'''
+
+    yield f'''
 
     <!-- Hero Section -->
-    <section class="hero" style="padding: 50px 0;">
-        <div class="container">
-            <h1>Budget Overview</h1>
-            <p class="subtitle">Internal Document - CCG Grant Application</p>
-            <div class="hero-details">
-                <div class="hero-detail">
-                    <div class="label">Total Budget</div>
-                    <div class="value">CHF 18,000</div>
-                </div>
-                <div class="hero-detail">
-                    <div class="label">CCG Request</div>
-                    <div class="value">CHF 5,000</div>
-                </div>
-                <div class="hero-detail">
-                    <div class="label">Co-funding Rate</div>
-                    <div class="value">72%</div>
-                </div>
-            </div>
-        </div>
-    </section>
+    {hero}'''
+
+    yield f'''
 
     <!-- Budget Charts -->
     <section id="charts">
@@ -1835,7 +958,9 @@ def generate_budget_html():
                 </div>
             </div>
         </div>
-    </section>
+    </section>'''
+
+    yield f'''
 
     <!-- Detailed Budget -->
     <section id="details">
@@ -1975,7 +1100,9 @@ def generate_budget_html():
                 </tbody>
             </table>
         </div>
-    </section>
+    </section>'''
+
+    yield f'''
 
     <!-- Footer -->
     <footer>
@@ -1984,7 +1111,9 @@ def generate_budget_html():
             <p style="margin-top: 15px;">AI for Digital Finance: Swiss-MENA Research Network</p>
             <p><a href="ai_digital_finance.html">Return to Public Page</a></p>
         </div>
-    </footer>
+    </footer>'''
+
+    yield f'''
 
     <!-- Chart.js Scripts -->
     <script>
@@ -2074,40 +1203,83 @@ def generate_budget_html():
 </body>
 </html>'''
 
-    return html
 
+def generate_budget_html(css_mode="inline"):
+    """Generate the internal budget HTML page as a single string"""
+    return render(budget_page_chunks(css_mode))
 
-def main():
-    print("Generating AI Digital Finance HTML pages...")
 
+def public_page_inputs():
+    """Files the public page is built from (recorded in the build manifest)"""
+    return GENERATOR_SOURCES + template_inputs(*PAGE_TEMPLATES) + [
+        DATA_DIR / "publications.json",
+        IMAGES_DIR / "network_map.png",
+    ] + store_inputs()
+
+
+def build_public_page(asset_mode="inline", css_mode="inline", lazy_images=False, verbose=False):
+    """Generate and write ai_digital_finance.html, return the files it was built from"""
     publications = load_publications()
-    network_map_b64 = load_network_map_base64()
+    network_map_src = load_network_map_src(asset_mode)
     scientific_committee = load_scientific_committee()
-    photo_mappings = load_photo_mappings()
-    affiliations = load_affiliations()
-
-    print(f"  Loaded {len(publications)} publications")
-    print(f"  Loaded {len(scientific_committee)} Scientific Committee members")
-    print(f"  Loaded {len(photo_mappings)} photo mappings")
-    print(f"  Loaded {len(affiliations)} affiliations")
-
-    # Generate public page (no budget)
-    print("  Generating public page (ai_digital_finance.html)...")
-    public_html = generate_public_html(publications, network_map_b64, scientific_committee, photo_mappings, affiliations)
-    with open(OUTPUT_PUBLIC, 'w', encoding='utf-8') as f:
-        f.write(public_html)
-    print(f"  -> {OUTPUT_PUBLIC} ({OUTPUT_PUBLIC.stat().st_size / 1024:.1f} KB)")
-
-    # Generate internal budget page
-    print("  Generating internal budget page (budget_internal.html)...")
-    budget_html = generate_budget_html()
-    with open(OUTPUT_BUDGET, 'w', encoding='utf-8') as f:
-        f.write(budget_html)
-    print(f"  -> {OUTPUT_BUDGET} ({OUTPUT_BUDGET.stat().st_size / 1024:.1f} KB)")
-
-    print("\nDone! Two pages generated:")
-    print("  - ai_digital_finance.html (PUBLIC - no budget)")
-    print("  - budget_internal.html (INTERNAL - budget details)")
+
+    if verbose:
+        print(f"  Loaded {len(publications)} publications")
+        print(f"  Loaded {len(scientific_committee)} Scientific Committee members "
+              f"({sum(1 for m in scientific_committee if m['photo'])} with photos, "
+              f"{sum(1 for m in scientific_committee if m['affiliation'])} with affiliations)")
+
+    write_html(OUTPUT_PUBLIC, public_page_chunks(publications, network_map_src, scientific_committee, asset_mode, css_mode, lazy_images))
+    return public_page_inputs()
+
+
+def build_budget_page(css_mode="inline"):
+    """Generate and write budget_internal.html, return the files it was built from"""
+    write_html(OUTPUT_BUDGET, budget_page_chunks(css_mode))
+    return GENERATOR_SOURCES + template_inputs("head", "nav", "nav_link", "hero", "hero_detail")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate AI Digital Finance HTML pages")
+    add_asset_mode_argument(parser)
+    add_css_mode_argument(parser)
+    add_lazy_images_argument(parser)
+    add_force_argument(parser)
+    add_verify_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profile_run(args.profile, "generate_ai_digital_finance"):
+        gate(args)
+
+        print("Generating AI Digital Finance HTML pages...")
+
+        manifest = BuildManifest()
+        params = build_params(args.css_mode, args.asset_mode, args.lazy_images)
+        budget_params = build_params(args.css_mode)
+
+        # Generate public page (no budget)
+        if not args.force and manifest.is_fresh(OUTPUT_PUBLIC, params):
+            print("  ai_digital_finance.html is up to date")
+        else:
+            print("  Generating public page (ai_digital_finance.html)...")
+            inputs = build_public_page(args.asset_mode, args.css_mode, args.lazy_images, verbose=True)
+            manifest.record(OUTPUT_PUBLIC, inputs, params)
+            print(f"  -> {OUTPUT_PUBLIC} ({OUTPUT_PUBLIC.stat().st_size / 1024:.1f} KB)")
+
+        # Generate internal budget page
+        if not args.force and manifest.is_fresh(OUTPUT_BUDGET, budget_params):
+            print("  budget_internal.html is up to date")
+        else:
+            print("  Generating internal budget page (budget_internal.html)...")
+            manifest.record(OUTPUT_BUDGET, build_budget_page(args.css_mode), budget_params)
+            print(f"  -> {OUTPUT_BUDGET} ({OUTPUT_BUDGET.stat().st_size / 1024:.1f} KB)")
+
+        manifest.save()
+
+        print("\nDone! Outputs:")
+        print("  - ai_digital_finance.html (PUBLIC - no budget)")
+        print("  - budget_internal.html (INTERNAL - budget details)")
 
 
 if __name__ == "__main__":
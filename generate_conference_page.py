@@ -2,33 +2,46 @@
 Compact conference webpage with sidebar navigation
 """
 
-import base64
-import json
+import argparse
 from pathlib import Path
 
+from asset_pipeline import add_asset_mode_argument, add_lazy_images_argument, image_src, lazy_attrs, photo_html
+from build_manifest import BuildManifest, add_force_argument, build_params, module_sources
+from build_profiler import add_profile_argument, profile_run, stage
+from committee_checks import add_verify_arguments, gate
+from html_writer import render, write_html
+from people_store import open_store, store_inputs
+from photo_index import USABLE_STATUSES
+from stylesheet import add_css_mode_argument, page_class, style_tags, stylesheet_inputs
+from template_engine import render_template, template_inputs
+
 BASE_DIR = Path(__file__).parent
-DATA_DIR = BASE_DIR / "data"
 DOCS_DIR = BASE_DIR / "docs"
 IMAGES_DIR = DOCS_DIR / "images"
 PEOPLE_ASSETS_DIR = BASE_DIR / "assets" / "people"
 LOGOS_DIR = BASE_DIR / "assets" / "logos"
 OUTPUT_FILE = BASE_DIR / "index.html"
 
-def load_json(filepath):
-    if filepath.exists():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
-
-def load_image_base64(filepath):
-    """Load image only if it's a real photo (>2KB), not placeholder"""
-    if filepath.exists():
-        size = filepath.stat().st_size
-        if size > 2000:  # Real photos are larger than 2KB
-            with open(filepath, 'rb') as f:
-                ext = filepath.suffix.lower()
-                mime = 'image/png' if ext == '.png' else 'image/jpeg'
-                return f"data:{mime};base64,{base64.b64encode(f.read()).decode('utf-8')}"
+# Committee photos are displayed at 45x45 CSS pixels
+COMMITTEE_PHOTO_SIZE = 45
+# Partner logo box (width, height) in CSS pixels, see .partner .logo
+LOGO_SIZE = (80, 40)
+
+# Code the page depends on, including the local modules it imports (tracked by the incremental build manifest)
+GENERATOR_SOURCES = [Path(__file__)] + module_sources(
+    "asset_pipeline", "build_manifest", "html_minifier", "html_writer", "name_index", "people_store",
+    "photo_index", "template_engine",
+) + stylesheet_inputs()
+PAGE_TEMPLATES = ("head", "conference_sidebar", "conference_hero", "committee_card_compact", "partner_card")
+
+def load_image_src(filepath, asset_mode="inline"):
+    """Load image as a data URI or hashed asset URL (None if missing)"""
+    return image_src(filepath, asset_mode)
+
+def load_photo_html(member, asset_mode="inline", lazy=False):
+    """Right-sized committee photo markup, None unless the photo index rates it a real portrait"""
+    if member['photo'] and member['photo_status'] in USABLE_STATUSES:
+        return photo_html(PEOPLE_ASSETS_DIR / member['photo'], member['name'], COMMITTEE_PHOTO_SIZE, asset_mode, lazy)
     return None
 
 def load_svg(filepath):
@@ -38,6 +51,15 @@ def load_svg(filepath):
             return f.read()
     return None
 
+def load_logo_html(filepath, alt, asset_mode="inline", lazy=False):
+    """Partner logo markup: inline SVG, or a lazily loaded <img> (None if missing)"""
+    if not lazy:
+        return load_svg(filepath)
+    src = image_src(filepath, asset_mode)
+    if src is None:
+        return None
+    return f'<img src="{src}" alt="{alt}" {lazy_attrs(size=LOGO_SIZE)}>'
+
 DATES = [
     ("Submission", "Feb 15, 2026"),
     ("Notification", "Mar 1, 2026"),
@@ -94,312 +116,72 @@ LOGO_SVG = '''<svg viewBox="0 0 40 40" xmlns="http://www.w3.org/2000/svg">
 # Favicon as data URL (32x32 PNG encoded)
 FAVICON_SVG = 'data:image/svg+xml,' + LOGO_SVG.replace('\n', '').replace('#', '%23')
 
-def generate_html():
-    committee_data = load_json(DATA_DIR / "scientific_committee.json")
-    committee = committee_data.get('selected', [])
-
-    photo_data = load_json(DATA_DIR / "msca_people_named.json")
-    photo_map = {p['name'].lower(): p['filename'] for p in photo_data.get('people', [])}
-
-    affiliations_data = load_json(DATA_DIR / "msca_bios.json")
-    affiliations = affiliations_data.get('affiliations', {})
-    bios = affiliations_data.get('bios', {})
-
-    network_map = load_image_base64(IMAGES_DIR / "network_map.png")
-
-    css = '''
-    :root {
-        --blue: #2E5090; --gold: #D4AF37; --dark: #1a1a2e; --light: #f0f0f0;
-        --bg: white; --text: #333; --text-muted: #666;
-    }
-    [data-theme="dark"] {
-        --bg: #1a1a2e; --light: #2a2a4e; --text: #e0e0e0; --text-muted: #aaa;
-    }
-    html { scroll-behavior: smooth; }
-    * { margin: 0; padding: 0; box-sizing: border-box; }
-    body { font-family: system-ui, -apple-system, sans-serif; font-size: 13px; line-height: 1.4; color: var(--text); display: flex; min-height: 100vh; background: var(--bg); transition: background 0.3s, color 0.3s; }
-    section { scroll-margin-top: 20px; }
-
-    /* Sidebar */
-    .sidebar { width: 200px; background: var(--dark); color: white; position: fixed; height: 100vh; padding: 15px; overflow-y: auto; z-index: 100; transition: transform 0.3s; }
-    .sidebar .logo { width: 40px; height: 40px; margin: 0 auto 10px; display: block; }
-    .sidebar h1 { font-size: 0.95rem; color: var(--gold); margin-bottom: 5px; text-align: center; }
-    .sidebar .subtitle { font-size: 0.7rem; opacity: 0.7; margin-bottom: 15px; border-bottom: 1px solid #444; padding-bottom: 10px; text-align: center; }
-    .sidebar nav a { display: block; color: white; text-decoration: none; padding: 6px 10px; font-size: 0.8rem; border-radius: 4px; margin-bottom: 2px; opacity: 0.8; }
-    .sidebar nav a:hover { background: rgba(255,255,255,0.1); opacity: 1; }
-    .sidebar .register-btn { display: block; background: var(--gold); color: var(--dark); text-align: center; padding: 8px; border-radius: 4px; font-weight: 700; font-size: 0.8rem; margin-top: 15px; text-decoration: none; }
-    .sidebar .info { margin-top: 20px; padding-top: 15px; border-top: 1px solid #444; font-size: 0.7rem; opacity: 0.6; }
-    .theme-toggle { background: none; border: 1px solid #555; color: white; padding: 5px 10px; border-radius: 4px; cursor: pointer; font-size: 0.7rem; margin-top: 10px; width: 100%; }
-    .theme-toggle:hover { background: rgba(255,255,255,0.1); }
-
-    /* Mobile Menu */
-    .mobile-header { display: none; position: fixed; top: 0; left: 0; right: 0; background: var(--dark); padding: 10px 15px; z-index: 99; }
-    .hamburger { background: none; border: none; color: white; font-size: 1.5rem; cursor: pointer; }
-    .mobile-header .title { color: var(--gold); font-size: 0.9rem; font-weight: 700; }
-    .sidebar-backdrop { display: none; position: fixed; top: 0; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.5); z-index: 99; }
-    .sidebar-backdrop.active { display: block; }
-
-    /* Back to Top */
-    .back-to-top { position: fixed; bottom: 30px; right: 30px; width: 40px; height: 40px; background: var(--blue); color: white; border: none; border-radius: 50%; cursor: pointer; font-size: 1.2rem; opacity: 0; visibility: hidden; transition: all 0.3s; z-index: 90; box-shadow: 0 2px 10px rgba(0,0,0,0.2); }
-    .back-to-top.visible { opacity: 1; visibility: visible; }
-    .back-to-top:hover { background: var(--gold); transform: translateY(-3px); }
-
-    /* Main */
-    main { margin-left: 200px; flex: 1; background: var(--bg); }
-
-    /* Hero */
-    .hero {
-        background: linear-gradient(135deg, rgba(46,80,144,0.9), rgba(26,58,110,0.95)),
-                    url('https://images.unsplash.com/photo-1512453979798-5ea266f8880c?w=1200&q=80') center/cover;
-        color: white; padding: 40px 20px; text-align: center; position: relative;
-    }
-    .hero h1 { font-size: 1.8rem; color: white; margin-bottom: 5px; }
-    .hero .tagline { opacity: 0.9; font-size: 1rem; margin-bottom: 15px; }
-    .countdown { display: flex; gap: 15px; justify-content: center; margin: 20px 0; }
-    .countdown-item { background: rgba(255,255,255,0.15); padding: 10px 15px; border-radius: 8px; min-width: 70px; }
-    .countdown-item .num { font-size: 1.8rem; font-weight: 700; display: block; }
-    .countdown-item .label { font-size: 0.7rem; text-transform: uppercase; opacity: 0.8; }
-    .hero-info { display: flex; gap: 25px; justify-content: center; flex-wrap: wrap; }
-    .hero-info div span:first-child { font-size: 0.65rem; text-transform: uppercase; opacity: 0.7; }
-    .hero-info div span:last-child { display: block; font-weight: 600; font-size: 0.9rem; }
-
-    /* Stats Bar */
-    .stats-bar { display: flex; justify-content: center; gap: 40px; padding: 20px; background: var(--dark); color: white; }
-    .stat { text-align: center; }
-    .stat .num { font-size: 1.5rem; font-weight: 700; color: var(--gold); }
-    .stat .label { font-size: 0.7rem; text-transform: uppercase; opacity: 0.7; }
-
-    /* Sections */
-    section { padding: 20px; border-bottom: 1px solid #eee; }
-    h2 { font-size: 1rem; color: var(--blue); margin-bottom: 10px; display: flex; align-items: center; gap: 8px; }
-    h2::before { content: ''; width: 3px; height: 16px; background: var(--gold); }
-
-    /* Dates */
-    .dates { display: flex; gap: 8px; flex-wrap: wrap; }
-    .date-item { background: var(--light); padding: 8px 12px; border-radius: 4px; text-align: center; flex: 1; min-width: 100px; }
-    .date-item .label { font-size: 0.65rem; color: #666; text-transform: uppercase; }
-    .date-item .value { font-size: 0.85rem; font-weight: 700; color: var(--blue); }
-
-    /* Topics */
-    .topics { display: flex; gap: 6px; flex-wrap: wrap; }
-    .topic { background: var(--blue); color: white; padding: 5px 10px; border-radius: 3px; font-size: 0.75rem; text-decoration: none; transition: all 0.3s; cursor: pointer; }
-    .topic:hover { background: #1a3a6e; transform: translateY(-2px); }
-
-    /* Call for Papers */
-    .cfp-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 15px; }
-    .cfp-box { background: var(--light); padding: 12px; border-radius: 5px; }
-    .cfp-box h4 { font-size: 0.8rem; color: var(--blue); margin-bottom: 5px; }
-    .cfp-box p, .cfp-box li { font-size: 0.75rem; color: #555; }
-    .cfp-box ul { list-style: none; margin-top: 5px; }
-    .cfp-box li { padding: 2px 0; }
-    .cfp-btn { display: inline-block; background: var(--gold); color: var(--dark); padding: 8px 20px; border-radius: 4px; text-decoration: none; font-weight: 600; font-size: 0.8rem; margin-top: 10px; }
-
-    /* Keynotes */
-    .keynotes { display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; }
-    .keynote { background: var(--light); border-radius: 5px; padding: 15px; text-align: center; }
-    .keynote-photo { width: 60px; height: 60px; border-radius: 50%; background: linear-gradient(135deg, var(--blue), #1a3a6e); color: white; display: flex; align-items: center; justify-content: center; font-size: 1.2rem; font-weight: 700; margin: 0 auto 10px; }
-    .keynote .name { font-weight: 600; font-size: 0.85rem; color: var(--blue); }
-    .keynote .inst { font-size: 0.7rem; color: #888; }
-    .keynote .talk { font-size: 0.75rem; color: #555; margin-top: 5px; font-style: italic; }
-
-    /* Program */
-    .program { display: grid; grid-template-columns: repeat(3, 1fr); gap: 10px; }
-    .day { background: var(--light); border-radius: 5px; overflow: hidden; }
-    .day-header { background: var(--blue); color: white; padding: 6px 10px; font-size: 0.8rem; font-weight: 600; }
-    .day-header span { opacity: 0.8; font-weight: 400; }
-    .session { padding: 4px 10px; font-size: 0.75rem; border-bottom: 1px solid #ddd; display: flex; cursor: pointer; transition: background 0.2s; }
-    .session:hover { background: rgba(46, 80, 144, 0.1); }
-    .session:last-child { border: none; }
-    .session-time { width: 40px; font-weight: 600; color: var(--blue); }
-    .session-title { flex: 1; }
-
-    /* Modal */
-    .modal { display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); z-index: 1000; align-items: center; justify-content: center; }
-    .modal.active { display: flex; }
-    .modal-content { background: white; padding: 25px; border-radius: 8px; max-width: 500px; width: 90%; position: relative; }
-    .modal-close { position: absolute; top: 10px; right: 15px; font-size: 1.5rem; cursor: pointer; color: #888; }
-    .modal-close:hover { color: #333; }
-    .modal h3 { color: var(--blue); margin-bottom: 10px; }
-    .modal p { font-size: 0.9rem; color: #555; line-height: 1.5; }
-
-    /* Share */
-    .share-bar { display: flex; gap: 8px; justify-content: center; padding: 15px; background: var(--dark); }
-    .share-btn { display: flex; align-items: center; gap: 5px; padding: 6px 12px; border-radius: 4px; text-decoration: none; font-size: 0.75rem; color: white; transition: opacity 0.2s; }
-    .share-btn:hover { opacity: 0.8; }
-    .share-linkedin { background: #0077B5; }
-    .share-twitter { background: #1DA1F2; }
-    .share-copy { background: #555; cursor: pointer; border: none; }
-    .hashtag { color: var(--gold); font-size: 0.8rem; margin-left: 10px; }
-
-    /* Committee */
-    .committee { display: grid; grid-template-columns: repeat(auto-fill, minmax(100px, 1fr)); gap: 8px; }
-    .member { text-align: center; padding: 8px 4px; }
-    .member img { width: 45px; height: 45px; border-radius: 50%; object-fit: cover; border: 2px solid var(--blue); }
-    .member .initials { width: 45px; height: 45px; border-radius: 50%; background: linear-gradient(135deg, var(--blue), #1a3a6e); color: white; display: flex; align-items: center; justify-content: center; font-weight: 700; font-size: 0.85rem; margin: 0 auto; }
-    .member .name { font-size: 0.7rem; font-weight: 600; margin-top: 4px; line-height: 1.2; }
-    .member .aff { font-size: 0.6rem; color: #888; }
-    .member { position: relative; cursor: pointer; }
-    .member .bio { display: none; position: absolute; bottom: 100%; left: 50%; transform: translateX(-50%); background: var(--dark); color: white; padding: 8px 10px; border-radius: 5px; font-size: 0.65rem; width: 180px; text-align: left; z-index: 100; line-height: 1.3; }
-    .member:hover .bio { display: block; }
-
-    /* Venue */
-    .venue-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 15px; }
-    .venue-info h3 { font-size: 0.9rem; color: var(--blue); margin-bottom: 3px; }
-    .venue-info p { font-size: 0.75rem; color: #666; }
-    .venue-info ul { list-style: none; font-size: 0.7rem; margin-top: 8px; }
-    .venue-info li { padding: 2px 0 2px 12px; position: relative; }
-    .venue-info li::before { content: "-"; position: absolute; left: 0; color: var(--gold); }
-    .venue-map iframe { width: 100%; height: 150px; border: none; border-radius: 4px; }
-
-    /* Network */
-    .network-img { max-width: 100%; height: auto; border-radius: 5px; margin-top: 10px; }
-
-    /* Chairs */
-    .chairs { font-size: 0.8rem; color: var(--text-muted); margin-bottom: 8px; }
-
-    /* Newsletter */
-    .newsletter { background: linear-gradient(135deg, var(--blue), #1a3a6e); color: white; text-align: center; }
-    .newsletter h2 { color: white; justify-content: center; }
-    .newsletter h2::before { background: var(--gold); }
-    .newsletter p { opacity: 0.9; margin-bottom: 15px; }
-    .newsletter-form { display: flex; gap: 10px; max-width: 400px; margin: 0 auto; }
-    .newsletter-form input { flex: 1; padding: 10px; border: none; border-radius: 4px; font-size: 0.85rem; }
-    .newsletter-form button { background: var(--gold); color: var(--dark); border: none; padding: 10px 20px; border-radius: 4px; font-weight: 600; cursor: pointer; }
-    .newsletter-form button:hover { opacity: 0.9; }
-
-    /* Placeholder Sections */
-    .placeholder-section { background: var(--light); text-align: center; }
-    .placeholder-section .coming-soon { color: var(--text-muted); font-style: italic; padding: 30px; }
-    .placeholder-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(150px, 1fr)); gap: 10px; opacity: 0.5; }
-    .placeholder-card { background: var(--bg); border: 2px dashed #ccc; border-radius: 8px; padding: 20px; }
-
-    /* Partner Logos */
-    .partners-grid { display: flex; flex-wrap: wrap; gap: 15px; justify-content: center; margin-top: 15px; }
-    .partner { background: white; padding: 12px 15px; border-radius: 5px; text-decoration: none; text-align: center; transition: transform 0.2s, box-shadow 0.2s; border: 1px solid #ddd; min-width: 110px; }
-    .partner:hover { transform: translateY(-3px); box-shadow: 0 4px 12px rgba(0,0,0,0.15); }
-    .partner .logo { width: 80px; height: 40px; margin: 0 auto 5px; }
-    .partner .logo svg { width: 100%; height: 100%; }
-    .partner .country { font-size: 0.65rem; color: var(--gold); font-weight: 600; margin-top: 5px; }
-    .partner .name { font-size: 0.6rem; color: #666; margin-top: 2px; }
-
-    @media (max-width: 900px) {
-        .sidebar { width: 160px; }
-        main { margin-left: 160px; }
-        .program { grid-template-columns: 1fr; }
-        .venue-grid { grid-template-columns: 1fr; }
-        .keynotes { grid-template-columns: 1fr; }
-    }
-    @media (max-width: 600px) {
-        .sidebar { transform: translateX(-100%); }
-        .sidebar.open { transform: translateX(0); }
-        .mobile-header { display: flex; align-items: center; justify-content: space-between; }
-        main { margin-left: 0; padding-top: 50px; }
-        .back-to-top { bottom: 20px; right: 20px; }
-    }
-
-    /* Print Styles */
-    @media print {
-        .sidebar, .mobile-header, .share-bar, .back-to-top, .theme-toggle, .register-btn, .newsletter, .modal { display: none !important; }
-        main { margin-left: 0; }
-        body { font-size: 11pt; color: black; background: white; }
-        .hero { background: #2E5090 !important; -webkit-print-color-adjust: exact; print-color-adjust: exact; padding: 20px; }
-        section { page-break-inside: avoid; border: none; padding: 15px 0; }
-        .program { grid-template-columns: 1fr 1fr 1fr; }
-        .committee { grid-template-columns: repeat(6, 1fr); }
-        .member img, .member .initials { width: 30px; height: 30px; }
-        a { color: inherit; text-decoration: none; }
-        h2::before { background: #D4AF37 !important; -webkit-print-color-adjust: exact; print-color-adjust: exact; }
-    }
-    '''
-
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI for Digital Finance 2026 | Swiss-MENA Workshop</title>
-    <meta name="description" content="AI for Digital Finance Workshop 2026 - A Swiss-MENA Research Network event. April 21-23, 2026 at American University of Sharjah, UAE. Topics: LLMs, Explainable AI, Blockchain, Risk Management, Digital Banking.">
-    <meta name="keywords" content="AI, Digital Finance, Workshop, Conference, LLMs, Blockchain, Risk Management, MENA, Switzerland, UAE, Sharjah">
-    <link rel="canonical" href="https://digital-ai-finance.github.io/digital-ai-in-finance/">
-    <link rel="icon" type="image/svg+xml" href="{FAVICON_SVG}">
-
-    <!-- Open Graph -->
-    <meta property="og:title" content="AI for Digital Finance Workshop 2026">
-    <meta property="og:description" content="Swiss-MENA Research Network Workshop | April 21-23, 2026 | American University of Sharjah, UAE">
-    <meta property="og:type" content="website">
-    <meta property="og:url" content="https://digital-ai-finance.github.io/digital-ai-in-finance/">
-    <meta property="og:image" content="https://images.unsplash.com/photo-1512453979798-5ea266f8880c?w=1200">
-
-    <!-- Twitter Card -->
-    <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="AI for Digital Finance Workshop 2026">
-    <meta name="twitter:description" content="Swiss-MENA Research Network | April 21-23, 2026 | Sharjah, UAE">
-    <meta name="twitter:image" content="https://images.unsplash.com/photo-1512453979798-5ea266f8880c?w=1200">
-
-    <style>{css}</style>
-</head>
-<body>
-    <!-- Mobile Header -->
-    <div class="mobile-header">
-        <button class="hamburger" onclick="toggleMenu()">&#9776;</button>
-        <span class="title">AI for Digital Finance 2026</span>
-    </div>
-    <div class="sidebar-backdrop" onclick="toggleMenu()"></div>
-
-    <aside class="sidebar">
-        {LOGO_SVG.replace('<svg', '<svg class="logo"')}
-        <h1>AI for Digital Finance</h1>
-        <div class="subtitle">Swiss-MENA Workshop 2026</div>
-        <nav>
-            <a href="#dates">Important Dates</a>
-            <a href="#topics">Topics</a>
-            <a href="#program">Program</a>
-            <a href="#committee">Committee</a>
-            <a href="#venue">Venue</a>
-            <a href="#network">Network</a>
-            <a href="#partners">Partners</a>
-            <a href="#cfp">Call for Papers</a>
-        </nav>
-        <a href="#" class="register-btn" onclick="alert('Opens Jan 2026'); return false;">Register</a>
-        <button class="theme-toggle" onclick="toggleTheme()">Toggle Dark Mode</button>
-        <div class="info">
-            Apr 21-23, 2026<br>
-            AUS, Sharjah, UAE<br><br>
-            80-100 participants
-        </div>
-    </aside>
-
-    <main>
-        <section class="hero">
-            <h1>AI for Digital Finance Workshop</h1>
-            <p class="tagline">Swiss-MENA Research Network | April 21-23, 2026</p>
-            <div class="countdown" id="countdown">
-                <div class="countdown-item"><span class="num" id="days">---</span><span class="label">Days</span></div>
-                <div class="countdown-item"><span class="num" id="hours">--</span><span class="label">Hours</span></div>
-                <div class="countdown-item"><span class="num" id="mins">--</span><span class="label">Minutes</span></div>
-                <div class="countdown-item"><span class="num" id="secs">--</span><span class="label">Seconds</span></div>
-            </div>
-            <div class="hero-info">
-                <div><span>Venue</span><span>American University of Sharjah</span></div>
-                <div><span>Location</span><span>Sharjah, UAE</span></div>
-            </div>
-        </section>
+# Meta, Open Graph and Twitter tags (head template's head_extra slot)
+HEAD_EXTRA = (
+    '\n    <meta name="description" content="AI for Digital Finance Workshop 2026 - A Swiss-MENA Research Network event. April 21-23, 2026 at American University of Sharjah, UAE. Topics: LLMs, Explainable AI, Blockchain, Risk Management, Digital Banking.">'
+    '\n    <meta name="keywords" content="AI, Digital Finance, Workshop, Conference, LLMs, Blockchain, Risk Management, MENA, Switzerland, UAE, Sharjah">'
+    '\n    <link rel="canonical" href="https://digital-ai-finance.github.io/digital-ai-in-finance/">'
+    f'\n    <link rel="icon" type="image/svg+xml" href="{FAVICON_SVG}">'
+    '\n'
+    '\n    <!-- Open Graph -->'
+    '\n    <meta property="og:title" content="AI for Digital Finance Workshop 2026">'
+    '\n    <meta property="og:description" content="Swiss-MENA Research Network Workshop | April 21-23, 2026 | American University of Sharjah, UAE">'
+    '\n    <meta property="og:type" content="website">'
+    '\n    <meta property="og:url" content="https://digital-ai-finance.github.io/digital-ai-in-finance/">'
+    '\n    <meta property="og:image" content="https://images.unsplash.com/photo-1512453979798-5ea266f8880c?w=1200">'
+    '\n'
+    '\n    <!-- Twitter Card -->'
+    '\n    <meta name="twitter:card" content="summary_large_image">'
+    '\n    <meta name="twitter:title" content="AI for Digital Finance Workshop 2026">'
+    '\n    <meta name="twitter:description" content="Swiss-MENA Research Network | April 21-23, 2026 | Sharjah, UAE">'
+    '\n    <meta name="twitter:image" content="https://images.unsplash.com/photo-1512453979798-5ea266f8880c?w=1200">'
+    '\n'
+)
+
+# Sidebar navigation (href, label)
+SIDEBAR_LINKS = [
+    ("#dates", "Important Dates"),
+    ("#topics", "Topics"),
+    ("#program", "Program"),
+    ("#committee", "Committee"),
+    ("#venue", "Venue"),
+    ("#network", "Network"),
+    ("#partners", "Partners"),
+    ("#cfp", "Call for Papers"),
+]
 
-        <div class="stats-bar">
-            <div class="stat"><span class="num" data-target="80">0</span><span class="label">Participants</span></div>
-            <div class="stat"><span class="num" data-target="6">0</span><span class="label">Topics</span></div>
-            <div class="stat"><span class="num" data-target="3">0</span><span class="label">Days</span></div>
-            <div class="stat"><span class="num" data-target="27">0</span><span class="label">Speakers</span></div>
-        </div>
+def page_chunks(asset_mode="inline", css_mode="inline", lazy_images=False):
+    """Generate index.html section by section"""
+    with stage("people store", "load"), open_store() as store:
+        committee = store.committee()
+
+    network_map = load_image_src(IMAGES_DIR / "network_map.png", asset_mode)
+
+    # Above-the-fold markup, also used to pick the critical CSS
+    sidebar = render_template(
+        'conference_sidebar', logo=LOGO_SVG.replace('<svg', '<svg class="logo"'),
+        links=''.join(f'\n            <a href="{href}">{label}</a>' for href, label in SIDEBAR_LINKS)
+    )
+    hero = '\n' + render_template('conference_hero')
+
+    yield render_template(
+        'head', page_title="AI for Digital Finance 2026 | Swiss-MENA Workshop",
+        page_class=page_class('conference'), head_extra=HEAD_EXTRA,
+        styles=style_tags('conference', css_mode, sidebar + hero)
+    ) + f"\n    {sidebar}"
+
+    yield hero
+
+    yield f'''
 
         <section id="dates">
             <h2>Important Dates</h2>
             <div class="dates">'''
 
     for label, date in DATES:
-        html += f'<div class="date-item"><div class="label">{label}</div><div class="value">{date}</div></div>'
+        yield f'<div class="date-item"><div class="label">{label}</div><div class="value">{date}</div></div>'
 
-    html += '''
+    yield '''
             </div>
         </section>
 
@@ -408,9 +190,9 @@ def generate_html():
             <div class="topics">'''
 
     for topic_name, topic_url in TOPICS:
-        html += f'<a href="{topic_url}" class="topic">{topic_name}</a>'
+        yield f'<a href="{topic_url}" class="topic">{topic_name}</a>'
 
-    html += '''
+    yield '''
             </div>
         </section>
 
@@ -419,13 +201,13 @@ def generate_html():
             <div class="program">'''
 
     for day, date, sessions in PROGRAM:
-        html += f'<div class="day"><div class="day-header">{day} <span>({date})</span></div>'
+        yield f'<div class="day"><div class="day-header">{day} <span>({date})</span></div>'
         for time, title in sessions:
             desc = SESSIONS.get(title, "Session details to be announced.")
-            html += f'<div class="session" onclick="showModal(\'{title}\', \'{desc}\')"><span class="session-time">{time}</span><span class="session-title">{title}</span></div>'
-        html += '</div>'
+            yield f'<div class="session" onclick="showModal(\'{title}\', \'{desc}\')"><span class="session-time">{time}</span><span class="session-title">{title}</span></div>'
+        yield '</div>'
 
-    html += '''
+    yield '''
             </div>
         </section>
 
@@ -435,24 +217,21 @@ def generate_html():
             <div class="committee">'''
 
     for member in committee:
-        photo_file = photo_map.get(member.lower())
-        aff = affiliations.get(member, '')
+        name = member['name']
+        aff = member['affiliation'] or ''
         aff_short = aff.split(',')[0].replace("University of ", "U.").replace("University", "U.")[:25]
-        bio = bios.get(member, '')
+        bio = member['bio'] or ''
 
-        photo_b64 = None
-        if photo_file:
-            photo_b64 = load_image_base64(PEOPLE_ASSETS_DIR / photo_file)
+        photo = load_photo_html(member, asset_mode, lazy_images)
+        if not photo:
+            initials = ''.join(n[0].upper() for n in name.split()[:2] if n)
+            photo = f'<div class="initials">{initials}</div>'
 
         bio_html = f'<div class="bio">{bio}</div>' if bio else ''
 
-        if photo_b64:
-            html += f'<div class="member"><img src="{photo_b64}" alt="{member}"><div class="name">{member}</div><div class="aff">{aff_short}</div>{bio_html}</div>'
-        else:
-            initials = ''.join(n[0].upper() for n in member.split()[:2] if n)
-            html += f'<div class="member"><div class="initials">{initials}</div><div class="name">{member}</div><div class="aff">{aff_short}</div>{bio_html}</div>'
+        yield render_template('committee_card_compact', photo=photo, name=name, affiliation=aff_short, bio=bio_html)
 
-    html += '''
+    yield '''
             </div>
         </section>
 
@@ -473,16 +252,23 @@ def generate_html():
                     <iframe src="https://www.google.com/maps/embed?pb=!1m18!1m12!1m3!1d3607!2d55.505!3d25.286!2m3!1f0!2f0!3f0!3m2!1i1024!2i768!4f13.1!3m3!1m2!1s0x3e5f5f!2sAmerican%20University%20of%20Sharjah!5e0!3m2!1sen!2sae" loading="lazy"></iframe>
                 </div>
             </div>
-        </section>
+        </section>'''
+
+    yield '''
 
         <section id="network">
             <h2>Partner Network</h2>
             <p style="font-size:0.8rem;color:#666;">Core: FHGR (CH) & AUS (UAE) | Partners: Manchester, Renmin, Babes-Bolyai, BFH</p>'''
 
     if network_map:
-        html += f'<img src="{network_map}" alt="Network" class="network-img">'
-
-    html += '''
+        yield '<img src="'
+        yield network_map
+        yield '" alt="Network" class="network-img"'
+        if lazy_images:
+            yield f' {lazy_attrs(IMAGES_DIR / "network_map.png")}'
+        yield '>'
+
+    yield '''
         </section>
 
         <section id="partners">
@@ -490,18 +276,14 @@ def generate_html():
             <div class="partners-grid">'''
 
     for abbr, name, url, country, logo_file in PARTNERS:
-        logo_svg = load_svg(LOGOS_DIR / logo_file)
-        if logo_svg:
-            logo_html = f'<div class="logo">{logo_svg}</div>'
+        logo = load_logo_html(LOGOS_DIR / logo_file, abbr, asset_mode, lazy_images)
+        if logo:
+            logo_html = f'<div class="logo">{logo}</div>'
         else:
             logo_html = f'<div class="logo" style="line-height:40px;font-weight:700;color:#2E5090;">{abbr}</div>'
-        html += f'''<a href="{url}" target="_blank" class="partner">
-                {logo_html}
-                <div class="country">{country}</div>
-                <div class="name">{name}</div>
-            </a>'''
+        yield render_template('partner_card', url=url, logo=logo_html, country=country, name=name)
 
-    html += '''
+    yield '''
             </div>
         </section>
 
@@ -512,7 +294,9 @@ def generate_html():
                 <input type="email" placeholder="Your email address" required>
                 <button type="submit">Subscribe</button>
             </form>
-        </section>
+        </section>'''
+
+    yield '''
 
         <section id="cfp">
             <h2>Call for Papers</h2>
@@ -679,14 +463,45 @@ def generate_html():
 </body>
 </html>'''
 
-    return html
+def generate_html(asset_mode="inline", css_mode="inline", lazy_images=False):
+    """Generate index.html as a single string"""
+    return render(page_chunks(asset_mode, css_mode, lazy_images))
+
+def page_inputs():
+    """Files index.html is built from (recorded in the build manifest)"""
+    inputs = GENERATOR_SOURCES + template_inputs(*PAGE_TEMPLATES) + store_inputs() + [
+        IMAGES_DIR / "network_map.png",
+    ]
+    inputs += [LOGOS_DIR / logo_file for _, _, _, _, logo_file in PARTNERS]
+    return inputs
+
+def build_page(asset_mode="inline", css_mode="inline", lazy_images=False):
+    """Generate and write index.html, return the files it was built from"""
+    write_html(OUTPUT_FILE, page_chunks(asset_mode, css_mode, lazy_images))
+    return page_inputs()
 
 def main():
-    print("Generating compact conference page...")
-    html = generate_html()
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(html)
-    print(f"Generated: {OUTPUT_FILE} ({OUTPUT_FILE.stat().st_size / 1024:.1f} KB)")
+    parser = argparse.ArgumentParser(description="Generate the compact conference page (index.html)")
+    add_asset_mode_argument(parser)
+    add_css_mode_argument(parser)
+    add_lazy_images_argument(parser)
+    add_force_argument(parser)
+    add_verify_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profile_run(args.profile, "generate_conference_page"):
+        gate(args)
+        manifest = BuildManifest()
+        params = build_params(args.css_mode, args.asset_mode, args.lazy_images)
+        if not args.force and manifest.is_fresh(OUTPUT_FILE, params):
+            print(f"Up to date: {OUTPUT_FILE}")
+            return
+
+        print("Generating compact conference page...")
+        manifest.record(OUTPUT_FILE, build_page(args.asset_mode, args.css_mode, args.lazy_images), params)
+        manifest.save()
+        print(f"Generated: {OUTPUT_FILE} ({OUTPUT_FILE.stat().st_size / 1024:.1f} KB)")
 
 if __name__ == "__main__":
     main()
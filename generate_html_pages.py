@@ -1,58 +1,150 @@
 """
-Generate HTML marketing pages for AI for Digital Finance workshop
+Build every page of the AI for Digital Finance website
 
-Main output: ai_digital_finance.html (single comprehensive page)
+Imports the three generators and builds all pages concurrently on a
+process pool, in a single interpreter start:
+- ai_digital_finance.html, budget_internal.html (generate_ai_digital_finance.py)
+- index.html (generate_conference_page.py)
+- topic_*.html (generate_topic_pages.py)
+
+Pages whose inputs are unchanged since the last build are skipped (see
+build_manifest.py). With --minify, each built page is minified in place and
+precompressed to .gz/.br siblings (see html_minifier.py), followed by a size
+report. The committee data is verified first (see committee_checks.py;
+--no-verify skips it). Exits non-zero if the checks or any page fail.
 
 Legacy files (archived):
 - archive/html/workshop_showcase.html
 - archive/html/budget_showcase.html
 """
 
-import subprocess
+import argparse
+import os
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
+import generate_ai_digital_finance as finance_pages
+import generate_conference_page as conference_page
+import generate_topic_pages as topic_pages
+from asset_pipeline import add_asset_mode_argument, add_lazy_images_argument
+from build_manifest import BuildManifest, add_force_argument, build_params
+from committee_checks import add_verify_arguments, gate
+from html_minifier import brotli, optimize_page, precompress, print_size_report
+from stylesheet import add_css_mode_argument, site_stylesheet_url
+
 BASE_DIR = Path(__file__).parent
 
+
+def site_pages(asset_mode, css_mode, lazy_images=False, minify=False):
+    """Return (name, output, builder, params) for every page of the site"""
+    params = build_params(css_mode, asset_mode, lazy_images, minify)
+    css_params = build_params(css_mode, minify=minify)
+    pages = [
+        ("public", finance_pages.OUTPUT_PUBLIC, partial(finance_pages.build_public_page, asset_mode, css_mode, lazy_images), params),
+        ("budget", finance_pages.OUTPUT_BUDGET, partial(finance_pages.build_budget_page, css_mode), css_params),
+        ("index", conference_page.OUTPUT_FILE, partial(conference_page.build_page, asset_mode, css_mode, lazy_images), params),
+    ]
+    for topic_id in topic_pages.TOPICS:
+        pages.append((f"topic_{topic_id}", topic_pages.topic_output(topic_id),
+                      partial(topic_pages.build_topic_page, topic_id, css_mode), css_params))
+    return pages
+
+
+def run_builder(builder, output, minify=False):
+    """Worker: build one page, return (inputs, wall time in seconds, sizes or None)"""
+    start = time.perf_counter()
+    inputs = builder()
+    sizes = optimize_page(output) if minify else None
+    return inputs, time.perf_counter() - start, sizes
+
+
 def main():
-    """Generate the comprehensive HTML page"""
+    parser = argparse.ArgumentParser(description="Build all AI for Digital Finance HTML pages")
+    add_asset_mode_argument(parser)
+    add_css_mode_argument(parser)
+    add_lazy_images_argument(parser)
+    add_force_argument(parser)
+    add_verify_arguments(parser)
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (1 = build in this process)")
+    parser.add_argument('--minify', action='store_true',
+                        help="minify built pages and write precompressed .gz/.br siblings")
+    args = parser.parse_args()
 
     print("=" * 60)
     print("AI for Digital Finance - HTML Generator")
     print("=" * 60)
+    gate(args)
 
-    # Run the main generator script
-    generator_script = BASE_DIR / "generate_ai_digital_finance.py"
+    start = time.perf_counter()
+    manifest = BuildManifest()
+    pages = site_pages(args.asset_mode, args.css_mode, args.lazy_images, args.minify)
+    if args.css_mode != "inline":
+        # Build the shared stylesheet once, before the workers link to it
+        stylesheet = site_stylesheet_url()
+        print(f"  {'stylesheet':<16} {(BASE_DIR / stylesheet).stat().st_size / 1024:8.1f} KB  {stylesheet}")
+        if args.minify:
+            precompress(BASE_DIR / stylesheet)
 
-    if generator_script.exists():
-        print(f"\nRunning: {generator_script.name}")
-        result = subprocess.run(
-            [sys.executable, str(generator_script)],
-            cwd=str(BASE_DIR),
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
-            print(result.stdout)
+    pending = []
+    for name, output, builder, params in pages:
+        if not args.force and manifest.is_fresh(output, params):
+            print(f"  {name:<16} up to date")
         else:
-            print(f"Error: {result.stderr}")
-            return 1
-    else:
-        print(f"Error: Generator script not found: {generator_script}")
-        return 1
+            pending.append((name, output, builder, params))
+
+    results = {}
+    sizes = {}
+    failures = []
+
+    def finish(page, outcome):
+        name, output, _, params = page
+        try:
+            inputs, elapsed, page_sizes = outcome()
+        except Exception:
+            failures.append(name)
+            print(f"  {name:<16} FAILED")
+            traceback.print_exc()
+            return
+        # Recorded after minification, so the manifest sees the final output
+        manifest.record(output, inputs, params)
+        results[name] = elapsed
+        if page_sizes:
+            sizes[output.name] = page_sizes
+        print(f"  {name:<16} {elapsed * 1000:8.1f} ms  {output.stat().st_size / 1024:8.1f} KB  {output.name}")
 
-    # Check output
-    output_file = BASE_DIR / "ai_digital_finance.html"
-    if output_file.exists():
-        print(f"\nOutput: {output_file}")
-        print(f"Size: {output_file.stat().st_size / 1024:.1f} KB")
-        print("\nDone!")
+    if args.jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(pending))) as pool:
+            futures = {pool.submit(run_builder, page[2], page[1], args.minify): page for page in pending}
+            for future in as_completed(futures):
+                finish(futures[future], future.result)
     else:
-        print("Error: Output file was not created")
-        return 1
+        for page in pending:
+            finish(page, partial(run_builder, page[2], page[1], args.minify))
+
+    manifest.save()
 
+    if sizes:
+        print("-" * 60)
+        print_size_report({name: sizes[name] for name in sorted(sizes)})
+        if brotli is None:
+            print("  (brotli is not installed: no .br files written)")
+
+    total_kb = sum(output.stat().st_size for _, output, _, _ in pages if output.exists()) / 1024
+    print("-" * 60)
+    print(f"Built {len(results)}/{len(pending)} pages ({len(pages) - len(pending)} up to date) "
+          f"in {time.perf_counter() - start:.2f} s, site total {total_kb:.1f} KB")
+
+    if failures:
+        print(f"Error: failed to build {', '.join(failures)}")
+        return 1
+    print("\nDone!")
     return 0
 
+
 if __name__ == "__main__":
     sys.exit(main())
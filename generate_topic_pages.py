@@ -2,8 +2,15 @@
 Generate 6 topic detail pages for the conference website
 """
 
+import argparse
 from pathlib import Path
 
+from build_manifest import BuildManifest, add_force_argument, build_params, module_sources
+from build_profiler import add_profile_argument, profile_run
+from html_writer import write_html
+from stylesheet import add_css_mode_argument, page_class, style_tags, stylesheet_inputs
+from template_engine import render_template, template_inputs
+
 BASE_DIR = Path(__file__).parent
 OUTPUT_DIR = BASE_DIR
 
@@ -225,131 +232,73 @@ the evolving regulatory landscape around alternative data usage in investment de
     }
 }
 
-def generate_topic_page(topic_id, topic_data):
-    css = '''
-    :root { --blue: #2E5090; --gold: #D4AF37; --dark: #1a1a2e; --light: #f5f5f5; }
-    * { margin: 0; padding: 0; box-sizing: border-box; }
-    body { font-family: system-ui, -apple-system, sans-serif; font-size: 14px; line-height: 1.6; color: #333; background: var(--light); }
-
-    .header { background: linear-gradient(135deg, var(--blue), #1a3a6e); color: white; padding: 40px 20px; text-align: center; }
-    .header h1 { font-size: 2rem; margin-bottom: 5px; }
-    .header p { opacity: 0.9; font-size: 1.1rem; }
-    .back-link { position: absolute; top: 20px; left: 20px; color: white; text-decoration: none; font-size: 0.9rem; opacity: 0.8; }
-    .back-link:hover { opacity: 1; }
-
-    .container { max-width: 900px; margin: 0 auto; padding: 30px 20px; }
-
-    .section { background: white; border-radius: 8px; padding: 25px; margin-bottom: 20px; box-shadow: 0 2px 8px rgba(0,0,0,0.08); }
-    .section h2 { color: var(--blue); font-size: 1.2rem; margin-bottom: 15px; display: flex; align-items: center; gap: 10px; }
-    .section h2::before { content: ''; width: 4px; height: 20px; background: var(--gold); }
-
-    .description { font-size: 0.95rem; color: #444; text-align: justify; }
-
-    ul { list-style: none; }
-    ul li { padding: 8px 0 8px 25px; position: relative; border-bottom: 1px solid #eee; }
-    ul li:last-child { border-bottom: none; }
-    ul li::before { content: ''; position: absolute; left: 0; top: 14px; width: 8px; height: 8px; background: var(--gold); border-radius: 50%; }
-
-    .cta { text-align: center; margin-top: 30px; }
-    .cta a { display: inline-block; background: var(--blue); color: white; padding: 12px 30px; border-radius: 5px; text-decoration: none; font-weight: 600; transition: background 0.3s; }
-    .cta a:hover { background: #1a3a6e; }
-
-    .topics-nav { display: flex; gap: 10px; flex-wrap: wrap; justify-content: center; margin-bottom: 30px; }
-    .topics-nav a { background: white; color: var(--blue); padding: 8px 15px; border-radius: 20px; text-decoration: none; font-size: 0.85rem; border: 1px solid #ddd; transition: all 0.3s; }
-    .topics-nav a:hover, .topics-nav a.active { background: var(--blue); color: white; border-color: var(--blue); }
-
-    footer { text-align: center; padding: 30px; color: #666; font-size: 0.85rem; }
-    footer a { color: var(--blue); }
-    '''
-
+def generate_topic_page(topic_id, topic_data, css_mode="inline"):
     # Build navigation for other topics
-    nav_html = ''
-    for tid, tdata in TOPICS.items():
-        active = 'active' if tid == topic_id else ''
-        nav_html += f'<a href="topic_{tid}.html" class="{active}">{tdata["title"]}</a>'
-
-    # Build questions list
-    questions_html = ''.join(f'<li>{q}</li>' for q in topic_data['questions'])
-
-    # Build methodologies list
-    methods_html = ''.join(f'<li>{m}</li>' for m in topic_data['methodologies'])
-
-    # Build applications list
-    apps_html = ''.join(f'<li>{a}</li>' for a in topic_data['applications'])
-
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{topic_data['title']} - AI for Digital Finance 2026</title>
-    <style>{css}</style>
-</head>
-<body>
-    <header class="header">
-        <a href="index.html" class="back-link">&larr; Back to Conference</a>
-        <h1>{topic_data['title']}</h1>
-        <p>{topic_data['subtitle']}</p>
-    </header>
-
-    <div class="container">
-        <div class="topics-nav">
-            {nav_html}
-        </div>
-
-        <div class="section">
-            <h2>Overview</h2>
-            <div class="description">
-                {topic_data['description'].strip()}
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>Key Research Questions</h2>
-            <ul>
-                {questions_html}
-            </ul>
-        </div>
-
-        <div class="section">
-            <h2>Methodologies</h2>
-            <ul>
-                {methods_html}
-            </ul>
-        </div>
-
-        <div class="section">
-            <h2>Industry Applications</h2>
-            <ul>
-                {apps_html}
-            </ul>
-        </div>
-
-        <div class="cta">
-            <a href="index.html#topics">Submit Your Research</a>
-        </div>
-    </div>
-
-    <footer>
-        <p>AI for Digital Finance Workshop | April 21-23, 2026 | American University of Sharjah, UAE</p>
-        <p><a href="index.html">Back to Main Conference Page</a></p>
-    </footer>
-</body>
-</html>'''
-
-    return html
+    nav_html = ''.join(
+        render_template('topic_nav_link', topic_id=tid, title=tdata["title"], active='active' if tid == topic_id else '')
+        for tid, tdata in TOPICS.items()
+    )
+
+    def list_html(items):
+        return ''.join(render_template('list_item', text=item) for item in items)
+
+    body = render_template(
+        'topic_body',
+        title=topic_data['title'],
+        subtitle=topic_data['subtitle'],
+        nav=nav_html,
+        description=topic_data['description'].strip(),
+        questions=list_html(topic_data['questions']),
+        methodologies=list_html(topic_data['methodologies']),
+        applications=list_html(topic_data['applications']),
+    )
+
+    # Topic pages are short: the whole body is above the fold
+    head = render_template(
+        'head',
+        page_title=f"{topic_data['title']} - AI for Digital Finance 2026",
+        page_class=page_class('topic'),
+        head_extra='',
+        styles=style_tags('topic', css_mode, body),
+    )
+    return head + '\n' + body
+
+def topic_output(topic_id):
+    return OUTPUT_DIR / f"topic_{topic_id}.html"
+
+def build_topic_page(topic_id, css_mode="inline"):
+    """Generate and write one topic page, return the files it was built from"""
+    write_html(topic_output(topic_id), [generate_topic_page(topic_id, TOPICS[topic_id], css_mode)])
+    # Topic content lives in this file and the templates it renders through
+    return ([Path(__file__)]
+            + module_sources("asset_pipeline", "build_manifest", "html_minifier", "html_writer", "template_engine")
+            + stylesheet_inputs()
+            + template_inputs('head', 'topic_body', 'topic_nav_link', 'list_item'))
 
 def main():
-    print("Generating topic pages...")
-
-    for topic_id, topic_data in TOPICS.items():
-        html = generate_topic_page(topic_id, topic_data)
-        output_file = OUTPUT_DIR / f"topic_{topic_id}.html"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-        print(f"  Created: {output_file.name}")
-
-    print(f"\nGenerated {len(TOPICS)} topic pages")
+    parser = argparse.ArgumentParser(description="Generate the topic detail pages")
+    add_css_mode_argument(parser)
+    add_force_argument(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profile_run(args.profile, "generate_topic_pages"):
+        print("Generating topic pages...")
+
+        manifest = BuildManifest()
+        params = build_params(args.css_mode)
+        generated = 0
+
+        for topic_id in TOPICS:
+            output_file = topic_output(topic_id)
+            if not args.force and manifest.is_fresh(output_file, params):
+                continue
+            manifest.record(output_file, build_topic_page(topic_id, args.css_mode), params)
+            generated += 1
+            print(f"  Created: {output_file.name}")
+
+        manifest.save()
+        print(f"\nGenerated {generated} topic pages ({len(TOPICS) - generated} up to date)")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,231 @@
+"""
+Post-build minification and precompression of the generated pages
+
+minify_html() removes what browsers ignore:
+- comments and template indentation: whitespace runs collapse to a single
+  space, and are dropped next to block-level tags
+- redundant attributes (type="text/javascript", type="text/css", class="")
+- comments and whitespace in inline CSS (<style> blocks and style attributes,
+  see stylesheet.py) and in inline JS
+<pre> and <textarea> content is kept verbatim.
+
+precompress() writes page.html.gz and page.html.br next to a page at maximum
+compression, so static hosting (e.g. nginx gzip_static / brotli_static) can
+serve precompressed bytes instead of compressing each request. Brotli output
+requires the brotli package; without it only .gz files are written.
+html_writer removes both siblings whenever it rewrites a page, so they are
+never stale.
+
+Usage: python html_minifier.py page.html [page.html ...]
+"""
+
+import gzip
+import os
+import re
+import sys
+from pathlib import Path
+
+from html_writer import PRECOMPRESSED_SUFFIXES, write_html
+from stylesheet import minify_css, minify_declarations
+
+try:
+    import brotli
+except ImportError:  # .br output is optional
+    brotli = None
+
+BLOCK_TAGS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'script', 'style', 'noscript',
+    'header', 'footer', 'nav', 'main', 'aside', 'section', 'article', 'div', 'p',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'dl', 'dt', 'dd',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td', 'caption', 'form',
+    'fieldset', 'figure', 'figcaption', 'blockquote', 'hr', 'br', 'iframe',
+    'canvas', 'picture', 'source', 'option', '!doctype',
+}
+RAW_TAGS = {'script', 'style', 'pre', 'textarea'}
+
+# A tag (attribute values may contain '>') or a comment
+TOKEN_RE = re.compile(r"""<!--.*?-->|<(?:[^>"']+|"[^"]*"|'[^']*')*>""", re.S)
+# HTML tag names start with a letter: '< b' or '<0.05' in text is not a tag
+TAG_NAME_RE = re.compile(r"</?([a-zA-Z!][\w-]*)")
+TAG_SPACE_RE = re.compile(r"""("[^"]*"|'[^']*')|\s+""")
+REDUNDANT_ATTR_RE = re.compile(r"""\s(?:type="text/(?:javascript|css)"|class="")(?=[\s/>])""")
+STYLE_ATTR_RE = re.compile(r'\sstyle="([^"]*)"')
+
+
+def _minify_tag(tag):
+    tag = TAG_SPACE_RE.sub(lambda m: m.group(1) or ' ', tag)
+    tag = re.sub(r"\s+(/?>)$", r"\1", tag)
+    tag = REDUNDANT_ATTR_RE.sub('', tag)
+    return STYLE_ATTR_RE.sub(lambda m: f' style="{minify_declarations(m.group(1))}"', tag)
+
+
+def minify_js(code):
+    """Conservative JS minification: indentation, blank lines and comments are dropped
+
+    Line breaks are kept (automatic semicolon insertion relies on them), and
+    lines continuing a multi-line string or template literal are kept as-is.
+    """
+    lines = []
+    quote = None        # string delimiter still open at the end of the previous line
+    in_comment = False  # inside a /* */ comment
+    for line in code.split('\n'):
+        if quote is None:
+            line = line.strip()
+        out = []
+        i = 0
+        while i < len(line):
+            ch = line[i]
+            if in_comment:
+                end = line.find('*/', i)
+                if end < 0:
+                    i = len(line)
+                    continue
+                in_comment = False
+                i = end + 2
+            elif quote:
+                out.append(ch)
+                if ch == '\\':
+                    out.append(line[i + 1:i + 2])
+                    i += 1
+                elif ch == quote:
+                    quote = None
+                i += 1
+            elif ch == '\\':
+                # Escaped character outside a string (e.g. \/ in a regex literal)
+                out.append(line[i:i + 2])
+                i += 2
+            elif line.startswith('//', i):
+                break
+            elif line.startswith('/*', i):
+                in_comment = True
+                i += 2
+            else:
+                if ch in '"\'`':
+                    quote = ch
+                out.append(ch)
+                i += 1
+        line = ''.join(out)
+        if quote != '`':
+            # Only template literals span lines; an unclosed ' or " is not a string
+            quote = None
+            line = line.rstrip()
+        if line:
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+def minify_html(html):
+    """Minified form of a page (see module docstring for what is removed)"""
+    lower = html.lower()
+    tokens = []  # (markup, is_tag, is_block)
+    pos = 0
+    while pos < len(html):
+        match = TOKEN_RE.search(html, pos)
+        end = match.start() if match else len(html)
+        if end > pos:
+            tokens.append((html[pos:end], False, False))
+        if match is None:
+            break
+        pos = match.end()
+        tag = match.group()
+        if tag.startswith('<!--'):
+            if tag.startswith('<!--[if'):
+                tokens.append((tag, True, False))
+            continue
+
+        name = TAG_NAME_RE.match(tag)
+        if name is None:
+            # A bare '<' in text (e.g. "p < 0.05"): keep it and rescan after it
+            tokens.append(('<', False, False))
+            pos = match.start() + 1
+            continue
+        name = name.group(1).lower()
+        tokens.append((_minify_tag(tag), True, name in BLOCK_TAGS))
+        if name in RAW_TAGS and not tag.startswith('</'):
+            close = lower.find(f'</{name}', pos)
+            close = len(html) if close < 0 else close
+            content = html[pos:close]
+            if name == 'script':
+                content = minify_js(content)
+            elif name == 'style':
+                content = minify_css(content)
+            tokens.append((content, True, False))
+            pos = close
+
+    out = []
+    for i, (markup, is_tag, is_block) in enumerate(tokens):
+        if not is_tag:
+            markup = re.sub(r"\s+", ' ', markup)
+            if i == 0 or tokens[i - 1][2]:
+                markup = markup.lstrip()
+            if i + 1 == len(tokens) or tokens[i + 1][2]:
+                markup = markup.rstrip()
+        out.append(markup)
+    return ''.join(out)
+
+
+def _write_bytes(path, data):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def precompress(path):
+    """Write path.gz (and path.br if brotli is available) next to path, return their sizes"""
+    path = Path(path)
+    data = path.read_bytes()
+    sizes = {}
+    # mtime=0 keeps the .gz output reproducible between builds
+    compressed = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        compressed['.br'] = brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+    for suffix in PRECOMPRESSED_SUFFIXES:
+        if suffix in compressed:
+            _write_bytes(path.with_name(path.name + suffix), compressed[suffix])
+            sizes[suffix] = len(compressed[suffix])
+    return sizes
+
+
+def optimize_page(path):
+    """Minify a generated page in place and precompress it
+
+    Returns the page's sizes in bytes: {'raw', 'minified', '.gz'[, '.br']}.
+    """
+    path = Path(path)
+    raw = path.read_text(encoding='utf-8')
+    minified = minify_html(raw)
+    write_html(path, [minified])
+    return {'raw': len(raw.encode('utf-8')), 'minified': len(minified.encode('utf-8')), **precompress(path)}
+
+
+def print_size_report(reports):
+    """Print a table of raw, minified and compressed sizes for {name: sizes}"""
+    print(f"  {'page':<24} {'raw KB':>9} {'min KB':>9} {'gzip KB':>9} {'brotli KB':>10}")
+    totals = {}
+    for name, sizes in reports.items():
+        for key, value in sizes.items():
+            totals[key] = totals.get(key, 0) + value
+        print(_report_line(name, sizes))
+    if len(reports) > 1:
+        print(_report_line('total', totals))
+
+
+def _report_line(name, sizes):
+    brotli_kb = f"{sizes['.br'] / 1024:10.1f}" if '.br' in sizes else f"{'-':>10}"
+    return (f"  {name:<24} {sizes['raw'] / 1024:9.1f} {sizes['minified'] / 1024:9.1f} "
+            f"{sizes['.gz'] / 1024:9.1f} {brotli_kb}")
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip().splitlines()[-1])
+        return 1
+    print_size_report({Path(page).name: optimize_page(page) for page in sys.argv[1:]})
+    if brotli is None:
+        print("Note: brotli is not installed, no .br files written (pip install brotli)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
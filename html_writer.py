@@ -0,0 +1,59 @@
+"""
+Streaming HTML writer for the page generators
+
+Page generators yield their markup section by section; write_html() sends
+each chunk straight to a buffered file handle instead of assembling the whole
+page in memory. DataUri chunks (inline images) are copied from the on-disk
+encode cache in fixed-size blocks, so peak memory scales with the largest
+section rather than with the page.
+"""
+
+import os
+from pathlib import Path
+
+from asset_pipeline import DataUri
+from build_profiler import profile_chunks, profiled
+
+BLOCK_SIZE = 64 * 1024
+
+# Precompressed siblings of a page (see html_minifier.py)
+PRECOMPRESSED_SUFFIXES = ('.gz', '.br')
+
+
+def write_chunks(f, chunks):
+    """Write chunks to an open text file, return the number of characters written"""
+    written = 0
+    for chunk in chunks:
+        if isinstance(chunk, DataUri):
+            written += f.write(chunk.prefix())
+            with chunk.open_payload() as payload:
+                for block in iter(lambda: payload.read(BLOCK_SIZE), b''):
+                    written += f.write(block.decode('ascii'))
+        else:
+            written += f.write(chunk)
+    return written
+
+
+@profiled("write")
+def write_html(path, chunks):
+    """Stream chunks into path, replacing it atomically once complete
+
+    Precompressed siblings of the previous version (page.html.gz/.br) are
+    removed, so they never go stale.
+    """
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8', buffering=BLOCK_SIZE) as f:
+            write_chunks(f, profile_chunks(chunks, path.name))
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    for suffix in PRECOMPRESSED_SUFFIXES:
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def render(chunks):
+    """Join chunks into a single string (for callers that need the whole page)"""
+    return ''.join(str(chunk) for chunk in chunks)
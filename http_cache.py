@@ -0,0 +1,228 @@
+"""
+On-disk HTTP cache shared by the fetch and download scripts
+
+CachedSession is a requests.Session whose GET responses are kept in
+.build_cache/http/. A cached URL is requested again with If-None-Match /
+If-Modified-Since (from the stored ETag / Last-Modified), and a 304 reply is
+answered from the cache, so re-running a script only transfers what changed
+upstream.
+
+- The cache is capped (HTTP_CACHE_MAX_MB, default 256 MB). Least recently
+  used entries are evicted first.
+- Offline mode (--offline where a script has options, or HTTP_CACHE_OFFLINE=1)
+  replays cached responses without touching the network. Uncached URLs
+  raise requests.ConnectionError.
+- HTTP_CACHE_DIR moves the cache, e.g. to a directory of recorded responses.
+
+Usage: python http_cache.py [--clear]   (prints cache statistics)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+BASE_DIR = Path(__file__).parent
+CACHE_DIR = BASE_DIR / ".build_cache" / "http"
+DEFAULT_MAX_MB = 256
+
+# Response headers kept with a cached body
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def _env_flag(name):
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+class HTTPCache:
+    """Response bodies and validators on disk, keyed by URL, with LRU eviction"""
+
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = Path(directory or os.environ.get("HTTP_CACHE_DIR") or CACHE_DIR)
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get("HTTP_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self._total = None  # bytes in the cache, counted on first store
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def lookup(self, url):
+        """(meta, body) cached for url, or None. Marks the entry as recently used."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or meta.get("size") != len(body):
+            return None
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        return meta, body
+
+    def store(self, url, response):
+        """Cache a 200 response's body and validators"""
+        body = response.content
+        meta = {
+            "url": url,
+            "size": len(body),
+            "stored": time.time(),
+            "headers": {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+        }
+        meta_path, body_path = self._paths(url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with self.lock:
+            old_size = body_path.stat().st_size if body_path.exists() else 0
+            for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode("utf-8"))):
+                tmp = path.with_name(path.name + suffix)
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            if self._total is not None:
+                self._total += len(body) - old_size
+            self._evict()
+
+    def _entries(self):
+        """Cached bodies as (last used, size, path), least recently used first"""
+        entries = []
+        for path in self.directory.glob("*.body"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return sorted(entries)
+
+    def _evict(self):
+        if self._total is None:
+            self._total = sum(size for _, size, _ in self._entries())
+        if self._total <= self.max_bytes:
+            return
+        for _, size, body_path in self._entries():
+            if self._total <= self.max_bytes:
+                break
+            for path in (body_path, body_path.with_suffix(".json")):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._total -= size
+
+    def stats(self):
+        entries = self._entries() if self.directory.exists() else []
+        return {"entries": len(entries), "bytes": sum(size for _, size, _ in entries)}
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._total = None
+
+
+def _cached_response(request, meta, body):
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.headers = CaseInsensitiveDict(meta["headers"])
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    response._content = body
+    response._content_consumed = True  # iter_content() on a stream=True request reads the body
+    response.from_cache = True
+    return response
+
+
+class CachedSession(requests.Session):
+    """requests.Session answering GET requests from an HTTPCache when upstream is unchanged"""
+
+    def __init__(self, cache=None, offline=None):
+        super().__init__()
+        self.cache = cache or HTTPCache()
+        self.offline = _env_flag("HTTP_CACHE_OFFLINE") if offline is None else offline
+        self.hits = 0
+        self.misses = 0
+
+    def send(self, request, **kwargs):
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        cached = self.cache.lookup(request.url)
+        if self.offline:
+            if cached is None:
+                raise requests.ConnectionError(f"Not in the HTTP cache (offline mode): {request.url}",
+                                               request=request)
+            self.hits += 1
+            return _cached_response(request, *cached)
+
+        # Redirects copy the previous request's headers, including its validators
+        request.headers.pop("If-None-Match", None)
+        request.headers.pop("If-Modified-Since", None)
+        if cached is not None:
+            headers = cached[0]["headers"]
+            if "etag" in headers:
+                request.headers["If-None-Match"] = headers["etag"]
+            if "last-modified" in headers:
+                request.headers["If-Modified-Since"] = headers["last-modified"]
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self.hits += 1
+            return _cached_response(request, *cached)
+        if getattr(response, "from_cache", False):
+            return response  # redirected to a URL answered from the cache
+        if not response.history:  # redirect targets are counted by their own send()
+            self.misses += 1
+        if response.status_code == 200:
+            self.cache.store(request.url, response)
+        response.from_cache = False
+        return response
+
+    def summary(self):
+        return f"HTTP cache: {self.hits} unchanged, {self.misses} downloaded" + (" (offline)" if self.offline else "")
+
+
+_sessions = {}
+
+
+def cached_session():
+    """CachedSession shared by the calls of a script (one per thread)"""
+    key = threading.get_ident()
+    if key not in _sessions:
+        _sessions[key] = CachedSession()
+    return _sessions[key]
+
+
+def add_offline_argument(parser):
+    """Add the shared --offline option to a script's argument parser"""
+    parser.add_argument(
+        '--offline', action='store_true', default=None,
+        help="answer requests from the HTTP cache only (default: $HTTP_CACHE_OFFLINE)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or clear the shared HTTP cache")
+    parser.add_argument('--clear', action='store_true', help="remove all cached responses")
+    args = parser.parse_args()
+    cache = HTTPCache()
+    if args.clear:
+        cache.clear()
+    stats = cache.stats()
+    print(f"{cache.directory}: {stats['entries']} responses, {stats['bytes'] / 1024 / 1024:.1f} MB "
+          f"(cap {cache.max_bytes / 1024 / 1024:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
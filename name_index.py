@@ -0,0 +1,155 @@
+"""
+Name normalization and lookup shared by the generators and scripts
+
+Person names reach us in several spellings: with and without accents or
+academic titles ("Prof. Dr. ..."), as photo file stems (joerg_osterrieder),
+and as mojibake where UTF-8 text was decoded as Windows-1252
+("Hanna KristÃ­n SkaftadÃ³ttir"). name_key() reduces all of these to one
+key, so joins are plain dict lookups:
+
+    repair_mojibake  "SkaftadÃ³ttir" -> "Skaftadóttir"
+    strip_titles     "Prof. Dr. Jane Doe, PhD" -> "Jane Doe"
+    fold             "Będowska-Sójka" -> "bedowska sojka"
+    name_key         all three, the key NameIndex looks names up by
+    slugify          photo file stem, e.g. "alexandra-ioana_conda"
+
+NameIndex maps keys (of names and their aliases) to records in O(1), and
+falls back to a trigram index for near misses such as typos or dropped
+letters (match()).
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+
+TITLE_RE = re.compile(r'^(?:(?:prof|dr|mr|mrs|ms|assoc|asst)\.?\s+)+|,?\s+(?:ph\.?d|msc|mba)\.?$', re.I)
+
+# Letters NFKD does not decompose into an ASCII base letter
+SPECIAL_LETTERS = str.maketrans({
+    'ß': 'ss', 'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE', 'ø': 'o', 'Ø': 'O', 'ł': 'l', 'Ł': 'L',
+    'đ': 'd', 'Đ': 'D', 'ð': 'd', 'Ð': 'D', 'þ': 'th', 'Þ': 'Th', 'ı': 'i',
+})
+
+# UTF-8 lead bytes as they appear when decoded as Windows-1252: Â..ï
+MOJIBAKE_LEAD_RE = re.compile('[\u00c2-\u00ef]')
+
+
+def _cp1252_bytes(text):
+    out = bytearray()
+    for ch in text:
+        try:
+            out += ch.encode('cp1252')
+        except UnicodeEncodeError:
+            if ord(ch) > 0xff:
+                raise
+            out.append(ord(ch))  # bytes cp1252 leaves undefined decode to U+0080..U+009F
+    return bytes(out)
+
+
+def repair_mojibake(text):
+    """Undo UTF-8 text having been decoded as Windows-1252 (or Latin-1); other text is returned as is"""
+    if not MOJIBAKE_LEAD_RE.search(text):
+        return text
+    # Only valid UTF-8 is accepted, so genuine accented text ("José") stays as it is
+    try:
+        return _cp1252_bytes(text).decode('utf-8')
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return text
+
+
+def strip_titles(name):
+    """Name without leading academic/courtesy titles and trailing degrees"""
+    previous = None
+    while previous != name:
+        previous, name = name, TITLE_RE.sub('', name.strip())
+    return name
+
+
+def to_ascii(text):
+    """Text with accents removed and special letters spelled out in ASCII"""
+    text = unicodedata.normalize('NFKD', text.translate(SPECIAL_LETTERS))
+    return ''.join(ch for ch in text if not unicodedata.combining(ch)).encode('ascii', 'ignore').decode('ascii')
+
+
+def fold(text):
+    """Lowercase ASCII text with punctuation turned into single spaces"""
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', to_ascii(text).lower()).split())
+
+
+def name_key(name):
+    """Lookup key for a person's name: repaired, title-less, folded"""
+    return fold(strip_titles(repair_mojibake(name)))
+
+
+def clean_name(name):
+    """Display form of a name: repaired and without titles, accents kept"""
+    return ' '.join(strip_titles(repair_mojibake(name)).split())
+
+
+def slugify(name):
+    """Photo file stem for a name: ASCII, lowercase, words joined by underscores (hyphens kept)"""
+    name = to_ascii(clean_name(name))
+    safe = re.sub(r'[^\w\s-]', '', name.lower())
+    return re.sub(r'[\s]+', '_', safe.strip())
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Records looked up by any spelling of a name or alias"""
+
+    def __init__(self, records=(), name=lambda record: record['name'], aliases=lambda record: ()):
+        self.by_key = {}
+        self.by_trigram = defaultdict(set)
+        self._trigrams = {}
+        for record in records:
+            self.add(record, name(record), *aliases(record))
+
+    def add(self, record, *names):
+        """Index record under each of names; keys already taken keep their first record"""
+        for spelling in names:
+            key = name_key(spelling) if spelling else ''
+            if not key or key in self.by_key:
+                continue
+            self.by_key[key] = record
+            # Word order doesn't matter for surname-first spellings
+            self.by_key.setdefault(' '.join(sorted(key.split())), record)
+            self._trigrams[key] = trigrams(key)
+            for gram in self._trigrams[key]:
+                self.by_trigram[gram].add(key)
+
+    def get(self, name, default=None):
+        """Record for an exact (normalized) match of name"""
+        key = name_key(name)
+        if key in self.by_key:
+            return self.by_key[key]
+        return self.by_key.get(' '.join(sorted(key.split())), default)
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __len__(self):
+        return len(set(map(id, self.by_key.values())))
+
+    def match(self, name, cutoff=0.6):
+        """(record, score) for name: exact matches score 1.0, otherwise the indexed key
+        with the most similar trigrams (Jaccard similarity >= cutoff); (None, 0.0) if none"""
+        record = self.get(name)
+        if record is not None:
+            return record, 1.0
+        grams = trigrams(name_key(name))
+        shared = defaultdict(int)
+        for gram in grams:
+            for key in self.by_trigram.get(gram, ()):
+                shared[key] += 1
+        best, best_score = None, 0.0
+        for key, count in shared.items():
+            score = count / (len(grams) + len(self._trigrams[key]) - count)
+            if score > best_score or (score == best_score and best is not None and key < best):
+                best, best_score = key, score
+        if best is None or best_score < cutoff:
+            return None, 0.0
+        return self.by_key[best], best_score
@@ -0,0 +1,299 @@
+"""
+Canonical people store for the generators and verification scripts
+
+Person data is scraped into several overlapping JSON files in data/. This
+module imports them once into an SQLite database (.build_cache/people.sqlite)
+with one row per person, indexed by name, slug, affiliation and photo hash,
+so that pages join committee members with their photo, affiliation and bio
+by indexed lookups instead of re-loading and re-joining the JSON files.
+Each photo carries its perceptual hash and status from photo_index, so pages
+skip silhouettes and placeholders with a column check.
+
+Sources, lowest precedence first (non-empty values of a later source win):
+  msca_members_correct.json  name, affiliation, bio, photo
+  msca_members_merged.json   name, affiliation, photo
+  msca_people_named.json     name -> photo
+  msca_bios.json             name -> affiliation, name -> bio
+  scientific_committee.json  committee members, in page order
+msca_people.json is not imported: its photos are unnamed and its
+potential_names include institution names.
+
+Records are merged by name_index.name_key(), so accented, mojibake and
+titled spellings of a name end up in one row; every spelling seen (and the
+photo's file stem) is kept as an alias.
+
+The JSON files stay the scrapers' output format. open_store() re-imports
+whenever one of them (or any image in assets/people, which photo statuses
+depend on) changed since the last import, so the store never serves stale data.
+
+Usage: python people_store.py [--rebuild] [NAME ...]   (statistics, or the rows for NAME)
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+from build_manifest import fingerprint
+from name_index import NameIndex, clean_name, name_key, slugify
+from photo_index import USABLE_STATUSES, image_files, index_inputs, open_index
+
+BASE_DIR = Path(__file__).parent
+DATA_DIR = BASE_DIR / "data"
+PEOPLE_ASSETS_DIR = BASE_DIR / "assets" / "people"
+STORE_PATH = BASE_DIR / ".build_cache" / "people.sqlite"
+SCHEMA_VERSION = 3
+
+SOURCE_FILES = [
+    DATA_DIR / "msca_members_correct.json",
+    DATA_DIR / "msca_members_merged.json",
+    DATA_DIR / "msca_people_named.json",
+    DATA_DIR / "msca_bios.json",
+    DATA_DIR / "scientific_committee.json",
+]
+
+FIELDS = ("name", "slug", "affiliation", "bio", "photo", "photo_hash", "photo_status", "committee_rank")
+
+SCHEMA = """
+CREATE TABLE people (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL UNIQUE,  -- name_index.name_key(name), the join key
+    slug TEXT NOT NULL,             -- photo file stem, e.g. joerg_osterrieder
+    affiliation TEXT,
+    bio TEXT,
+    photo TEXT,                     -- file name in assets/people/
+    photo_hash TEXT,                -- perceptual hash (photo_index.dhash), SHA-256 without Pillow
+    photo_status TEXT,              -- photo_index status: ok, duplicate, conflict, generic, placeholder
+    committee_rank INTEGER          -- position on the scientific committee, NULL if not a member
+);
+CREATE INDEX people_slug ON people (slug);
+CREATE INDEX people_affiliation ON people (affiliation);
+CREATE INDEX people_photo_hash ON people (photo_hash);
+CREATE INDEX people_photo_status ON people (photo_status);
+CREATE INDEX people_committee ON people (committee_rank);
+CREATE TABLE aliases (alias_key TEXT PRIMARY KEY, person_id INTEGER NOT NULL REFERENCES people (id));
+CREATE TABLE sources (path TEXT PRIMARY KEY, fingerprint TEXT NOT NULL);
+"""
+
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def read_sources(data_dir=DATA_DIR):
+    """Merge the JSON files into {name key: person dict}, in first-seen order
+
+    Each person dict has the display name, the merged fields and 'aliases',
+    the set of spellings seen.
+    """
+    people = {}
+
+    def update(name, **values):
+        key = name_key(name)
+        if not key:
+            return
+        person = people.setdefault(key, {'name': clean_name(name), 'aliases': set()})
+        person['aliases'].add(name)
+        person.update({field: value for field, value in values.items() if value not in (None, '')})
+
+    for filename in ("msca_members_correct.json", "msca_members_merged.json"):
+        for member in _load_json(data_dir / filename).get('members', []):
+            update(member['name'], affiliation=member.get('affiliation'), bio=member.get('bio'),
+                   photo=member.get('filename'))
+    for entry in _load_json(data_dir / "msca_people_named.json").get('people', []):
+        update(entry['name'], photo=entry['filename'])
+    bios = _load_json(data_dir / "msca_bios.json")
+    for name, affiliation in bios.get('affiliations', {}).items():
+        update(name, affiliation=affiliation)
+    for name, bio in bios.get('bios', {}).items():
+        update(name, bio=bio)
+    for rank, name in enumerate(_load_json(data_dir / "scientific_committee.json").get('selected', [])):
+        update(name, committee_rank=rank)
+        people[name_key(name)]['name'] = clean_name(name)  # the committee list has the display spelling
+    return people
+
+
+class PeopleStore:
+    """Read-only queries over the people table"""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = Path(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self._index = None
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _rows(self, where="", params=(), order="id"):
+        query = f"SELECT {', '.join(FIELDS)} FROM people {where} ORDER BY {order}"
+        return [dict(row) for row in self.db.execute(query, params)]
+
+    def person(self, name):
+        """The person called name (any spelling or alias), or None"""
+        rows = self._rows("WHERE id = (SELECT person_id FROM aliases WHERE alias_key = ?)", (name_key(name),))
+        return rows[0] if rows else None
+
+    def match(self, name, cutoff=0.6):
+        """(person, score) for name, allowing near misses (see NameIndex.match)"""
+        person = self.person(name)
+        if person is not None:
+            return person, 1.0
+        if self._index is None:
+            self._index = NameIndex(self.all(), aliases=lambda person: self.aliases(person['name']))
+        return self._index.match(name, cutoff)
+
+    def aliases(self, name):
+        """Spellings the person called name was imported under (as keys)"""
+        return [row[0] for row in self.db.execute(
+            "SELECT alias_key FROM aliases WHERE person_id = (SELECT id FROM people WHERE name_key = ?) "
+            "ORDER BY alias_key", (name_key(name),))]
+
+    def committee(self):
+        """Scientific committee members in page order"""
+        return self._rows("WHERE committee_rank IS NOT NULL", order="committee_rank")
+
+    def by_slug(self, slug):
+        return self._rows("WHERE slug = ?", (slug,))
+
+    def by_affiliation(self, affiliation):
+        return self._rows("WHERE affiliation = ?", (affiliation,))
+
+    def by_photo_hash(self, digest):
+        """People whose photo is the same picture (in any size or encoding) as digest"""
+        return self._rows("WHERE photo_hash = ?", (digest,))
+
+    def with_unusable_photos(self):
+        """People whose photo is missing, a placeholder or a generic silhouette"""
+        marks = ', '.join('?' * len(USABLE_STATUSES))
+        return self._rows(f"WHERE photo IS NOT NULL AND (photo_status IS NULL OR photo_status NOT IN ({marks}))",
+                          USABLE_STATUSES)
+
+    def all(self):
+        return self._rows()
+
+    def sources(self):
+        """Files the store was imported from (JSON sources and photos), for build manifests"""
+        return [BASE_DIR / row['path'] for row in self.db.execute("SELECT path FROM sources ORDER BY path")]
+
+
+def _source_fingerprints(db):
+    try:
+        if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            return None
+        return {row[0]: json.loads(row[1]) for row in db.execute("SELECT path, fingerprint FROM sources")}
+    except sqlite3.DatabaseError:
+        return None
+
+
+def _key(path):
+    try:
+        return Path(path).relative_to(BASE_DIR).as_posix()  # no resolve() for the usual BASE_DIR-based paths
+    except ValueError:
+        return Path(path).resolve().relative_to(BASE_DIR.resolve()).as_posix()
+
+
+def is_current(path=STORE_PATH):
+    """True if the store exists and none of its sources changed since it was imported"""
+    if not Path(path).exists():
+        return False
+    db = sqlite3.connect(path)
+    try:
+        recorded = _source_fingerprints(db)
+    finally:
+        db.close()
+    if recorded is None or {_key(p) for p in SOURCE_FILES + image_files()} - recorded.keys():
+        return False
+    for key, previous in recorded.items():
+        current = fingerprint(BASE_DIR / key, previous)
+        if (current is None) != (previous is None) or (current and current['sha256'] != previous['sha256']):
+            return False
+    return True
+
+
+def import_sources(path=STORE_PATH):
+    """(Re)build the store from the JSON files, return the number of people"""
+    people = read_sources()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+
+    with open_index() as index:
+        photos = {row['filename']: row for row in index.all()}
+    db = sqlite3.connect(tmp)
+    with db:
+        db.executescript(SCHEMA)
+        sources = {_key(p): fingerprint(p) for p in SOURCE_FILES}
+        sources.update((_key(PEOPLE_ASSETS_DIR / name), fingerprint(PEOPLE_ASSETS_DIR / name)) for name in photos)
+        for person in people.values():
+            photo = person.get('photo')
+            indexed = photos.get(photo) if photo else None
+            if indexed:
+                person['photo_hash'] = indexed['dhash'] or indexed['sha256']
+                person['photo_status'] = indexed['status']
+            key = name_key(person['name'])
+            person_id = db.execute(
+                "INSERT INTO people (name, name_key, slug, affiliation, bio, photo, photo_hash, photo_status, "
+                "committee_rank) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (person['name'], key, slugify(person['name']), person.get('affiliation'), person.get('bio'),
+                 photo, person.get('photo_hash'), person.get('photo_status'), person.get('committee_rank'))).lastrowid
+            aliases = {name_key(alias) for alias in person['aliases']} | {key}
+            if photo:
+                aliases.add(name_key(Path(photo).stem.replace('_', ' ')))
+            # An alias already taken by another person stays with that person
+            db.executemany("INSERT OR IGNORE INTO aliases (alias_key, person_id) VALUES (?, ?)",
+                           [(alias, person_id) for alias in sorted(aliases) if alias])
+        db.executemany("INSERT INTO sources (path, fingerprint) VALUES (?, ?)",
+                       [(key, json.dumps(fp)) for key, fp in sources.items()])
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    db.close()
+    tmp.replace(path)
+    return len(people)
+
+
+def store_inputs():
+    """Files pages built from the store depend on (for build manifests), photo statuses' inputs included"""
+    return [Path(__file__)] + SOURCE_FILES + index_inputs()
+
+
+def open_store(path=STORE_PATH, rebuild=False):
+    """PeopleStore over an up-to-date import of the JSON files"""
+    if rebuild or not is_current(path):
+        import_sources(path)
+    return PeopleStore(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import data/*.json people files into the people store")
+    parser.add_argument('--rebuild', action='store_true', help="re-import even if no source changed")
+    parser.add_argument('names', nargs='*', help="people to show")
+    args = parser.parse_args()
+
+    with open_store(rebuild=args.rebuild) as store:
+        if args.names:
+            for name in args.names:
+                print(json.dumps(store.person(name), indent=2, ensure_ascii=False))
+            return
+        people = store.all()
+        print(f"{store.path}: {len(people)} people, {len(store.committee())} on the committee, "
+              f"{sum(1 for p in people if p['photo'])} with photos "
+              f"({len(store.with_unusable_photos())} unusable), "
+              f"{sum(1 for p in people if p['affiliation'])} with affiliations, "
+              f"{sum(1 for p in people if p['bio'])} with bios")
+
+
+if __name__ == "__main__":
+    main()
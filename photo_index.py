@@ -0,0 +1,351 @@
+"""
+Perceptual-hash index of the people photos in assets/people
+
+The scrapers save whatever image a profile card shows, so assets/people holds
+the site's generic silhouette under dozens of names, the same portrait saved
+at several sizes, and faces saved under the wrong person's name. Instead of
+judging photos by byte size (the old "> 2000 bytes is a real photo" rule),
+this module indexes every image by a 64-bit difference hash (dHash): the
+grayscale image shrunk to 9x8 pixels, one bit per horizontally adjacent pair.
+Re-encoded or resized copies of a picture differ in a few bits at most, other
+pictures in about half of them.
+
+Images within DUPLICATE_DISTANCE bits of each other form a cluster, and each
+image gets a status:
+  ok           no other image looks like it
+  duplicate    the same picture saved again for the same person (or unnamed
+               person_NN files)
+  conflict     the same face saved under two people's names: one of them is
+               mis-assigned (what scripts/fix_*_photo.py fixed by hand)
+  generic      the same picture saved for GENERIC_MIN_PEOPLE or more people:
+               a silhouette or site graphic, not a portrait
+  placeholder  undecodable, tiny or flat (single-colour) images
+Generators show photos whose status is in USABLE_STATUSES and fall back to
+initials for the rest. Conflicts stay usable, since the index cannot tell
+which of the two names is right; `python photo_index.py` lists them.
+
+Results are kept in .build_cache/photo_index.sqlite. open_index() re-hashes
+only files whose fingerprint changed and re-clusters only if any did. Without
+Pillow, images are clustered by identical content only and the size rule is
+used for placeholders.
+
+Usage: python photo_index.py [--rebuild] [FILE ...]   (report, or the rows for FILE)
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+
+from build_manifest import fingerprint
+from name_index import NameIndex, name_key
+
+try:
+    from PIL import Image, ImageStat
+except ImportError:  # perceptual hashes are optional
+    Image = None
+
+BASE_DIR = Path(__file__).parent
+PEOPLE_ASSETS_DIR = BASE_DIR / "assets" / "people"
+INDEX_PATH = BASE_DIR / ".build_cache" / "photo_index.sqlite"
+SCHEMA_VERSION = 1
+
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+UNNAMED_RE = re.compile(r'^person_\d+$')  # photos scraped before their names were known
+
+DUPLICATE_DISTANCE = 5  # bits; must stay below 8 for the byte-band lookup in clusters()
+GENERIC_MIN_PEOPLE = 3
+MIN_DIMENSION = 32      # pixels
+FLAT_STDDEV = 4.0       # grayscale standard deviation below which an image is a flat fill
+MIN_PHOTO_BYTES = 2000  # placeholder rule without Pillow
+
+USABLE_STATUSES = ("ok", "duplicate", "conflict")
+
+FIELDS = ("filename", "sha256", "size", "width", "height", "dhash", "stddev", "status", "cluster")
+
+SCHEMA = """
+CREATE TABLE photos (
+    filename TEXT PRIMARY KEY,  -- file name in assets/people/
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    dhash TEXT,                 -- 64-bit difference hash as 16 hex digits, NULL without Pillow
+    stddev REAL,                -- grayscale standard deviation
+    status TEXT NOT NULL,       -- see USABLE_STATUSES and the module docstring
+    cluster INTEGER             -- shared by near-identical images, NULL if there are none
+);
+CREATE INDEX photos_dhash ON photos (dhash);
+CREATE INDEX photos_status ON photos (status);
+CREATE INDEX photos_cluster ON photos (cluster);
+"""
+
+
+def image_files(directory=PEOPLE_ASSETS_DIR):
+    """Images in directory, sorted by name"""
+    with os.scandir(directory) as entries:
+        names = sorted(entry.name for entry in entries
+                       if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_SUFFIXES)
+    return [Path(directory) / name for name in names]
+
+
+def index_inputs():
+    """Files photo statuses depend on (for build manifests): every image, since status is relative"""
+    return [Path(__file__)] + image_files()
+
+
+def dhash(image):
+    """64-bit difference hash of a PIL image"""
+    pixels = image.convert('L').resize((9, 8), Image.LANCZOS).tobytes()
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return bits
+
+
+def distance(a, b):
+    """Number of differing bits between two hex hashes"""
+    return bin(int(a, 16) ^ int(b, 16)).count('1')
+
+
+def image_features(path):
+    """{width, height, dhash, stddev} of an image file; all None if it can't be decoded (or without Pillow)"""
+    features = dict.fromkeys(("width", "height", "dhash", "stddev"))
+    if Image is None:
+        return features
+    try:
+        with Image.open(path) as image:
+            image.load()
+            gray = image.convert('L')
+            features.update(width=image.width, height=image.height, dhash=f"{dhash(gray):016x}",
+                            stddev=round(ImageStat.Stat(gray.resize((32, 32))).stddev[0], 2))
+    except (OSError, SyntaxError, ValueError):
+        pass
+    return features
+
+
+def is_placeholder(photo):
+    if Image is None:
+        return photo['size'] <= MIN_PHOTO_BYTES
+    return (photo['dhash'] is None or min(photo['width'], photo['height']) < MIN_DIMENSION
+            or photo['stddev'] < FLAT_STDDEV)
+
+
+def clusters(photos, max_distance=DUPLICATE_DISTANCE):
+    """Groups (lists of filenames, sorted) of near-identical photos, placeholders excluded
+
+    Hashes within max_distance < 8 bits agree exactly in at least one of their
+    eight bytes, so candidates are looked up per byte instead of comparing
+    every pair. Photos without a hash are grouped by identical content.
+    """
+    parent = {}
+
+    def root(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    buckets = defaultdict(list)
+    for photo in photos:
+        if photo['status'] == 'placeholder':
+            continue
+        name = parent[photo['filename']] = photo['filename']
+        candidates = buckets['sha256', photo['sha256']]
+        if photo['dhash']:
+            for band in range(8):
+                candidates = candidates + buckets[band, photo['dhash'][2 * band:2 * band + 2]]
+        for other in candidates:
+            if other['sha256'] == photo['sha256'] or distance(other['dhash'], photo['dhash']) <= max_distance:
+                parent[root(other['filename'])] = root(name)
+        buckets['sha256', photo['sha256']].append(photo)
+        if photo['dhash']:
+            for band in range(8):
+                buckets[band, photo['dhash'][2 * band:2 * band + 2]].append(photo)
+
+    groups = defaultdict(list)
+    for name in parent:
+        groups[root(name)].append(name)
+    return [sorted(group) for group in groups.values() if len(group) > 1]
+
+
+def owners(filenames):
+    """Distinct people the files are named after (person_NN files have no owner)
+
+    Near-identical spellings (alfonso_iodice_d_enza, alfonso_iodice_denza)
+    count as one person.
+    """
+    people = NameIndex(name=lambda key: key)
+    for filename in filenames:
+        stem = Path(filename).stem
+        if UNNAMED_RE.match(stem):
+            continue
+        key = name_key(stem)
+        if key and people.match(key)[0] is None:
+            people.add(key, key)
+    return len(people)
+
+
+def classify(photos):
+    """Set status and cluster on each photo dict (in place)"""
+    by_name = {photo['filename']: photo for photo in photos}
+    for photo in photos:
+        photo['status'] = 'placeholder' if is_placeholder(photo) else 'ok'
+        photo['cluster'] = None
+    for number, group in enumerate(sorted(clusters(photos)), 1):
+        people = owners(group)
+        status = 'generic' if people >= GENERIC_MIN_PEOPLE else 'conflict' if people == 2 else 'duplicate'
+        for filename in group:
+            by_name[filename].update(status=status, cluster=number)
+    return photos
+
+
+class PhotoIndex:
+    """Read-only queries over the photos table"""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = Path(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _rows(self, where="", params=(), order="filename"):
+        query = f"SELECT {', '.join(FIELDS)} FROM photos {where} ORDER BY {order}"
+        return [dict(row) for row in self.db.execute(query, params)]
+
+    def photo(self, filename):
+        """The row for filename (a name in assets/people/), or None"""
+        rows = self._rows("WHERE filename = ?", (Path(filename).name,))
+        return rows[0] if rows else None
+
+    def status(self, filename):
+        """Status of filename, None if it isn't indexed (missing)"""
+        row = self.db.execute("SELECT status FROM photos WHERE filename = ?", (Path(filename).name,)).fetchone()
+        return row[0] if row else None
+
+    def is_usable(self, filename):
+        """True if filename is a real, correctly named portrait as far as the index can tell"""
+        return self.status(filename) in USABLE_STATUSES
+
+    def by_status(self, status):
+        return self._rows("WHERE status = ?", (status,))
+
+    def cluster(self, filename):
+        """Photos near-identical to filename (itself included)"""
+        return self._rows("WHERE cluster = (SELECT cluster FROM photos WHERE filename = ?)", (Path(filename).name,))
+
+    def clusters(self, status=None):
+        """{cluster number: [rows]}, optionally only clusters with status"""
+        groups = defaultdict(list)
+        where, params = ("WHERE cluster IS NOT NULL AND status = ?", (status,)) if status else ("WHERE cluster IS NOT NULL", ())
+        for row in self._rows(where, params, order="cluster, filename"):
+            groups[row['cluster']].append(row)
+        return dict(groups)
+
+    def near(self, digest, max_distance=DUPLICATE_DISTANCE):
+        """Photos whose hash is within max_distance bits of digest"""
+        return [row for row in self._rows("WHERE dhash IS NOT NULL") if distance(row['dhash'], digest) <= max_distance]
+
+    def all(self):
+        return self._rows()
+
+
+def _indexed(db):
+    """{filename: row dict} recorded in db, or None if it has another schema"""
+    try:
+        if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            return None
+        db.row_factory = sqlite3.Row
+        return {row['filename']: dict(row) for row in db.execute("SELECT * FROM photos")}
+    except sqlite3.DatabaseError:
+        return None
+
+
+def update_index(path=INDEX_PATH, directory=PEOPLE_ASSETS_DIR, rebuild=False):
+    """Bring the index up to date with directory, return the number of (re)hashed files"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    try:
+        recorded = None if rebuild else _indexed(db)
+        photos, hashed = [], 0
+        for file in image_files(directory):
+            previous = (recorded or {}).get(file.name)
+            fp = fingerprint(file, previous)
+            if previous and fp['sha256'] == previous['sha256'] and (previous['dhash'] or Image is None):
+                photos.append({**previous, 'mtime_ns': fp['mtime_ns']})
+                continue
+            photos.append({'filename': file.name, **fp, **image_features(file)})
+            hashed += 1
+        if recorded is not None and not hashed and {p['filename'] for p in photos} == recorded.keys():
+            return 0
+
+        classify(photos)
+        with db:
+            if recorded is None:
+                db.executescript("DROP TABLE IF EXISTS photos;" + SCHEMA)
+                db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            else:
+                db.execute("DELETE FROM photos")
+            db.executemany(
+                "INSERT INTO photos (filename, mtime_ns, size, sha256, width, height, dhash, stddev, status, cluster) "
+                "VALUES (:filename, :mtime_ns, :size, :sha256, :width, :height, :dhash, :stddev, :status, :cluster)",
+                photos)
+        return hashed
+    finally:
+        db.close()
+
+
+def open_index(path=INDEX_PATH, rebuild=False):
+    """PhotoIndex over an up-to-date index of assets/people"""
+    update_index(path, rebuild=rebuild)
+    return PhotoIndex(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index assets/people by perceptual hash and report bad photos")
+    parser.add_argument('--rebuild', action='store_true', help="re-hash every image")
+    parser.add_argument('files', nargs='*', help="photos to show (file names in assets/people)")
+    args = parser.parse_args()
+
+    if Image is None:
+        print("Pillow is not installed: photos are only compared by content and size")
+    with open_index(rebuild=args.rebuild) as index:
+        if args.files:
+            for filename in args.files:
+                print(json.dumps(index.photo(filename), indent=2))
+            return
+        photos = index.all()
+        counts = defaultdict(int)
+        for photo in photos:
+            counts[photo['status']] += 1
+        print(f"{index.path}: {len(photos)} photos, "
+              + ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+        for status, title in (("generic", "Generic images (not a portrait)"),
+                              ("conflict", "Same face under different names"),
+                              ("duplicate", "Copies of the same photo")):
+            groups = index.clusters(status)
+            if groups:
+                print(f"\n{title}:")
+                for rows in groups.values():
+                    print("  " + ", ".join(row['filename'] for row in rows))
+        placeholders = index.by_status("placeholder")
+        if placeholders:
+            print(f"\nPlaceholders: {', '.join(row['filename'] for row in placeholders)}")
+
+
+if __name__ == "__main__":
+    main()
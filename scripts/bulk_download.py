@@ -0,0 +1,304 @@
+"""
+Concurrent bulk downloader for the photo scripts
+
+download_batch([(url, filepath), ...]) fetches all images of a scrape at once:
+- asyncio schedules the downloads over one pooled requests session (blocking
+  reads run in worker threads), at most `per_host` at a time per host
+- resumable: bytes are streamed into <file>.part, and an interrupted download
+  continues with a Range request. The ETag (or Last-Modified) the partial
+  download started with is kept in <file>.part.validator and sent as
+  If-Range, so a file that changed upstream meanwhile is fetched from the
+  start instead of being glued onto the stale bytes.
+- revalidated: requests go through the shared HTTP cache (http_cache.py),
+  which makes them conditional and replays them under HTTP_CACHE_OFFLINE=1.
+  Finished files are recorded with their SHA-256 and validators in
+  .downloads.json next to them (written once per batch); on later runs a file
+  unchanged on disk is kept when the cache answers with the same validators
+  (upstream replied 304, or offline replay), so a re-run costs one small
+  request per image and still picks up portraits replaced upstream.
+- content-hash dedupe: each URL is fetched once per batch, files whose
+  content didn't change are not rewritten, and identical images saved under
+  different names are reported (usually a placeholder portrait)
+- atomic writes: a file only appears once it is complete
+- responses smaller than `min_size` bytes (placeholder images) are rejected
+
+LocalSource serves the "remote" files from a local directory instead
+(<dir>/<host>/<path>), as a stand-in for the image server in tests; its
+ETag is the source file's size and mtime.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from http_cache import CachedSession
+
+DEFAULT_PER_HOST = 8
+DEFAULT_WORKERS = 16
+CHUNK_SIZE = 64 * 1024
+MANIFEST_NAME = ".downloads.json"
+VALIDATOR_SUFFIX = ".validator"
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def file_sha256(filepath):
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _validators(headers):
+    """{'etag', 'last_modified'} of a response, as recorded in the download manifest"""
+    return {key: headers[name] for key, name in (('etag', 'ETag'), ('last_modified', 'Last-Modified'))
+            if headers.get(name)}
+
+
+def _resume_validator(part_path):
+    """If-Range value a partial download was started with, or None (don't resume)"""
+    try:
+        return (part_path.parent / (part_path.name + VALIDATOR_SUFFIX)).read_text(encoding='utf-8') or None
+    except OSError:
+        return None
+
+
+def _start_part(part_path, validators):
+    """Note the validator of a download starting from scratch, for If-Range on resume
+
+    Weak ETags can't be used with If-Range; without a usable validator the
+    partial file is never resumed.
+    """
+    marker = part_path.parent / (part_path.name + VALIDATOR_SUFFIX)
+    etag = validators.get('etag', '')
+    value = etag if etag and not etag.startswith('W/') else validators.get('last_modified')
+    if value:
+        marker.write_text(value, encoding='utf-8')
+    else:
+        marker.unlink(missing_ok=True)
+
+
+def _discard_part(part_path):
+    for path in (part_path, part_path.parent / (part_path.name + VALIDATOR_SUFFIX)):
+        path.unlink(missing_ok=True)
+
+
+class HTTPSource:
+    """Streams URLs over a pooled, retrying session backed by the shared HTTP cache
+
+    offline (default: $HTTP_CACHE_OFFLINE) answers every request from the
+    cache; session.summary() reports cache hits and downloads.
+    """
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, headers=None, retries=3, offline=None):
+        retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({"GET"}))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=per_host, max_retries=retry)
+        self.session = CachedSession(offline=offline)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT, **(headers or {})})
+
+    def fetch(self, url, part_path, validators=None):
+        """Write url's content to part_path, return its validators, or None if not modified
+
+        The cache makes the request conditional; validators (from the previous
+        download) tell whether a cached answer is the file already on disk.
+        Bytes already in part_path are resumed only if the upstream file still
+        matches the validator they were downloaded with (If-Range).
+        """
+        headers = {}
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        if_range = _resume_validator(part_path) if offset else None
+        if if_range:
+            headers.update({'Range': f'bytes={offset}-', 'If-Range': if_range})
+        with self.session.get(url, headers=headers, stream=True, timeout=30) as resp:
+            if resp.status_code == 416 and if_range:
+                # Range not satisfiable: start over
+                _discard_part(part_path)
+                return self.fetch(url, part_path, validators)
+            resp.raise_for_status()
+            current = _validators(resp.headers)
+            if resp.from_cache and validators and current == validators:
+                # Upstream answered 304 (or offline replay): the file on disk is current
+                return None
+            # 200 instead of 206: no resume, the file changed upstream or the server ignored the range
+            resumed = resp.status_code == 206
+            if not resumed:
+                _start_part(part_path, current)
+            with open(part_path, 'ab' if resumed else 'wb') as f:
+                for chunk in resp.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+            return current
+
+
+class LocalSource:
+    """Serves URLs from files under root (<root>/<host>/<path>)"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path_for(self, url):
+        parsed = urlparse(url)
+        return self.root / parsed.netloc / unquote(parsed.path).lstrip('/')
+
+    def fetch(self, url, part_path, validators=None):
+        source = self.path_for(url)
+        if not source.is_file():
+            raise FileNotFoundError(f"No local copy of {url} ({source})")
+        st = source.stat()
+        current = {'etag': f'"{st.st_size:x}-{st.st_mtime_ns:x}"'}
+        if validators and validators.get('etag') == current['etag']:
+            return None
+        resumed = part_path.exists() and _resume_validator(part_path) == current['etag']
+        if not resumed:
+            _start_part(part_path, current)
+        with open(source, 'rb') as src, open(part_path, 'ab' if resumed else 'wb') as dst:
+            src.seek(part_path.stat().st_size if resumed else 0)
+            shutil.copyfileobj(src, dst)
+        return current
+
+
+def _load_manifest(directory):
+    try:
+        return json.loads((directory / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(directory, manifest):
+    path = directory / MANIFEST_NAME
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def _write_atomic(filepath, data):
+    tmp = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, filepath)
+
+
+class _Batch:
+    def __init__(self, source, per_host, workers, min_size):
+        self.source = source
+        self.per_host = per_host
+        self.min_size = min_size
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        self.manifests = {}
+        self.changed = set()  # directories whose manifest needs saving
+
+    def manifest(self, directory):
+        if directory not in self.manifests:
+            self.manifests[directory] = _load_manifest(directory)
+        return self.manifests[directory]
+
+    def save(self):
+        """Write the manifests of the directories that received files (once per batch)"""
+        for directory in self.changed:
+            _save_manifest(directory, self.manifests[directory])
+        self.changed.clear()
+
+    def is_current(self, url, filepath):
+        """True if filepath was downloaded from url and hasn't changed since"""
+        entry = self.manifest(filepath.parent).get(filepath.name)
+        return (entry is not None and entry['url'] == url and filepath.exists()
+                and filepath.stat().st_size == entry['size'] and file_sha256(filepath) == entry['sha256'])
+
+    async def download(self, url, filepaths):
+        """Fetch url once and save it to every path in filepaths, return their results"""
+        loop = asyncio.get_running_loop()
+        validators = None
+        if all(self.is_current(url, path) for path in filepaths):
+            # Revalidate instead of assuming: a 304 keeps the files
+            entry = self.manifest(filepaths[0].parent)[filepaths[0].name]
+            validators = {key: entry[key] for key in ('etag', 'last_modified') if key in entry}
+
+        part = filepaths[0].with_name(filepaths[0].name + '.part')
+        part.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            async with self.host_limits[urlparse(url).netloc]:
+                fetched = await loop.run_in_executor(self.executor, self.source.fetch, url, part, validators or None)
+            if fetched is None:
+                return [{'url': url, 'filepath': path, 'status': 'current', 'size': path.stat().st_size,
+                         'sha256': self.manifest(path.parent)[path.name]['sha256']} for path in filepaths]
+            data = part.read_bytes()
+        except Exception as e:
+            return [{'url': url, 'filepath': path, 'status': 'failed', 'error': str(e)} for path in filepaths]
+        _discard_part(part)
+        if len(data) < self.min_size:
+            return [{'url': url, 'filepath': path, 'status': 'failed',
+                     'error': f"only {len(data)} bytes (placeholder?)"} for path in filepaths]
+
+        sha = hashlib.sha256(data).hexdigest()
+        results = []
+        for path in filepaths:
+            status = 'unchanged' if path.exists() and file_sha256(path) == sha else 'downloaded'
+            if status == 'downloaded':
+                _write_atomic(path, data)
+            self.manifest(path.parent)[path.name] = {'url': url, 'size': len(data), 'sha256': sha, **fetched}
+            self.changed.add(path.parent)
+            results.append({'url': url, 'filepath': path, 'status': status, 'size': len(data), 'sha256': sha})
+        return results
+
+
+async def download_all(jobs, source=None, per_host=DEFAULT_PER_HOST, workers=DEFAULT_WORKERS, min_size=0,
+                       headers=None):
+    """Download (url, filepath) jobs concurrently, return one result dict per job, in order
+
+    Each result has url, filepath and status: 'downloaded', 'unchanged' (same
+    content as the file on disk), 'current' (unchanged on disk and upstream
+    since the last download: 304), 'duplicate' (an earlier job saves another
+    URL to the same file)
+    or 'failed' (with an error), plus size and sha256 for saved files.
+    """
+    jobs = [(url, Path(filepath)) for url, filepath in jobs]
+    batch = _Batch(source or HTTPSource(per_host, headers), per_host, workers, min_size)
+    paths_by_url = defaultdict(list)
+    url_by_path = {}
+    for url, filepath in jobs:
+        if url_by_path.setdefault(filepath, url) == url and filepath not in paths_by_url[url]:
+            paths_by_url[url].append(filepath)
+    try:
+        groups = await asyncio.gather(*(batch.download(url, paths) for url, paths in paths_by_url.items()))
+    finally:
+        batch.executor.shutdown(wait=False)
+        batch.save()
+    by_job = {(r['url'], r['filepath']): r for results in groups for r in results}
+    return [by_job.get(job) or {'url': job[0], 'filepath': job[1], 'status': 'duplicate'} for job in jobs]
+
+
+def download_batch(jobs, **options):
+    """Blocking download_all() for the synchronous scripts"""
+    return asyncio.run(download_all(jobs, **options))
+
+
+def duplicate_files(results):
+    """Groups (lists of paths) of different files saved with identical content"""
+    paths_by_hash = defaultdict(set)
+    for result in results:
+        if 'sha256' in result:
+            paths_by_hash[result['sha256']].add(result['filepath'])
+    return [sorted(paths) for paths in paths_by_hash.values() if len(paths) > 1]
+
+
+def print_summary(results):
+    counts = defaultdict(int)
+    for result in results:
+        counts[result['status']] += 1
+    print("Downloads: " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    for paths in duplicate_files(results):
+        print(f"  Identical images: {', '.join(path.name for path in paths)}")
@@ -4,42 +4,39 @@ Comprehensive scraper that captures every person's photo
 """
 
 import json
-import re
-import time
-import requests
-import unicodedata
+import sys
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from bulk_download import HTTPSource, download_batch, print_summary
+from msca_browser import open_people_page
+from msca_scraper import extract_person_photos, high_res_url
+from name_index import slugify
+from photo_index import open_index
 ASSETS_DIR = BASE_DIR / "assets" / "people"
 DATA_DIR = BASE_DIR / "data"
 
 ASSETS_DIR.mkdir(parents=True, exist_ok=True)
 
-def sanitize_filename(name):
-    """Convert name to safe filename"""
-    name = re.sub(r'^(Prof\.|Dr\.|Mr\.|Ms\.|Mrs\.)\s*', '', name)
-    name = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('ASCII')
-    safe = re.sub(r'[^\w\s-]', '', name.lower())
-    safe = re.sub(r'[\s]+', '_', safe.strip())
-    return safe
-
-def download_image(url, filepath):
-    """Download image and return success, size"""
-    try:
-        # Get higher resolution version
-        url = re.sub(r'/w_\d+,h_\d+', '/w_400,h_400', url)
-        url = re.sub(r'fill/w_\d+,h_\d+', 'fill/w_400,h_400', url)
-
-        resp = requests.get(url, timeout=15)
-        if resp.status_code == 200 and len(resp.content) > 2000:
-            with open(filepath, 'wb') as f:
-                f.write(resp.content)
-            return True, len(resp.content)
-    except Exception as e:
-        pass
-    return False, 0
+def download_images(jobs):
+    """Download (name, url, filepath) jobs concurrently, return {name: {'filename', 'size', 'status'}} of the saved ones
+
+    Files from earlier runs are revalidated with a conditional request, so a
+    re-run only transfers the portraits that changed upstream.
+    """
+    source = HTTPSource()
+    results = download_batch([(high_res_url(url), filepath) for _, url, filepath in jobs], source=source,
+                             min_size=2000)
+    print_summary(results)
+    print(source.session.summary())
+    saved = {}
+    for (name, _, filepath), result in zip(jobs, results):
+        if result['status'] != 'failed':
+            saved[name] = {'filename': filepath.name, 'size': result['size'], 'status': result['status']}
+    return saved
 
 def scrape_all_photos():
     """Scrape all photos with their associated names"""
@@ -50,98 +47,13 @@ def scrape_all_photos():
         browser = p.chromium.launch(headless=True)
         page = browser.new_page()
 
-        print("Loading MSCA Our People page...")
-        page.goto("https://www.digital-finance-msca.com/our-people", wait_until="networkidle")
-        time.sleep(4)
-
-        # Scroll extensively to load all lazy-loaded images
-        print("Scrolling to load all content...")
-        page_height = page.evaluate("document.body.scrollHeight")
-
-        for i in range(30):
-            page.evaluate(f"window.scrollTo(0, {i * 400})")
-            time.sleep(0.25)
-
-        # Scroll back up
-        page.evaluate("window.scrollTo(0, 0)")
-        time.sleep(2)
-
-        # Scroll down again slowly
-        for i in range(40):
-            page.evaluate(f"window.scrollTo(0, {i * 300})")
-            time.sleep(0.15)
+        # Scroll until all lazy-loaded cards and images are in
+        open_people_page(page)
 
         print("Extracting all person data...")
 
         # Extract all person cards with images and names
-        people_data = page.evaluate(r'''() => {
-            const people = [];
-            const processedImages = new Set();
-
-            // Get all images
-            const allImages = document.querySelectorAll('img');
-
-            allImages.forEach(img => {
-                const src = img.src || img.dataset.src || '';
-                if (!src) return;
-                if (!src.includes('wixstatic.com')) return;
-                if (processedImages.has(src)) return;
-
-                // Skip very small images (icons)
-                const rect = img.getBoundingClientRect();
-                if (rect.width < 40 || rect.height < 40) return;
-
-                processedImages.add(src);
-
-                // Find the name associated with this image
-                // Look in parent containers for text that looks like a name
-                let name = '';
-                let container = img.parentElement;
-
-                for (let level = 0; level < 6 && container; level++) {
-                    // Look for text elements
-                    const textElements = container.querySelectorAll('p, span, div, h1, h2, h3, h4, h5, h6');
-
-                    for (const el of textElements) {
-                        if (el.contains(img)) continue; // Skip if contains the image
-
-                        const text = el.innerText.trim();
-                        if (!text || text.length < 4 || text.length > 50) continue;
-
-                        // Check if it looks like a person's name
-                        const words = text.split(/\s+/);
-                        if (words.length < 2 || words.length > 5) continue;
-
-                        // Must start with capital letters
-                        const looksLikeName = words.every(w => /^[A-Z]/.test(w));
-                        if (!looksLikeName) continue;
-
-                        // Skip institution names
-                        if (/University|Institute|Center|School|Department|Research|European|Horizon/i.test(text)) continue;
-
-                        // Skip dates and common non-name patterns
-                        if (/^\d|January|February|March|April|May|June|July|August|September|October|November|December/i.test(text)) continue;
-
-                        name = text;
-                        break;
-                    }
-
-                    if (name) break;
-                    container = container.parentElement;
-                }
-
-                if (name) {
-                    people.push({
-                        name: name,
-                        imageUrl: src,
-                        width: rect.width,
-                        height: rect.height
-                    });
-                }
-            });
-
-            return people;
-        }''')
+        people_data = extract_person_photos(page)
 
         print(f"Found {len(people_data)} people with images")
 
@@ -157,20 +69,20 @@ def main():
     with open(DATA_DIR / "scientific_committee.json", 'r') as f:
         committee = json.load(f)['selected']
 
-    committee_lower = {sanitize_filename(c): c for c in committee}
-
     # Scrape all photos
     people = scrape_all_photos()
 
     # Download all photos
     print("\nDownloading photos...")
     downloaded = {}
+    jobs = []
+    index = open_index()
 
     for person in people:
         name = person['name']
         url = person['imageUrl']
 
-        filename = sanitize_filename(name)
+        filename = slugify(name)
         if not filename:
             continue
 
@@ -178,18 +90,21 @@ def main():
         ext = '.png' if '.png' in url.lower() else '.jpg'
         filepath = ASSETS_DIR / (filename + ext)
 
-        # Skip if already have a good version
-        if filepath.exists() and filepath.stat().st_size > 5000:
+        # A real portrait we already have is kept even if its revalidation fails
+        if index.is_usable(filepath):
             downloaded[name] = {'filename': filename + ext, 'size': filepath.stat().st_size}
-            continue
 
-        success, size = download_image(url, filepath)
-        if success:
-            downloaded[name] = {'filename': filename + ext, 'size': size}
-            try:
-                print(f"  Downloaded: {name} ({size/1024:.1f} KB)")
-            except:
-                print(f"  Downloaded: [name] ({size/1024:.1f} KB)")
+        jobs.append((name, url, filepath))
+
+    index.close()
+    for name, info in download_images(jobs).items():
+        downloaded[name] = {'filename': info['filename'], 'size': info['size']}
+        if info['status'] != 'downloaded':
+            continue
+        try:
+            print(f"  Downloaded: {name} ({info['size']/1024:.1f} KB)")
+        except:
+            print(f"  Downloaded: [name] ({info['size']/1024:.1f} KB)")
 
     print(f"\nTotal downloaded/existing: {len(downloaded)}")
 
@@ -200,15 +115,16 @@ def main():
 
     found = 0
     missing = []
+    index = open_index()  # re-indexes the new downloads
 
     for member in committee:
-        member_fn = sanitize_filename(member)
+        member_fn = slugify(member)
 
         # Check for photo file
         has_photo = False
         for ext in ['.jpg', '.png']:
             fpath = ASSETS_DIR / (member_fn + ext)
-            if fpath.exists() and fpath.stat().st_size > 3000:
+            if index.is_usable(fpath):
                 has_photo = True
                 found += 1
                 try:
@@ -238,7 +154,7 @@ def main():
     mappings = {'people': [], 'source': 'https://www.digital-finance-msca.com/our-people'}
 
     for fpath in ASSETS_DIR.glob('*.*'):
-        if fpath.suffix.lower() in ['.jpg', '.png'] and fpath.stat().st_size > 3000:
+        if fpath.suffix.lower() in ['.jpg', '.png'] and index.is_usable(fpath):
             name_parts = fpath.stem.replace('_', ' ').replace('-', ' ').title().split()
             name = ' '.join(name_parts)
             mappings['people'].append({
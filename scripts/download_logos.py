@@ -3,8 +3,10 @@ Download partner university logos using Playwright for dynamic pages
 """
 
 import asyncio
+import sys
 import requests
 from pathlib import Path
+from urllib.parse import urlparse
 
 try:
     from playwright.async_api import async_playwright
@@ -14,12 +16,14 @@ except ImportError:
 
 try:
     from PIL import Image
-    from io import BytesIO
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+from http_cache import cached_session
+
 LOGOS_DIR = BASE_DIR / "assets" / "logos"
 LOGOS_DIR.mkdir(exist_ok=True)
 
@@ -29,8 +33,31 @@ DIRECT_URLS = {
     "bfh": "https://www.bfh.ch/dam/jcr:4e0d4ddb-6c08-4dc3-9f9f-f5c7d5d45f1e/BFH_Logo_A_de_100_4f.png",
 }
 
-async def download_with_playwright():
-    """Use Playwright to screenshot logos from websites"""
+def download_direct_logos():
+    """Download the logos with a direct URL (revalidated through the HTTP cache), return their names"""
+    session = cached_session()
+    saved = set()
+
+    for name, url in DIRECT_URLS.items():
+        try:
+            resp = session.get(url, timeout=15)
+        except requests.RequestException as e:
+            print(f"  {name}: {e}")
+            continue
+        if resp.status_code != 200:
+            print(f"  {name}: HTTP {resp.status_code}")
+            continue
+
+        output = LOGOS_DIR / f"{name}{Path(urlparse(url).path).suffix.lower() or '.png'}"
+        if not output.exists() or output.read_bytes() != resp.content:
+            output.write_bytes(resp.content)
+        print(f"  {name}: {output.name} ({'unchanged' if resp.from_cache else 'downloaded'})")
+        saved.add(name)
+
+    return saved
+
+async def download_with_playwright(skip=()):
+    """Use Playwright to screenshot logos from websites (except the names in skip)"""
     if not HAS_PLAYWRIGHT:
         print("Playwright not available")
         return
@@ -48,6 +75,8 @@ async def download_with_playwright():
         browser = await p.chromium.launch(headless=True)
 
         for name, url, selector in universities:
+            if name in skip:
+                continue
             print(f"\n{name.upper()}: {url}")
             try:
                 page = await browser.new_page()
@@ -99,10 +128,14 @@ def main():
     print("Partner University Logos")
     print("=" * 50)
 
-    # Try Playwright first
+    print("\nDownloading logos with direct URLs...")
+    direct = download_direct_logos()
+    print(cached_session().summary())
+
+    # Try Playwright for the others
     if HAS_PLAYWRIGHT:
         print("\nTrying to download logos with Playwright...")
-        asyncio.run(download_with_playwright())
+        asyncio.run(download_with_playwright(skip=direct))
 
     # Check what we got
     existing = list(LOGOS_DIR.glob("*.png")) + list(LOGOS_DIR.glob("*.svg"))
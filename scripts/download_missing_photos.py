@@ -3,13 +3,15 @@ Download photos for specific missing committee members
 """
 
 from playwright.sync_api import sync_playwright
-import requests
-import time
+import sys
 import re
-import unicodedata
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+from http_cache import cached_session
+from name_index import slugify
+from msca_browser import open_people_page
 ASSETS_DIR = BASE_DIR / "assets" / "people"
 
 MISSING = [
@@ -23,17 +25,11 @@ MISSING = [
     'Rezarta Perri'
 ]
 
-def sanitize(name):
-    name = re.sub(r'^(Prof\.|Dr\.|Mr\.|Ms\.)\s*', '', name)
-    name = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('ASCII')
-    safe = re.sub(r'[^\w\s-]', '', name.lower())
-    return re.sub(r'[\s]+', '_', safe.strip())
-
 def download(url, filepath):
     try:
         url = re.sub(r'/w_\d+,h_\d+', '/w_400,h_400', url)
         url = re.sub(r'fill/w_\d+,h_\d+', 'fill/w_400,h_400', url)
-        resp = requests.get(url, timeout=15)
+        resp = cached_session().get(url, timeout=15)
         if resp.status_code == 200 and len(resp.content) > 2000:
             with open(filepath, 'wb') as f:
                 f.write(resp.content)
@@ -48,13 +44,8 @@ def main():
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         page = browser.new_page()
-        page.goto('https://www.digital-finance-msca.com/our-people', wait_until='networkidle')
-        time.sleep(5)
-
-        # Scroll to load all
-        for i in range(40):
-            page.evaluate(f'window.scrollTo(0, {i*350})')
-            time.sleep(0.2)
+        # Scroll until all lazy-loaded images are in
+        open_people_page(page)
 
         for name in MISSING:
             print(f"\nSearching for: {name}")
@@ -63,7 +54,6 @@ def main():
                 # Find the name element
                 name_el = page.locator(f'text="{name}"').first
                 name_el.scroll_into_view_if_needed()
-                time.sleep(0.3)
 
                 # Get position
                 box = name_el.bounding_box()
@@ -97,7 +87,7 @@ def main():
                 if img_url:
                     print(f"  Found image: {img_url[:60]}...")
 
-                    fn = sanitize(name)
+                    fn = slugify(name)
                     ext = '.png' if '.png' in img_url else '.jpg'
                     fpath = ASSETS_DIR / (fn + ext)
 
@@ -114,6 +104,7 @@ def main():
 
         browser.close()
 
+    print(cached_session().summary())
     print("\nDone!")
 
 if __name__ == "__main__":
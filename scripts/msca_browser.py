@@ -0,0 +1,214 @@
+"""
+Event-driven page loading for the MSCA scrapers
+
+The "Our people" page is a Wix page whose person cards and photos load
+lazily as they scroll into view. open_people_page() replaces the fixed
+sleep-and-scroll loops: after navigation it waits for network idle, then
+scrolls one viewport at a time. After each step it waits until the images
+that came into view (IntersectionObserver) have loaded and the DOM has
+stopped changing (MutationObserver). It stops as soon as the bottom of the
+page is reached without new cards appearing, so a run takes as long as the
+page takes to load, not a fixed 30+ seconds.
+
+Offline capture and replay: `python scripts/msca_browser.py capture` loads
+the live page once and saves a snapshot directory (.build_cache/msca_snapshot/
+by default) holding
+  page.har.zip   every response the page loaded (HAR, bodies attached)
+  page.html      the fully loaded DOM, scripts removed
+  snapshot.json  URL, capture date and card count
+MSCA_SNAPSHOT=<snapshot dir> (or --snapshot in msca_scraper.py) makes the
+scrapers replay it: Playwright's router stands in for the site, answering the
+page URL with the captured DOM and every other request from the HAR, and
+aborting anything that wasn't captured. Nothing is fetched from the network
+and the lazy-loading scroll is skipped, so extraction code can be iterated on
+and benchmarked (msca_scraper.py --bench) in milliseconds against a fixed page.
+
+MSCA_SNAPSHOT=page.html still loads a single saved copy of the page
+(e.g. "Save page as..." in a browser) instead of the live site.
+
+Usage: python scripts/msca_browser.py capture [--dir DIR] [--headed]
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+MSCA_PEOPLE_URL = "https://www.digital-finance-msca.com/our-people"
+
+SNAPSHOT_DIR = Path(__file__).parent.parent / ".build_cache" / "msca_snapshot"
+HAR_NAME = "page.har.zip"
+DOM_NAME = "page.html"
+META_NAME = "snapshot.json"
+
+VIEWPORT = {'width': 1920, 'height': 1080}  # layout the extractors see, live and replayed
+
+CARD_SELECTOR = "img"  # cards are counted by their photos
+QUIET_MS = 300         # a step is done once the DOM has been unchanged this long...
+STEP_TIMEOUT_MS = 5000  # ...or after this long
+MAX_STEPS = 200
+
+# Scrolls through the page, returns {steps, cards, timeouts, ms}
+SCROLL_UNTIL_LOADED_JS = r'''async ({selector, quietMs, stepTimeoutMs, maxSteps}) => {
+    const start = performance.now();
+    let lastMutation = start;
+    const pending = new Set();
+
+    // Images in view that are still loading
+    const watchImage = (img) => {
+        if (img.complete && img.naturalWidth) return;
+        const loaded = new Promise(resolve => {
+            img.addEventListener('load', resolve, {once: true});
+            img.addEventListener('error', resolve, {once: true});
+        });
+        pending.add(loaded);
+        loaded.then(() => pending.delete(loaded));
+    };
+    const visible = new IntersectionObserver(entries => {
+        for (const entry of entries) {
+            if (entry.isIntersecting) {
+                watchImage(entry.target);
+                visible.unobserve(entry.target);
+            }
+        }
+    });
+    const observeImages = (root) => root.querySelectorAll('img').forEach(img => visible.observe(img));
+
+    const changes = new MutationObserver(records => {
+        lastMutation = performance.now();
+        for (const record of records) {
+            if (record.type === 'attributes') {
+                visible.observe(record.target);  // lazy image got its real src
+            }
+            for (const node of record.addedNodes) {
+                if (node.nodeType !== Node.ELEMENT_NODE) continue;
+                if (node.tagName === 'IMG') visible.observe(node);
+                else observeImages(node);
+            }
+        }
+    });
+    changes.observe(document.body, {childList: true, subtree: true, attributes: true,
+                                    attributeFilter: ['src', 'srcset']});
+    observeImages(document);
+
+    // Resolves true once no image is loading and the DOM is quiet, false on timeout
+    const settle = async () => {
+        const deadline = performance.now() + stepTimeoutMs;
+        while (performance.now() < deadline) {
+            await new Promise(resolve => setTimeout(resolve, 50));
+            if (pending.size === 0 && performance.now() - lastMutation >= quietMs) return true;
+        }
+        return false;
+    };
+
+    let steps = 0;
+    let timeouts = 0;
+    let cards = document.querySelectorAll(selector).length;
+    if (!await settle()) timeouts++;
+    while (steps < maxSteps) {
+        const before = cards;
+        window.scrollBy(0, window.innerHeight);
+        steps++;
+        if (!await settle()) timeouts++;
+        cards = document.querySelectorAll(selector).length;
+        const atBottom = window.scrollY + window.innerHeight >= document.documentElement.scrollHeight - 1;
+        if (atBottom && cards === before) break;
+    }
+
+    changes.disconnect();
+    visible.disconnect();
+    window.scrollTo(0, 0);
+    return {steps, cards, timeouts, ms: Math.round(performance.now() - start)};
+}'''
+
+
+def people_page_url(snapshot=None):
+    """URL of the people page: the live site, or a file:// URL of a saved snapshot"""
+    snapshot = snapshot or os.environ.get("MSCA_SNAPSHOT")
+    if snapshot and not Path(snapshot).is_dir():
+        return Path(snapshot).resolve().as_uri()
+    return MSCA_PEOPLE_URL
+
+
+def strip_scripts(html):
+    """Remove <script> elements so a captured DOM is not re-rendered when replayed"""
+    return re.sub(r'<script\b[^>]*>.*?</script\s*>', '', html, flags=re.S | re.I)
+
+
+def replay_snapshot(page, directory):
+    """Route page's requests to the snapshot in directory, return the captured page URL"""
+    directory = Path(directory)
+    meta = json.loads((directory / META_NAME).read_text(encoding='utf-8'))
+    html = (directory / DOM_NAME).read_text(encoding='utf-8')
+    page.route_from_har(directory / HAR_NAME, not_found='abort')
+    # Routes registered later take precedence over the HAR
+    page.route(meta['url'], lambda route: route.fulfill(status=200, content_type='text/html; charset=utf-8',
+                                                       body=html))
+    return meta['url']
+
+
+def load_all_cards(page, selector=CARD_SELECTOR, quiet_ms=QUIET_MS, step_timeout_ms=STEP_TIMEOUT_MS,
+                   max_steps=MAX_STEPS):
+    """Scroll until every lazily loaded card is in the DOM, return the scroll statistics"""
+    stats = page.evaluate(SCROLL_UNTIL_LOADED_JS, {
+        'selector': selector, 'quietMs': quiet_ms, 'stepTimeoutMs': step_timeout_ms, 'maxSteps': max_steps,
+    })
+    print(f"Loaded {stats['cards']} cards in {stats['steps']} scroll steps ({stats['ms'] / 1000:.1f}s"
+          + (f", {stats['timeouts']} step timeouts" if stats['timeouts'] else "") + ")")
+    return stats
+
+
+def open_people_page(page, snapshot=None, url=None, **options):
+    """Open the people page (or a snapshot of it) in page and load all of its cards"""
+    snapshot = snapshot or os.environ.get("MSCA_SNAPSHOT")
+    if not url and snapshot and Path(snapshot).is_dir():
+        start = time.perf_counter()
+        url = replay_snapshot(page, snapshot)
+        print(f"Replaying {url} from {snapshot}...")
+        page.goto(url, wait_until="load")
+        stats = {'steps': 0, 'cards': page.locator(CARD_SELECTOR).count(), 'timeouts': 0,
+                 'ms': round((time.perf_counter() - start) * 1000)}
+        print(f"Loaded {stats['cards']} cards from the snapshot ({stats['ms']} ms)")
+        return stats
+    url = url or people_page_url(snapshot)
+    print(f"Loading {url}...")
+    page.goto(url, wait_until="networkidle")
+    return load_all_cards(page, **options)
+
+
+def capture(directory=SNAPSHOT_DIR, headless=True):
+    """Load the live people page and save it as a replayable snapshot in directory"""
+    from playwright.sync_api import sync_playwright
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        context = browser.new_context(viewport=VIEWPORT, record_har_path=str(directory / HAR_NAME),
+                                      record_har_content='attach')
+        page = context.new_page()
+        stats = open_people_page(page, url=MSCA_PEOPLE_URL)
+        (directory / DOM_NAME).write_text(strip_scripts(page.content()), encoding='utf-8')
+        context.close()  # writes the HAR
+        browser.close()
+
+    meta = {'url': MSCA_PEOPLE_URL, 'captured': time.strftime('%Y-%m-%d %H:%M:%S'), 'cards': stats['cards']}
+    (directory / META_NAME).write_text(json.dumps(meta, indent=2), encoding='utf-8')
+    har_mb = (directory / HAR_NAME).stat().st_size / 1024 / 1024
+    print(f"Saved snapshot to {directory} ({stats['cards']} cards, HAR {har_mb:.1f} MB)")
+    return meta
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Capture the MSCA people page for offline replay")
+    parser.add_argument('command', choices=['capture'])
+    parser.add_argument('--dir', type=Path, default=SNAPSHOT_DIR, help=f"snapshot directory (default: {SNAPSHOT_DIR})")
+    parser.add_argument('--headed', action='store_true', help="show the browser window")
+    args = parser.parse_args()
+    capture(args.dir, headless=not args.headed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,567 @@
+"""
+Resumable scraper for the MSCA Digital Finance "Our people" page
+
+Replaces the versioned scrapers (scrape_msca_bios*.py, scrape_msca_complete.py,
+scrape_correct_data.py, download_msca_people*.py, now in archive/scripts/),
+which each launched their own browser to load the same page. Here one browser
+session loads the page once and runs pluggable extractors over it:
+
+  names         person names on the page
+  photos        (name, image URL) pairs, downloaded to assets/people/
+  affiliations  name -> institution, from the institution headings,
+                corrected by KNOWN_AFFILIATIONS
+  bios          bio text next to each committee member's name
+
+Progress is checkpointed to .build_cache/msca_scrape.json after every
+extractor (and every person, for bios). An interrupted run resumes where it
+stopped, and no browser is launched when every requested extractor is done.
+An extractor's progress is forgotten once its results have been saved.
+
+Results are merged into data/msca_people_named.json and data/msca_bios.json;
+values the page no longer yields are kept.
+
+Usage:
+    python scripts/msca_scraper.py                      # all extractors
+    python scripts/msca_scraper.py --only photos,bios   # (plus what they need)
+    python scripts/msca_scraper.py --fresh              # ignore the checkpoint
+    python scripts/msca_scraper.py --snapshot page.html # saved copy of the page
+
+Against a snapshot captured with `python scripts/msca_browser.py capture`,
+--bench N times each extractor over N runs and compares its result with the
+snapshot's extracted.json (written with --bless). It exits with status 1 when
+a result changed, so extraction JS can be regression-tested offline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from bulk_download import HTTPSource, download_batch, print_summary
+from msca_browser import MSCA_PEOPLE_URL, VIEWPORT, open_people_page
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from name_index import slugify
+ASSETS_DIR = BASE_DIR / "assets" / "people"
+DATA_DIR = BASE_DIR / "data"
+CHECKPOINT_PATH = BASE_DIR / ".build_cache" / "msca_scrape.json"
+
+MIN_PHOTO_SIZE = 2000  # smaller images are placeholders
+
+# Curated affiliations, preferred over what the page text suggests
+KNOWN_AFFILIATIONS = {
+    "Stephen Chan": "American University of Sharjah, UAE",
+    "Codruta Mare": "Babes-Bolyai University, Romania",
+    "Liana Stanca": "Babes-Bolyai University, Romania",
+    "Monica Violeta Achim": "Babes-Bolyai University, Romania",
+    "Stefana Belbe": "Babes-Bolyai University, Romania",
+    "Joerg Osterrieder": "FHGR, Switzerland",
+    "Alexandra-Ioana Conda": "Bucharest University of Economic Studies, Romania",
+    "Daniel Traian Pele": "Bucharest University of Economic Studies, Romania",
+    "Rui Ren": "Renmin University of China, China",
+    "Vasile Strat": "Bucharest University of Economic Studies, Romania",
+    "Wolfgang Hardle": "Humboldt University Berlin, Germany",
+    "Ruting Wang": "Renmin University of China, China",
+    "Ralf Korn": "RPTU Kaiserslautern-Landau, Germany",
+    "Audrius Kabasinskas": "Kaunas University of Technology, Lithuania",
+    "Kristina Sutiene": "Kaunas University of Technology, Lithuania",
+    "Axel Gross-Klussmann": "Bern University of Applied Sciences, Switzerland",
+    "Stefan Theussl": "WU Vienna, Austria",
+    "Jeffrey Chu": "University of Manchester, UK",
+    "Anastas Dzurovski": "University of Pristina, Kosovo",
+    "Sabrina Giordano": "University of Calabria, Italy",
+    "Catarina Silva": "University of Coimbra, Portugal",
+    "Claudia Tarantola": "University of Pavia, Italy",
+    "Maria Iannario": "University of Naples Federico II, Italy",
+    "Ioana Coita": "University of Oradea, Romania",
+    "Alessandra Tanda": "University of Pavia, Italy",
+    "Albulena Shala": "University of Pristina, Kosovo",
+    "Rezarta Perri": "University of Pristina, Kosovo",
+    "Kurt Hornik": "WU Vienna, Austria",
+    "Ronald Hochreiter": "WU Vienna, Austria"
+}
+
+# Lines of page text that head a group of people
+INSTITUTION_RE = re.compile(r'University|Universit[aà]|Institute|Academy|Research Cent|School|College|Bank|ETH|FHGR|WU ')
+
+# Shared by the extractors: does a text look like a person's name?
+LOOKS_LIKE_NAME_JS = r'''const looksLikeName = (text) => {
+    if (!text || text.length < 4 || text.length > 50) return false;
+    const words = text.split(/\s+/);
+    if (words.length < 2 || words.length > 5) return false;
+    if (!words.every(w => /^[A-Z]/.test(w))) return false;
+    // Skip institution names, dates and other non-name patterns
+    if (/University|Institute|Center|School|Department|Research|European|Horizon/i.test(text)) return false;
+    if (/^\d|January|February|March|April|May|June|July|August|September|October|November|December/i.test(text)) return false;
+    return true;
+};'''
+
+# Text elements that look like names, in page order
+NAMES_JS = r'''() => {
+    ''' + LOOKS_LIKE_NAME_JS + r'''
+    const names = [];
+    const seen = new Set();
+    document.querySelectorAll('p, span, h1, h2, h3, h4, h5, h6').forEach(el => {
+        const text = el.innerText.trim();
+        if (seen.has(text) || !looksLikeName(text)) return;
+        seen.add(text);
+        names.push(text);
+    });
+    return names;
+}'''
+
+# Pairs every sizable image with the nearest name-like text around it, in two
+# linear passes instead of re-scanning each image's ancestors: the first pass
+# reads each text element once and records, for every layout container, the
+# name-like elements (in document order) inside it up to the first one that
+# holds no image; the second walks up at most maxLevels containers from each
+# image and takes the first recorded name not wrapping that image.
+# Returns {people: [{name, imageUrl, width, height}], stats}.
+PERSON_PHOTOS_JS = r'''(params) => {
+    ''' + LOOKS_LIKE_NAME_JS + r'''
+    const {maxLevels = 6, minSize = 40, naturalSize = false} = params || {};
+    const start = performance.now();
+
+    // Text length of every element, children before parents, so that big
+    // containers are skipped without reading their text
+    const textSize = new Map();
+    const all = document.body.querySelectorAll('*');
+    for (let i = all.length - 1; i >= 0; i--) {
+        let size = 0;
+        for (const node of all[i].childNodes) {
+            if (node.nodeType === Node.TEXT_NODE) size += node.data.trim().length;
+            else if (node.nodeType === Node.ELEMENT_NODE) size += textSize.get(node) || 0;
+        }
+        textSize.set(all[i], size);
+    }
+
+    const namesIn = new Map();  // container -> [{el, text, hasImage}]
+    const complete = new Set();  // containers whose list ends with an image-free name
+    let textElements = 0;
+    let nameElements = 0;
+    for (const el of document.querySelectorAll('p, span, div, h1, h2, h3, h4, h5, h6')) {
+        textElements++;
+        const size = textSize.get(el);
+        if (!size || size > 200) continue;
+        const text = el.innerText.trim();
+        if (!looksLikeName(text)) continue;
+        nameElements++;
+        // A name element wrapping a photo can't caption that photo, so the
+        // next name is kept as well. Complete containers have complete ancestors.
+        const entry = {el, text, hasImage: el.querySelector('img') !== null};
+        for (let container = el.parentElement; container && !complete.has(container);
+             container = container.parentElement) {
+            if (!namesIn.has(container)) namesIn.set(container, []);
+            namesIn.get(container).push(entry);
+            if (!entry.hasImage) complete.add(container);
+        }
+    }
+    const indexed = performance.now();
+
+    const people = [];
+    const processedImages = new Set();
+    let images = 0;
+    for (const img of document.querySelectorAll('img')) {
+        const src = img.src || img.dataset.src || '';
+        if (!src || !src.includes('wixstatic.com') || processedImages.has(src)) continue;
+
+        // Skip very small images (icons)
+        let width, height;
+        if (naturalSize) {
+            width = img.naturalWidth || img.width || 0;
+            height = img.naturalHeight || img.height || 0;
+        } else {
+            const rect = img.getBoundingClientRect();
+            width = rect.width;
+            height = rect.height;
+        }
+        if (width < minSize || height < minSize) continue;
+        processedImages.add(src);
+        images++;
+
+        let container = img.parentElement;
+        let name = '';
+        for (let level = 0; level < maxLevels && container && !name; level++) {
+            const entry = (namesIn.get(container) || []).find(e => !e.hasImage || !e.el.contains(img));
+            if (entry) name = entry.text;
+            container = container.parentElement;
+        }
+        if (name) {
+            people.push({name: name, imageUrl: src, width: width, height: height});
+        }
+    }
+
+    return {people, stats: {textElements, nameElements, images,
+                            indexMs: indexed - start, pairMs: performance.now() - indexed}};
+}'''
+
+# Bio-like text block closest below the element whose text is exactly params.name
+BIO_NEAR_NAME_JS = r'''(params) => {
+    let nameEl = null;
+    document.querySelectorAll('p, span, h1, h2, h3, h4, h5, h6').forEach(el => {
+        if (!nameEl && el.innerText.trim() === params.name) nameEl = el;
+    });
+    if (!nameEl) return {found: false, bio: null};
+    nameEl.scrollIntoView({block: 'center'});
+    const box = nameEl.getBoundingClientRect();
+
+    const candidates = [];
+    document.querySelectorAll('p, span, div').forEach(el => {
+        const text = el.innerText?.trim();
+        if (!text || text.length < 50 || text.length > 800) return;
+
+        // Should be below or near the name
+        const rect = el.getBoundingClientRect();
+        const vDist = rect.top - box.top;
+        const hDist = Math.abs(rect.left - box.left);
+        if (vDist <= -20 || vDist >= 200 || hDist >= 300) return;
+
+        // Skip institution names and funding notices
+        if (/^(University|Institute|School|European|Funded|Views|Grant)/i.test(text)) return;
+        if (/Marie Sk.*odowska|Horizon Europe|European Union/i.test(text)) return;
+        candidates.push({text, dist: vDist + hDist});
+    });
+    candidates.sort((a, b) => a.dist - b.dist);
+
+    const bio = candidates.find(c => /research|professor|PhD|interests|focus|expertise|works|studies|specializ/i.test(c.text));
+    return {found: true, bio: bio ? bio.text : (candidates.length ? candidates[0].text : null)};
+}'''
+
+
+def high_res_url(url):
+    """URL of the 400x400 version of a wixstatic image"""
+    url = re.sub(r'/w_\d+,h_\d+', '/w_400,h_400', url)
+    return re.sub(r'fill/w_\d+,h_\d+', 'fill/w_400,h_400', url)
+
+
+def extract_person_photos(page, max_levels=6, min_size=40, natural_size=False):
+    """Run PERSON_PHOTOS_JS on the loaded page, print its timing, return the people found"""
+    found = page.evaluate(PERSON_PHOTOS_JS, {'maxLevels': max_levels, 'minSize': min_size,
+                                             'naturalSize': natural_size})
+    stats = found['stats']
+    print(f"  {len(found['people'])} of {stats['images']} images named from {stats['nameElements']} names "
+          f"in {stats['textElements']} text elements (index {stats['indexMs']:.1f} ms, "
+          f"pairing {stats['pairMs']:.1f} ms)")
+    return found['people']
+
+
+def load_json(path, default):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def load_committee():
+    return load_json(DATA_DIR / "scientific_committee.json", {}).get('selected', [])
+
+
+# --- Extractors ---
+
+EXTRACTORS = {}
+
+
+def register_extractor(cls):
+    """Class decorator adding an extractor to EXTRACTORS under its name"""
+    EXTRACTORS[cls.name] = cls
+    return cls
+
+
+class Extractor:
+    """One kind of data taken from the loaded people page
+
+    Subclasses set name (and requires, the extractors whose results they read)
+    and implement extract(). state is the extractor's checkpoint entry: data
+    put there survives an interrupted run once checkpoint() has been called.
+    """
+
+    name = None
+    requires = ()
+
+    def extract(self, page, results, state, checkpoint):
+        raise NotImplementedError
+
+
+@register_extractor
+class NamesExtractor(Extractor):
+    name = 'names'
+
+    def extract(self, page, results, state, checkpoint):
+        names = page.evaluate(NAMES_JS)
+        print(f"  {len(names)} names")
+        return names
+
+
+@register_extractor
+class PhotosExtractor(Extractor):
+    name = 'photos'
+
+    def extract(self, page, results, state, checkpoint):
+        return extract_person_photos(page)
+
+
+@register_extractor
+class AffiliationsExtractor(Extractor):
+    """Assigns each name to the institution heading above it in the page text"""
+
+    name = 'affiliations'
+    requires = ('names',)
+
+    def extract(self, page, results, state, checkpoint):
+        names = set(results['names']) | set(KNOWN_AFFILIATIONS)
+        affiliations = {}
+        institution = None
+        for line in page.evaluate('() => document.body.innerText').split('\n'):
+            line = line.strip()
+            if line in names:
+                if institution:
+                    affiliations.setdefault(line, institution)
+            elif line and len(line) < 120 and INSTITUTION_RE.search(line):
+                institution = line
+        print(f"  {len(affiliations)} affiliations from the page")
+        affiliations.update(KNOWN_AFFILIATIONS)
+        return affiliations
+
+
+@register_extractor
+class BiosExtractor(Extractor):
+    """Bio text near each committee member's name, checkpointed per person"""
+
+    name = 'bios'
+
+    def extract(self, page, results, state, checkpoint):
+        done = state.setdefault('people', {})
+        for person in load_committee():
+            if person in done:
+                continue
+            try:
+                found = page.evaluate(BIO_NEAR_NAME_JS, {'name': person})
+            except Exception as e:
+                print(f"  {person}: {e}")
+                continue  # retried on the next run
+            done[person] = found['bio']
+            print(f"  {person}: " + (f"{found['bio'][:60]}..." if found['bio']
+                                     else "no bio" if found['found'] else "not on the page"))
+            checkpoint()
+        return {person: bio for person, bio in done.items() if bio}
+
+
+def resolve(selected):
+    """Extractor names to run for selected, with their requirements, in registration order"""
+    needed = set()
+    stack = list(selected)
+    while stack:
+        name = stack.pop()
+        if name not in EXTRACTORS:
+            raise ValueError(f"Unknown extractor {name!r} (available: {', '.join(EXTRACTORS)})")
+        if name not in needed:
+            needed.add(name)
+            stack.extend(EXTRACTORS[name].requires)
+    return [name for name in EXTRACTORS if name in needed]
+
+
+# --- Running ---
+
+def load_checkpoint(path=CHECKPOINT_PATH):
+    return load_json(path, {'extractors': {}})
+
+
+def clear_checkpoint(names, checkpoint_path=CHECKPOINT_PATH):
+    """Forget the saved progress of names, remove the checkpoint once nothing is left"""
+    state = load_checkpoint(checkpoint_path)
+    for name in names:
+        state['extractors'].pop(name, None)
+    if state['extractors']:
+        save_json(checkpoint_path, state)
+    else:
+        checkpoint_path.unlink(missing_ok=True)
+
+
+def run_extractors(names, checkpoint_path=CHECKPOINT_PATH, snapshot=None, headless=True):
+    """Run the named extractors over one page load, resuming from the checkpoint
+
+    Returns {extractor name: result}.
+    """
+    state = load_checkpoint(checkpoint_path)
+    entries = state['extractors']
+    results = {name: entries[name]['result'] for name in names if entries.get(name, {}).get('done')}
+    pending = [name for name in names if name not in results]
+    for name in results:
+        print(f"{name}: done (checkpoint)")
+    if not pending:
+        return results
+
+    def checkpoint():
+        state['updated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+        save_json(checkpoint_path, state)
+
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        try:
+            page = browser.new_page(viewport=VIEWPORT)
+            open_people_page(page, snapshot)
+            for name in pending:
+                print(f"{name}:")
+                entry = entries.setdefault(name, {})
+                results[name] = EXTRACTORS[name]().extract(page, results, entry, checkpoint)
+                entry.update(done=True, result=results[name])
+                checkpoint()
+        finally:
+            browser.close()
+    return results
+
+
+# --- Benchmark ---
+
+EXPECTED_NAME = "extracted.json"
+
+
+def describe_changes(expected, actual):
+    """Short summary of how an extractor's result differs from the expected one"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        changed = sum(1 for key in expected.keys() & actual.keys() if expected[key] != actual[key])
+        return (f"{len(actual.keys() - expected.keys())} added, {len(expected.keys() - actual.keys())} removed, "
+                f"{changed} changed")
+    old = {json.dumps(item, sort_keys=True) for item in expected or ()}
+    new = {json.dumps(item, sort_keys=True) for item in actual or ()}
+    return f"{len(new - old)} added, {len(old - new)} removed"
+
+
+def benchmark(names, snapshot, repeat=5, bless=False):
+    """Time the extractors against a captured snapshot and check their results
+
+    Returns the number of extractors whose result differs from the snapshot's
+    extracted.json (0 when blessing).
+    """
+    from playwright.sync_api import sync_playwright
+
+    expected_path = Path(snapshot) / EXPECTED_NAME
+    expected = load_json(expected_path, {})
+    results = {}
+    failures = 0
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            page = browser.new_page(viewport=VIEWPORT)
+            open_people_page(page, snapshot)
+            for name in names:
+                times = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        result = EXTRACTORS[name]().extract(page, results, {}, lambda: None)
+                    times.append(time.perf_counter() - start)
+                results[name] = result
+                line = f"{name:<13} {statistics.median(times) * 1000:8.1f} ms  {len(result):4d} items"
+                if not bless and name in expected and expected[name] != result:
+                    failures += 1
+                    line += f"  CHANGED: {describe_changes(expected[name], result)}"
+                print(line)
+        finally:
+            browser.close()
+
+    if bless:
+        save_json(expected_path, {**expected, **results})
+        print(f"Saved expected results to {expected_path}")
+    return failures
+
+
+# --- Outputs ---
+
+def save_photos(people):
+    """Download the scraped photos and merge them into msca_people_named.json"""
+    jobs = []
+    named = {}
+    for person in people:
+        filename = slugify(person['name'])
+        if not filename or person['name'] in named:
+            continue
+        ext = '.png' if '.png' in person['imageUrl'].lower() else '.jpg'
+        named[person['name']] = filename + ext
+        jobs.append((high_res_url(person['imageUrl']), ASSETS_DIR / (filename + ext)))
+
+    source = HTTPSource()
+    results = download_batch(jobs, source=source, min_size=MIN_PHOTO_SIZE)
+    print_summary(results)
+    print(source.session.summary())
+    saved = {result['filepath'].name for result in results if result['status'] != 'failed'}
+
+    path = DATA_DIR / "msca_people_named.json"
+    mapping = load_json(path, {'people': []})
+    entries = {entry['name']: entry for entry in mapping['people'] if (ASSETS_DIR / entry['filename']).exists()}
+    for name, filename in named.items():
+        if filename in saved:
+            entries[name] = {'name': name, 'filename': filename}
+    mapping['people'] = list(entries.values())
+    save_json(path, mapping)
+    print(f"{path.relative_to(BASE_DIR)}: {len(mapping['people'])} people with photos")
+
+
+def save_bios(affiliations=None, bios=None):
+    """Merge scraped affiliations and bios into msca_bios.json"""
+    path = DATA_DIR / "msca_bios.json"
+    data = load_json(path, {'affiliations': {}, 'bios': {}})
+    data['source'] = MSCA_PEOPLE_URL
+    data['scrape_date'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    data['affiliations'] = {**data.get('affiliations', {}), **(affiliations or {})}
+    data['bios'] = {**data.get('bios', {}), **(bios or {})}
+    save_json(path, data)
+    print(f"{path.relative_to(BASE_DIR)}: {len(data['affiliations'])} affiliations, {len(data['bios'])} bios")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape the MSCA people page with one browser session")
+    parser.add_argument('--only', metavar='EXTRACTORS',
+                        help=f"comma-separated extractors to run (default: all of {', '.join(EXTRACTORS)})")
+    parser.add_argument('--fresh', action='store_true', help="discard the checkpoint of an interrupted run")
+    parser.add_argument('--headed', action='store_true', help="show the browser window")
+    parser.add_argument('--snapshot', help="load a saved copy or captured snapshot of the page "
+                                           "(default: $MSCA_SNAPSHOT)")
+    parser.add_argument('--bench', type=int, metavar='N',
+                        help="time each extractor over N runs against --snapshot and check its results")
+    parser.add_argument('--bless', action='store_true', help="with --bench: save the results as expected")
+    args = parser.parse_args()
+
+    try:
+        names = resolve(args.only.split(',') if args.only else EXTRACTORS)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.bench:
+        snapshot = args.snapshot or os.environ.get("MSCA_SNAPSHOT")
+        if not snapshot or not Path(snapshot).is_dir():
+            parser.error("--bench needs a captured snapshot directory (msca_browser.py capture)")
+        sys.exit(1 if benchmark(names, snapshot, args.bench, args.bless) else 0)
+
+    if args.fresh and CHECKPOINT_PATH.exists():
+        CHECKPOINT_PATH.unlink()
+
+    results = run_extractors(names, snapshot=args.snapshot, headless=not args.headed)
+
+    if 'photos' in results:
+        save_photos(results['photos'])
+    if 'affiliations' in results or 'bios' in results:
+        save_bios(results.get('affiliations'), results.get('bios'))
+    clear_checkpoint(names)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,28 @@ Scrape ALL real photos from MSCA Digital Finance website
 
 import json
 import re
-import time
-import requests
-import unicodedata
+import sys
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 
+from bulk_download import HTTPSource, download_batch, print_summary
+from msca_browser import open_people_page
+from msca_scraper import extract_person_photos
+
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from name_index import NameIndex, slugify
+from photo_index import open_index
 ASSETS_DIR = BASE_DIR / "assets" / "people"
 DATA_DIR = BASE_DIR / "data"
 
 ASSETS_DIR.mkdir(parents=True, exist_ok=True)
 
-def sanitize_filename(name):
-    """Convert name to safe filename"""
-    name = re.sub(r'^(Prof\.|Dr\.|Mr\.|Ms\.|Mrs\.)\s*', '', name)
-    name = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('ASCII')
-    safe = re.sub(r'[^\w\s-]', '', name.lower())
-    safe = re.sub(r'[\s]+', '_', safe.strip())
-    return safe
+def photo_url(url):
+    """URL of the 300x300 version of a wixstatic image"""
+    url = re.sub(r'/w_\d+,h_\d+', '/w_300,h_300', url)
+    return re.sub(r'fill/w_\d+,h_\d+', 'fill/w_300,h_300', url)
 
 def scrape_photos():
     print("Starting browser...")
@@ -31,106 +34,30 @@ def scrape_photos():
         browser = p.chromium.launch(headless=True)
         page = browser.new_page()
 
-        print("Loading MSCA page...")
-        page.goto("https://www.digital-finance-msca.com/our-people", wait_until="networkidle")
-        time.sleep(3)
-
-        # Scroll multiple times to load all content
-        print("Scrolling to load all images...")
-        for i in range(20):
-            page.evaluate("window.scrollBy(0, 500)")
-            time.sleep(0.3)
-
-        # Scroll back and wait
-        page.evaluate("window.scrollTo(0, 0)")
-        time.sleep(2)
-
-        # Scroll again slowly
-        for i in range(25):
-            page.evaluate("window.scrollBy(0, 400)")
-            time.sleep(0.2)
+        # Scroll until all lazy-loaded images are in
+        open_people_page(page)
 
         print("Extracting image data...")
 
-        # Get all images with their nearby text
-        data = page.evaluate('''() => {
-            const results = [];
-            const images = document.querySelectorAll('img');
-            const seenUrls = new Set();
-
-            images.forEach(img => {
-                const src = img.src || img.dataset.src || '';
-                if (!src || seenUrls.has(src)) return;
-                if (!src.includes('wixstatic.com')) return;
-
-                // Skip tiny images (icons, logos)
-                const width = img.naturalWidth || img.width || 0;
-                const height = img.naturalHeight || img.height || 0;
-                if (width < 50 || height < 50) return;
-
-                seenUrls.add(src);
-
-                // Find nearby text that might be a name
-                let name = '';
-                let parent = img.parentElement;
-
-                for (let i = 0; i < 5 && parent; i++) {
-                    // Look for text elements nearby
-                    const texts = parent.querySelectorAll('p, span, h1, h2, h3, h4, h5, h6, div');
-                    for (const t of texts) {
-                        const txt = t.innerText.trim();
-                        // Check if looks like a name (2-4 words, capitalized)
-                        if (txt && txt.length > 4 && txt.length < 40) {
-                            const words = txt.split(/\s+/);
-                            if (words.length >= 2 && words.length <= 4) {
-                                if (/^[A-Z]/.test(words[0]) && /^[A-Z]/.test(words[words.length-1])) {
-                                    // Skip if it's an institution name
-                                    if (!/University|Institute|Center|School|Department/i.test(txt)) {
-                                        name = txt;
-                                        break;
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    if (name) break;
-                    parent = parent.parentElement;
-                }
-
-                // Get high-res URL
-                let highRes = src;
-                // Convert to higher resolution
-                highRes = highRes.replace(/\/w_\d+,h_\d+/, '/w_300,h_300');
-                highRes = highRes.replace(/fill\/w_\d+,h_\d+/, 'fill/w_300,h_300');
-
-                results.push({
-                    url: highRes,
-                    name: name,
-                    origUrl: src
-                });
-            });
-
-            return results;
-        }''')
+        # Name every image from the text around it (indexed, one pass)
+        people = extract_person_photos(page, max_levels=5, min_size=50, natural_size=True)
+        data = [{'url': photo_url(person['imageUrl']), 'name': person['name'], 'origUrl': person['imageUrl']}
+                for person in people]
 
         browser.close()
         return data
 
-def download_photo(url, filename):
-    """Download photo if it's a real image (not placeholder)"""
-    try:
-        resp = requests.get(url, timeout=10)
-        if resp.status_code == 200:
-            content = resp.content
-            # Check if it's a real photo (placeholders are small)
-            if len(content) > 3000:
-                filepath = ASSETS_DIR / filename
-                with open(filepath, 'wb') as f:
-                    f.write(content)
-                return True, len(content)
-        return False, 0
-    except Exception as e:
-        return False, 0
+def download_photos(jobs):
+    """Download (url, filename) jobs concurrently if they are real images (not placeholders)
+
+    Returns the size of each saved photo, or 0 if it failed.
+    """
+    # Placeholders are small
+    source = HTTPSource()
+    results = download_batch([(url, ASSETS_DIR / filename) for url, filename in jobs], source=source, min_size=3000)
+    print_summary(results)
+    print(source.session.summary())
+    return [result.get('size', 0) if result['status'] != 'failed' else 0 for result in results]
 
 def main():
     print("Scraping all photos from MSCA...")
@@ -139,7 +66,7 @@ def main():
     with open(DATA_DIR / "scientific_committee.json", 'r') as f:
         committee = json.load(f)['selected']
 
-    committee_lower = {c.lower(): c for c in committee}
+    committee_index = NameIndex(committee, name=lambda member: member)
 
     # Scrape
     images = scrape_photos()
@@ -147,6 +74,7 @@ def main():
 
     # Track downloads
     downloaded = {}
+    jobs = {}
 
     for img in images:
         name = img.get('name', '')
@@ -155,44 +83,31 @@ def main():
         if not name or not url:
             continue
 
-        name_lower = name.lower()
-
-        # Check if this is a committee member
-        matched_member = None
-        for cm_lower, cm in committee_lower.items():
-            # Check various matching strategies
-            if cm_lower == name_lower:
-                matched_member = cm
-                break
-            # Check if names overlap significantly
-            cm_parts = set(cm_lower.split())
-            name_parts = set(name_lower.split())
-            if len(cm_parts & name_parts) >= 2:
-                matched_member = cm
-                break
-
-        if matched_member and matched_member not in downloaded:
-            filename = sanitize_filename(matched_member)
+        # Check if this is a committee member (any spelling, or a near miss)
+        matched_member, _ = committee_index.match(name)
+
+        if matched_member and matched_member not in jobs:
+            filename = slugify(matched_member)
             ext = '.png' if '.png' in url.lower() else '.jpg'
-            full_filename = filename + ext
-
-            success, size = download_photo(url, full_filename)
-            if success:
-                downloaded[matched_member] = {
-                    'filename': full_filename,
-                    'url': url,
-                    'size': size
-                }
-                try:
-                    print(f"  Downloaded: {matched_member} ({size/1024:.1f}KB)")
-                except:
-                    print(f"  Downloaded: [name] ({size/1024:.1f}KB)")
+            jobs[matched_member] = (url, filename + ext)
+
+    for (member, (url, full_filename)), size in zip(jobs.items(), download_photos(list(jobs.values()))):
+        if size:
+            downloaded[member] = {
+                'filename': full_filename,
+                'url': url,
+                'size': size
+            }
+            try:
+                print(f"  Downloaded: {member} ({size/1024:.1f}KB)")
+            except:
+                print(f"  Downloaded: [name] ({size/1024:.1f}KB)")
 
     print(f"\nDownloaded {len(downloaded)} / {len(committee)} committee member photos")
 
     # Also download any other images we found with names
     print("\nDownloading other named people...")
-    other_count = 0
+    other_jobs = []
     for img in images:
         name = img.get('name', '')
         url = img.get('url', '')
@@ -201,7 +116,7 @@ def main():
         if name in downloaded:
             continue
 
-        filename = sanitize_filename(name)
+        filename = slugify(name)
         if not filename:
             continue
         ext = '.png' if '.png' in url.lower() else '.jpg'
@@ -211,9 +126,9 @@ def main():
         if (ASSETS_DIR / full_filename).exists():
             continue
 
-        success, size = download_photo(url, full_filename)
-        if success:
-            other_count += 1
+        other_jobs.append((url, full_filename))
+
+    other_count = sum(1 for size in download_photos(other_jobs) if size)
 
     print(f"Downloaded {other_count} additional photos")
 
@@ -228,11 +143,10 @@ def main():
 
     # Add existing mappings for people we already have
     existing = load_existing_mappings()
-    for person in existing.get('people', []):
-        if person['name'] not in downloaded:
-            # Check if file exists and is real
-            fpath = ASSETS_DIR / person['filename']
-            if fpath.exists() and fpath.stat().st_size > 3000:
+    with open_index() as index:
+        for person in existing.get('people', []):
+            # Keep it if the file is a real portrait, not a silhouette or placeholder
+            if person['name'] not in downloaded and index.is_usable(person['filename']):
                 mappings['people'].append(person)
 
     with open(DATA_DIR / "msca_people_named.json", 'w') as f:
@@ -259,12 +173,9 @@ def load_existing_mappings():
 
 def has_existing_photo(name):
     """Check if we have a real photo for this person"""
-    filename = sanitize_filename(name)
-    for ext in ['.jpg', '.png']:
-        fpath = ASSETS_DIR / (filename + ext)
-        if fpath.exists() and fpath.stat().st_size > 3000:
-            return True
-    return False
+    filename = slugify(name)
+    with open_index() as index:
+        return any(index.is_usable(filename + ext) for ext in ['.jpg', '.png'])
 
 if __name__ == "__main__":
     main()
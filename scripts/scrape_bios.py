@@ -4,9 +4,10 @@ Scrape bios for committee members from MSCA website
 
 from playwright.sync_api import sync_playwright
 import json
-import time
 from pathlib import Path
 
+from msca_browser import open_people_page
+
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
 
@@ -21,13 +22,8 @@ def main():
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         page = browser.new_page()
-        page.goto('https://www.digital-finance-msca.com/our-people', wait_until='networkidle')
-        time.sleep(5)
-
-        # Scroll to load all
-        for i in range(40):
-            page.evaluate(f'window.scrollTo(0, {i*350})')
-            time.sleep(0.2)
+        # Scroll until all lazy-loaded content is in
+        open_people_page(page)
 
         for name in committee:
             print(f"\nSearching bio for: {name}")
@@ -36,7 +32,6 @@ def main():
                 # Find the name element
                 name_el = page.locator(f'text="{name}"').first
                 name_el.scroll_into_view_if_needed()
-                time.sleep(0.3)
 
                 box = name_el.bounding_box()
                 if not box:
@@ -1,17 +1,54 @@
 """
-Interactive selection of Scientific Committee members from MSCA people
-
-Run this script to go through each person one-by-one and decide
-whether to include them in the Scientific Committee.
+Selection of Scientific Committee members from MSCA people
+
+Batch mode (--batch) scores every person in the people store against the
+declarative rules in data/committee_rules.json and writes the ranked
+selection to scientific_committee.json in one pass, so re-selecting after a
+data refresh takes milliseconds. The rules file holds:
+  rules                 scoring rules, each {"rule": type, "weight": w, ...}:
+                          photo         the photo is a real portrait (photo_index)
+                          bio           has a bio
+                          affiliation   has an affiliation
+                          region        affiliation country is in "countries"
+                          publications  works in docs/data/publications.json, up to "cap"
+                          topics        workshop topics ({topic: [keywords]}) matched
+                                        in the bio and publication titles/concepts
+  require               rules a person must score on to be considered, by
+                        configured "name" or rule type (evaluated with that
+                        rule's parameters)
+  size                  number of members to select
+  max_per_affiliation   at most this many members per institution
+  include, exclude      overrides: always/never selected. include starts out
+                        as the published committee, so a batch run keeps
+                        it and only fills free places
+New rule types are added with @register_rule.
+
+Interactive mode (default) goes through each person one-by-one to decide
+whether to include them. Its yes/no answers are saved as include/exclude
+overrides in the rules file, so later batch runs keep them.
+
+Usage: python scripts/select_committee.py [--batch [--dry-run]] [--rules FILE]
 """
 
+import argparse
 import json
 import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from name_index import name_key
+from people_store import open_store
+from photo_index import USABLE_STATUSES
 DATA_DIR = BASE_DIR / "data"
 ASSETS_DIR = BASE_DIR / "assets" / "people"
+RULES_FILE = DATA_DIR / "committee_rules.json"
+PUBLICATIONS_FILE = BASE_DIR / "docs" / "data" / "publications.json"
 
 # Institution names to skip (not people)
 INSTITUTIONS = {
@@ -23,6 +60,195 @@ INSTITUTIONS = {
 }
 
 
+RULES = {}
+RULE_PARAMS = {}  # rule type -> keys its configuration must provide
+
+
+def register_rule(name, params=()):
+    """Register a scoring rule: fn(person, rule, context) -> points before weighting
+
+    params lists the keys the rule reads from its configuration (e.g. "countries").
+    """
+    def register(fn):
+        RULES[name] = fn
+        RULE_PARAMS[name] = tuple(params)
+        return fn
+    return register
+
+
+@register_rule("photo")
+def photo_rule(person, rule, context):
+    return 1.0 if person['photo'] and person['photo_status'] in USABLE_STATUSES else 0.0
+
+
+@register_rule("bio")
+def bio_rule(person, rule, context):
+    return 1.0 if person['bio'] else 0.0
+
+
+@register_rule("affiliation")
+def affiliation_rule(person, rule, context):
+    return 1.0 if person['affiliation'] else 0.0
+
+
+@register_rule("region", params=("countries",))
+def region_rule(person, rule, context):
+    country = (person['affiliation'] or '').rsplit(',', 1)[-1].strip().lower()
+    return 1.0 if country and country in {c.lower() for c in rule['countries']} else 0.0
+
+
+@register_rule("publications")
+def publications_rule(person, rule, context):
+    return float(min(context['publications'][person['key']], rule.get('cap', 5)))
+
+
+@register_rule("topics", params=("topics",))
+def topics_rule(person, rule, context):
+    text = ' '.join([person['bio'] or ''] + context['texts'][person['key']])
+    return float(sum(1 for keywords in rule['topics'].values()
+                     if any(re.search(r'\b' + re.escape(k), text, re.I) for k in keywords)))
+
+
+def load_rules(path=RULES_FILE):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_rules(rules, path=RULES_FILE):
+    tmp = Path(path).with_name(f"{Path(path).name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(rules, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def load_publication_context(path=PUBLICATIONS_FILE):
+    """{'publications': Counter(name key -> works), 'texts': {name key: [titles and concepts]}}"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            works = json.load(f)
+    except (OSError, ValueError):
+        works = []
+    publications = Counter()
+    texts = defaultdict(list)
+    for work in works:
+        for key in {name_key(author) for author in work.get('authors', [])}:
+            publications[key] += 1
+            texts[key] += [work.get('title') or ''] + work.get('concepts', [])
+    return {'publications': publications, 'texts': texts}
+
+
+def _check_rule(rule, where):
+    if rule.get('rule') not in RULES:
+        raise ValueError(f"unknown rule type {rule.get('rule')!r} in {where} (known: {', '.join(sorted(RULES))})")
+    missing = [key for key in RULE_PARAMS[rule['rule']] if key not in rule]
+    if missing:
+        raise ValueError(f"rule {rule.get('name', rule['rule'])!r} in {where} needs {', '.join(missing)}")
+    return rule
+
+
+def required_rules(rules):
+    """The rule objects named in 'require', raising ValueError for unknown or incomplete ones
+
+    An entry matches a configured rule by its "name", else by its "rule" type,
+    and is evaluated with that rule's parameters. A rule type without
+    parameters (e.g. "affiliation") may be required without configuring it.
+    """
+    configured = {}
+    for rule in rules['rules']:
+        _check_rule(rule, "rules")
+        configured.setdefault(rule['rule'], rule)
+    configured.update({rule['name']: rule for rule in rules['rules'] if 'name' in rule})
+    required = []
+    for name in rules.get('require', []):
+        if name in configured:
+            required.append(configured[name])
+        elif name in RULES:
+            required.append(_check_rule({'rule': name}, f"require ({name!r} is not configured in rules)"))
+        else:
+            raise ValueError(f"unknown rule {name!r} in require (not a configured rule name or a rule type)")
+    return required
+
+
+def score_people(people, rules, context):
+    """[(person, total, {rule name: points}, eligible)] sorted best first (ties by name)
+
+    eligible is False if the person scores nothing on a rule listed in 'require'.
+    """
+    required = required_rules(rules)
+    scored = []
+    for person in people:
+        points = {rule.get('name', rule['rule']): rule.get('weight', 1) * RULES[rule['rule']](person, rule, context)
+                  for rule in rules['rules']}
+        eligible = all(RULES[rule['rule']](person, rule, context) for rule in required)
+        scored.append((person, sum(points.values()), points, eligible))
+    scored.sort(key=lambda item: (-item[1], item[0]['key']))
+    return scored
+
+
+def select_batch(rules, people, context):
+    """(selected, skipped) lists of (person, total, points, eligible) in rank order"""
+    include = {name_key(name) for name in rules.get('include', [])}
+    exclude = {name_key(name) for name in rules.get('exclude', [])}
+    size = rules.get('size', 20)
+    per_affiliation = rules.get('max_per_affiliation')
+
+    ranked = score_people(people, rules, context)
+    chosen = {item[0]['key'] for item in ranked if item[0]['key'] in include}
+    taken = Counter(item[0]['affiliation'] for item in ranked if item[0]['key'] in chosen)
+    for person, _, _, eligible in ranked:
+        if len(chosen) >= size:
+            break
+        if not eligible or person['key'] in chosen or person['key'] in exclude:
+            continue
+        if per_affiliation and taken[person['affiliation']] >= per_affiliation:
+            continue
+        chosen.add(person['key'])
+        taken[person['affiliation']] += 1
+    selected = [item for item in ranked if item[0]['key'] in chosen]
+    skipped = [item for item in ranked if item[0]['key'] not in chosen]
+    return selected, skipped
+
+
+def run_batch(rules_path=RULES_FILE, dry_run=False):
+    start = time.perf_counter()
+    rules = load_rules(rules_path)
+    with open_store() as store:
+        people = [{**person, 'key': name_key(person['name'])} for person in store.all()]
+    known = {person['key'] for person in people}
+    unknown = [name for name in rules.get('include', []) if name_key(name) not in known]
+    if unknown:
+        print(f"Warning: included but not in the people store: {', '.join(unknown)}")
+    selected, skipped = select_batch(rules, people, load_publication_context())
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"Scored {len(people)} people in {elapsed:.0f} ms, selected {len(selected)}:")
+    for rank, (person, total, points, _) in enumerate(selected, 1):
+        detail = ', '.join(f"{name} {value:g}" for name, value in points.items() if value)
+        print(f"  {rank:2}. {person['name']:<28} {total:5.1f}  ({detail})")
+    if dry_run:
+        return
+    save_selection({
+        'selected': [item[0]['name'] for item in selected],
+        'skipped': [item[0]['name'] for item in skipped],
+        'total_selected': len(selected),
+        'total_people': len(people),
+        'source': f"Batch selection by {Path(rules_path).name}",
+        'scores': {person['name']: round(total, 2) for person, total, _, _ in selected + skipped},
+        'completed': True
+    })
+
+
+def save_overrides(included, excluded, rules_path=RULES_FILE):
+    """Record interactive answers as include/exclude overrides for batch runs"""
+    if not included and not excluded:
+        return
+    rules = load_rules(rules_path)
+    answered = {name_key(name) for name in included + excluded}
+    for field, names in (('include', included), ('exclude', excluded)):
+        rules[field] = [name for name in rules.get(field, []) if name_key(name) not in answered] + names
+    save_rules(rules, rules_path)
+    print(f"Overrides saved to {rules_path} ({len(included)} included, {len(excluded)} excluded)")
+
+
 def load_data():
     """Load scraped people data"""
     with open(DATA_DIR / 'msca_people.json', 'r', encoding='utf-8') as f:
@@ -53,7 +279,7 @@ def display_person_info(name, index, total):
     print("  [s] Skip all remaining (auto-no)")
 
 
-def main():
+def interactive(rules_path=RULES_FILE):
     print("Scientific Committee Selection")
     print("=" * 60)
     print("Go through each person from the MSCA Digital Finance network")
@@ -74,6 +300,8 @@ def main():
     selection_file = DATA_DIR / 'scientific_committee.json'
     selected = []
     skipped = []
+    answered_yes = []  # explicit answers, saved as overrides for batch runs
+    answered_no = []
     start_index = 0
 
     if selection_file.exists():
@@ -104,10 +332,12 @@ def main():
     input("\nPress Enter to start reviewing...")
 
     auto_mode = None  # 'yes' or 'no' for auto-selection
+    reviewed = set(selected + skipped)
 
     for i, name in enumerate(people[start_index:], start=start_index + 1):
-        if name in set(selected + skipped):
+        if name in reviewed:
             continue
+        reviewed.add(name)
 
         if auto_mode == 'yes':
             selected.append(name)
@@ -125,10 +355,12 @@ def main():
 
             if choice == 'y':
                 selected.append(name)
+                answered_yes.append(name)
                 print(f"  -> Added to committee")
                 break
             elif choice == 'n':
                 skipped.append(name)
+                answered_no.append(name)
                 print(f"  -> Skipped")
                 break
             elif choice == 'q':
@@ -139,6 +371,7 @@ def main():
                     'total_reviewed': len(selected) + len(skipped),
                     'total_people': len(people)
                 })
+                save_overrides(answered_yes, answered_no, rules_path)
                 return
             elif choice == 'a':
                 print("\nAuto-selecting all remaining...")
@@ -161,6 +394,7 @@ def main():
         'total_people': len(people),
         'completed': True
     })
+    save_overrides(answered_yes, answered_no, rules_path)
 
     print("\n" + "=" * 60)
     print("Selection Complete!")
@@ -174,5 +408,22 @@ def main():
             print(f"  - {name}")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Select the Scientific Committee")
+    parser.add_argument('--batch', action='store_true', help="rank everyone by the rules file instead of asking")
+    parser.add_argument('--dry-run', action='store_true', help="with --batch: print the ranking, don't save it")
+    parser.add_argument('--rules', type=Path, default=RULES_FILE, help=f"rules file (default: {RULES_FILE})")
+    args = parser.parse_args()
+
+    if args.batch:
+        try:
+            run_batch(args.rules, args.dry_run)
+        except ValueError as e:
+            print(f"Error: {args.rules}: {e}")
+            sys.exit(1)
+    else:
+        interactive(args.rules)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,322 @@
+"""
+CSS build step shared by the HTML generators
+
+Each page family has its own stylesheet in styles/:
+- finance: ai_digital_finance.html, budget_internal.html
+- conference: index.html
+- topic: topic_*.html
+
+Stylesheets can be delivered in three ways (--css):
+- inline: the family's stylesheet in a <style> block, pages stay single files (default)
+- external: all families merged into one minified, content-hashed stylesheet
+  (assets/build/site.<hash>.css) linked from every page, so navigating
+  between pages reuses the cached file
+- critical: the rules matching the page's above-the-fold markup are inlined,
+  the full stylesheet is loaded without blocking the first render
+
+Families define conflicting rules for the same selectors (.container, .hero,
+body, ...), so in the merged stylesheet every rule is scoped to the class of
+its family on <html> (e.g. ".page-topic .header"). Families are merged like a
+diff, preserving each family's rule order: rules shared by several families
+are emitted once with one selector per family. Within a family, an identical
+rule repeated later replaces the earlier one.
+"""
+
+import argparse
+import difflib
+import os
+import re
+import textwrap
+from functools import lru_cache
+from pathlib import Path
+
+from asset_pipeline import publish_content
+
+BASE_DIR = Path(__file__).parent
+STYLES_DIR = BASE_DIR / "styles"
+
+PAGE_STYLES = ("finance", "conference", "topic")
+CSS_MODES = ("inline", "external", "critical")
+SITE_STYLESHEET = "site.css"
+
+# At-rules whose body is a list of rules (scoped and filtered like top-level rules)
+GROUPING_RULES = ("@media", "@supports")
+
+COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+BRACE_RE = re.compile(r"[{}]")
+ROOT_SELECTOR_RE = re.compile(r"^(:root|html)(?![\w-])")
+PSEUDO_RE = re.compile(r"::?[\w-]+(\([^)]*\))?")
+ATTRIBUTE_RE = re.compile(r"\[[^\]]*\]")
+COMBINATOR_RE = re.compile(r"\s*[\s>+~]\s*")
+TAG_RE = re.compile(r"<([a-zA-Z][\w-]*)")
+CLASS_ATTR_RE = re.compile(r'\sclass="([^"]*)"')
+ID_ATTR_RE = re.compile(r'\sid="([^"]*)"')
+
+
+def page_class(family):
+    """Class set on <html> that scopes a family's rules in the site stylesheet"""
+    return f"page-{family}"
+
+
+def stylesheet_path(family):
+    return STYLES_DIR / f"{family}.css"
+
+
+def stylesheet_inputs():
+    """Files the stylesheets are built from (recorded in the build manifest)"""
+    return [Path(__file__)] + [stylesheet_path(family) for family in PAGE_STYLES]
+
+
+def page_css(family):
+    """Source text of a family's stylesheet"""
+    return stylesheet_path(family).read_text(encoding='utf-8')
+
+
+def _split_top_level(text, sep):
+    """Split on sep outside parentheses and quotes"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(text):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in '"\'':
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _minify_selector(prelude):
+    prelude = ' '.join(prelude.split())
+    return re.sub(r"\s*([,>~])\s*", r"\1", prelude)
+
+
+def minify_declarations(body):
+    """Minified declaration list, e.g. for a style attribute"""
+    declarations = []
+    for declaration in _split_top_level(body, ';'):
+        if ':' not in declaration:
+            continue
+        name, value = declaration.split(':', 1)
+        value = ' '.join(value.split())
+        value = re.sub(r"\s*,\s*", ",", value).replace(' !important', '!important')
+        declarations.append(f"{name.strip()}:{value}")
+    return ';'.join(declarations)
+
+
+def _matching_brace(css, start):
+    """Index of the } closing the block opened at css[start]"""
+    depth = 0
+    for i in range(start, len(css)):
+        if css[i] == '{':
+            depth += 1
+        elif css[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(css)
+
+
+def _parse_blocks(css, pos):
+    blocks = []
+    while True:
+        match = BRACE_RE.search(css, pos)
+        if match is None:
+            return blocks, len(css)
+        if match.group() == '}':
+            return blocks, match.end()
+        prelude = _minify_selector(css[pos:match.start()])
+        if prelude.startswith(GROUPING_RULES):
+            body, pos = _parse_blocks(css, match.end())
+        else:
+            end = _matching_brace(css, match.start())
+            body = css[match.end():end]
+            body = ' '.join(body.split()) if prelude.startswith('@') else minify_declarations(body)
+            pos = end + 1
+        blocks.append((prelude, body))
+
+
+def _dedupe(blocks):
+    """Drop rules that are repeated verbatim later in the same list"""
+    seen = set()
+    kept = []
+    for prelude, body in reversed(blocks):
+        if isinstance(body, list):
+            body = _dedupe(body)
+        key = _block_key((prelude, body))
+        if key not in seen:
+            seen.add(key)
+            kept.append((prelude, body))
+    return kept[::-1]
+
+
+def parse_css(css):
+    """Parse a stylesheet into minified (prelude, body) blocks
+
+    body is the declaration text of a rule, or a list of blocks for a grouping
+    at-rule such as @media.
+    """
+    blocks, _ = _parse_blocks(COMMENT_RE.sub('', css), 0)
+    return _dedupe(blocks)
+
+
+def minify_css(css):
+    """Minified form of a stylesheet: comments, whitespace and repeated rules removed"""
+    return _serialize(parse_css(css))
+
+
+@lru_cache(maxsize=None)
+def _family_blocks(family, mtime_ns, size):
+    return parse_css(page_css(family))
+
+
+def family_blocks(family):
+    st = os.stat(stylesheet_path(family))
+    return _family_blocks(family, st.st_mtime_ns, st.st_size)
+
+
+def _block_key(block):
+    prelude, body = block
+    if isinstance(body, list):
+        return (prelude, tuple(_block_key(child) for child in body))
+    return (prelude, body)
+
+
+def _scope_selector(selector, scope):
+    match = ROOT_SELECTOR_RE.match(selector)
+    if match:
+        return f"{match.group(1)}.{scope}{selector[match.end():]}"
+    return f".{scope} {selector}"
+
+
+def _serialize(blocks, families=None):
+    """Minified CSS for blocks, with every selector scoped to each of families"""
+    out = []
+    for prelude, body in blocks:
+        if isinstance(body, list):
+            out.append(f"{prelude}{{{_serialize(body, families)}}}")
+        elif families is None or prelude.startswith('@'):
+            out.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = _split_top_level(prelude, ',')
+            scoped = ','.join(_scope_selector(selector, page_class(family))
+                              for family in families for selector in selectors)
+            out.append(f"{scoped}{{{body}}}")
+    return ''.join(out)
+
+
+def _merge(merged, family, blocks):
+    """Merge one family's blocks into merged ([key, families, block] entries), keeping both orders"""
+    keys = [_block_key(block) for block in blocks]
+    matcher = difflib.SequenceMatcher(None, [entry[0] for entry in merged], keys, autojunk=False)
+    out = []
+    i = j = 0
+    for a, b, size in matcher.get_matching_blocks():
+        out += merged[i:a]
+        out += [[keys[k], [family], blocks[k]] for k in range(j, b)]
+        for entry in merged[a:a + size]:
+            entry[1].append(family)
+            out.append(entry)
+        i, j = a + size, b + size
+    return out
+
+
+def build_site_css():
+    """The merged, scoped and minified stylesheet of every page family"""
+    merged = []
+    for family in PAGE_STYLES:
+        merged = _merge(merged, family, family_blocks(family))
+    return ''.join(_serialize([block], families) for _, families, block in merged)
+
+
+@lru_cache(maxsize=None)
+def _publish_site_stylesheet(signature):
+    return publish_content(SITE_STYLESHEET, build_site_css().encode('utf-8'))
+
+
+def site_stylesheet_url():
+    """Build assets/build/site.<hash>.css (once per content version) and return its URL"""
+    signature = tuple((st.st_mtime_ns, st.st_size) for st in map(os.stat, stylesheet_inputs()))
+    return _publish_site_stylesheet(signature)
+
+
+def _markup_tokens(markup):
+    tags = {tag.lower() for tag in TAG_RE.findall(markup)} | {'html', 'body'}
+    classes = {name for value in CLASS_ATTR_RE.findall(markup) for name in value.split()}
+    ids = set(ID_ATTR_RE.findall(markup))
+    return tags, classes, ids
+
+
+def _may_match(selector, tags, classes, ids):
+    """True unless the selector needs a tag, class or id absent from the markup"""
+    selector = ATTRIBUTE_RE.sub('', PSEUDO_RE.sub('', selector))
+    for compound in COMBINATOR_RE.split(selector.strip()):
+        tag = re.match(r"[\w-]*", compound).group().lower()
+        if tag and tag not in tags:
+            return False
+        if not set(re.findall(r"\.([\w-]+)", compound)) <= classes:
+            return False
+        if not set(re.findall(r"#([\w-]+)", compound)) <= ids:
+            return False
+    return True
+
+
+def _critical_blocks(blocks, tokens):
+    kept = []
+    for prelude, body in blocks:
+        if isinstance(body, list):
+            if prelude != '@media print':
+                body = _critical_blocks(body, tokens)
+                if body:
+                    kept.append((prelude, body))
+        elif prelude.startswith('@') or any(
+                _may_match(selector, *tokens) for selector in _split_top_level(prelude, ',')):
+            kept.append((prelude, body))
+    return kept
+
+
+def critical_css(family, markup):
+    """Minified subset of a family's stylesheet that can apply to the given markup"""
+    return _serialize(_critical_blocks(family_blocks(family), _markup_tokens(markup)))
+
+
+def style_tags(family, css_mode="inline", above_fold=""):
+    """<head> markup delivering a family's stylesheet
+
+    above_fold is the markup visible on first render, used in critical mode.
+    """
+    if css_mode == "external":
+        return f'<link rel="stylesheet" href="{site_stylesheet_url()}">'
+    if css_mode == "critical":
+        url = site_stylesheet_url()
+        return (f'<style>{critical_css(family, above_fold)}</style>\n'
+                f'    <link rel="preload" href="{url}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                f'    <noscript><link rel="stylesheet" href="{url}"></noscript>')
+    return f"<style>\n{textwrap.indent(page_css(family), '        ')}    </style>"
+
+
+def add_css_mode_argument(parser):
+    """Add the shared --css option to a generator's argument parser"""
+    parser.add_argument(
+        '--css', dest='css_mode', choices=CSS_MODES, default='inline',
+        help="inline each page's stylesheet (default), link the shared hashed stylesheet, "
+             "or inline only the critical rules and load the shared stylesheet asynchronously"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the shared site stylesheet")
+    parser.parse_args()
+    source = sum(stylesheet_path(family).stat().st_size for family in PAGE_STYLES)
+    url = site_stylesheet_url()
+    print(f"{url}: {(BASE_DIR / url).stat().st_size / 1024:.1f} KB (from {source / 1024:.1f} KB of sources)")
+
+
+if __name__ == "__main__":
+    main()
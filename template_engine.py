@@ -0,0 +1,111 @@
+"""
+Template layer shared by the HTML generators
+
+Markup partials (page head, nav, hero, committee card, publication row,
+footer, ...) live in templates/*.html and are reused across pages.
+Syntax:
+- {{ name }}      inserts a value verbatim (values are markup, not escaped)
+- {{> partial }}  includes templates/partial.html, rendered with the same values
+
+Each template is compiled once into a tuple of literal strings and field
+names, with includes inlined. Compiled templates are kept in memory and
+cached in .build_cache/templates/, keyed by the hashes of the template
+sources they were compiled from.
+"""
+
+import hashlib
+import marshal
+import os
+import re
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+TEMPLATES_DIR = BASE_DIR / "templates"
+CACHE_DIR = BASE_DIR / ".build_cache" / "templates"
+
+TOKEN_RE = re.compile(r"\{\{\s*(>?)\s*([\w-]+)\s*\}\}")
+
+_compiled = {}
+
+
+def _source(name):
+    """Template text, without the trailing newline of the file"""
+    text = (TEMPLATES_DIR / f"{name}.html").read_text(encoding='utf-8')
+    return text[:-1] if text.endswith('\n') else text
+
+
+def _source_hash(name):
+    return hashlib.sha256((TEMPLATES_DIR / f"{name}.html").read_bytes()).hexdigest()
+
+
+def _parse(name, deps, stack=()):
+    """Return alternating [literal, field, literal, ...] with includes inlined"""
+    if name in stack:
+        raise ValueError(f"Template include cycle: {' -> '.join(stack + (name,))}")
+    deps[name] = _source_hash(name)
+    text = _source(name)
+    segments = ['']
+    pos = 0
+    for match in TOKEN_RE.finditer(text):
+        segments[-1] += text[pos:match.start()]
+        if match.group(1):
+            included = _parse(match.group(2), deps, stack + (name,))
+            segments[-1] += included[0]
+            segments.extend(included[1:])
+        else:
+            segments.extend([match.group(2), ''])
+        pos = match.end()
+    segments[-1] += text[pos:]
+    return segments
+
+
+def compile_template(name):
+    """Compiled form of a template: (literals, fields), memoized in memory and on disk"""
+    if name in _compiled:
+        return _compiled[name]
+
+    cache_file = CACHE_DIR / f"{name}.marshal"
+    compiled = None
+    try:
+        with open(cache_file, 'rb') as f:
+            deps, literals, fields = marshal.load(f)
+        if all(_source_hash(dep) == digest for dep, digest in deps.items()):
+            compiled = (literals, fields)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    if compiled is None:
+        deps = {}
+        segments = _parse(name, deps)
+        compiled = (tuple(segments[0::2]), tuple(segments[1::2]))
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            marshal.dump((deps, compiled[0], compiled[1]), f)
+        os.replace(tmp, cache_file)
+
+    _compiled[name] = compiled
+    return compiled
+
+
+def template_inputs(*names):
+    """Template files (including their includes) the given templates are built from"""
+    files = []
+    for name in names:
+        deps = {}
+        _parse(name, deps)
+        files += [TEMPLATES_DIR / f"{dep}.html" for dep in deps if TEMPLATES_DIR / f"{dep}.html" not in files]
+    return files
+
+
+def render_template(template, /, **values):
+    """Render templates/<template>.html with the given values"""
+    literals, fields = compile_template(template)
+    parts = [literals[0]]
+    for field, literal in zip(fields, literals[1:]):
+        try:
+            parts.append(str(values[field]))
+        except KeyError:
+            raise KeyError(f"Template '{template}' needs a value for '{field}'") from None
+        parts.append(literal)
+    return ''.join(parts)
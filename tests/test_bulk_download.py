@@ -0,0 +1,210 @@
+"""
+Bulk photo downloads (scripts/bulk_download.py) from a LocalSource directory
+
+LocalSource serves <root>/<host>/<path> for each URL, with the source file's
+size and mtime as ETag, so resumes, If-Range and revalidation run without a
+server. HTTPSourceTest serves the same files over a local http.server to
+check the shared HTTP cache.
+
+Run: python -m pytest tests
+"""
+
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR / "scripts"))
+
+from bulk_download import MANIFEST_NAME, HTTPSource, LocalSource, download_batch, duplicate_files
+
+PHOTO = bytes(range(256)) * 16  # 4 KB
+OTHER_PHOTO = bytes(reversed(range(256))) * 16
+
+
+class BulkDownloadTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.remote = Path(tmp.name) / "remote"
+        self.out = Path(tmp.name) / "people"
+        self.source = LocalSource(self.remote)
+
+    def publish(self, name, data, mtime_ns=None):
+        """Put a file on the "server", return its URL"""
+        url = f"https://images.example.org/{name}"
+        path = self.source.path_for(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return url
+
+    def etag(self, url):
+        st = self.source.path_for(url).stat()
+        return f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+
+    def download(self, jobs, **options):
+        return download_batch(jobs, source=self.source, **options)
+
+    def test_partial_download_is_resumed(self):
+        url = self.publish("a.jpg", PHOTO)
+        target = self.out / "a.jpg"
+        self.out.mkdir()
+        # The first 1000 bytes arrived before the interruption (marked, to show they are kept)
+        (self.out / "a.jpg.part").write_bytes(b"x" * 1000)
+        (self.out / "a.jpg.part.validator").write_text(self.etag(url), encoding="utf-8")
+
+        [result] = self.download([(url, target)])
+
+        self.assertEqual(result["status"], "downloaded")
+        self.assertEqual(target.read_bytes(), b"x" * 1000 + PHOTO[1000:])
+        self.assertEqual(sorted(p.name for p in self.out.iterdir()), [MANIFEST_NAME, "a.jpg"])
+
+    def test_stale_partial_download_is_discarded(self):
+        url = self.publish("a.jpg", PHOTO)
+        target = self.out / "a.jpg"
+        self.out.mkdir()
+        # Started on a version of the file that has since been replaced (If-Range mismatch)
+        (self.out / "a.jpg.part").write_bytes(b"x" * 1000)
+        (self.out / "a.jpg.part.validator").write_text('"old-version"', encoding="utf-8")
+
+        [result] = self.download([(url, target)])
+
+        self.assertEqual(result["status"], "downloaded")
+        self.assertEqual(target.read_bytes(), PHOTO)
+        self.assertFalse((self.out / "a.jpg.part.validator").exists())
+
+    def test_unchanged_files_are_revalidated(self):
+        url = self.publish("a.jpg", PHOTO, mtime_ns=1_000_000_000)
+        target = self.out / "a.jpg"
+        self.download([(url, target)])
+        manifest = json.loads((self.out / MANIFEST_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(manifest["a.jpg"]["url"], url)
+        self.assertEqual(manifest["a.jpg"]["etag"], self.etag(url))
+
+        # Same validator upstream: not fetched again (the 304 case)
+        with mock.patch.object(self.source, "fetch", wraps=self.source.fetch) as fetch:
+            [result] = self.download([(url, target)])
+        self.assertEqual(result["status"], "current")
+        self.assertEqual(fetch.call_args.args[2], {"etag": self.etag(url)})
+
+        # New validator, same bytes: fetched, but the file isn't rewritten
+        self.publish("a.jpg", PHOTO, mtime_ns=2_000_000_000)
+        before = target.stat().st_mtime_ns
+        [result] = self.download([(url, target)])
+        self.assertEqual(result["status"], "unchanged")
+        self.assertEqual(target.stat().st_mtime_ns, before)
+
+        # Replaced upstream
+        self.publish("a.jpg", OTHER_PHOTO, mtime_ns=3_000_000_000)
+        [result] = self.download([(url, target)])
+        self.assertEqual(result["status"], "downloaded")
+        self.assertEqual(target.read_bytes(), OTHER_PHOTO)
+
+    def test_file_edited_on_disk_is_fetched_again(self):
+        url = self.publish("a.jpg", PHOTO)
+        target = self.out / "a.jpg"
+        self.download([(url, target)])
+        target.write_bytes(b"edited")
+
+        [result] = self.download([(url, target)])
+
+        self.assertEqual(result["status"], "downloaded")
+        self.assertEqual(target.read_bytes(), PHOTO)
+
+    def test_small_responses_are_rejected(self):
+        url = self.publish("placeholder.png", b"\x89PNG" + b"\0" * 100)
+        target = self.out / "placeholder.png"
+
+        [result] = self.download([(url, target)], min_size=2000)
+
+        self.assertEqual(result["status"], "failed")
+        self.assertIn("only 104 bytes", result["error"])
+        self.assertFalse(target.exists())
+
+    def test_missing_source_fails_without_stopping_the_batch(self):
+        url = self.publish("a.jpg", PHOTO)
+        results = self.download([("https://images.example.org/gone.jpg", self.out / "gone.jpg"),
+                                 (url, self.out / "a.jpg")])
+
+        self.assertEqual([r["status"] for r in results], ["failed", "downloaded"])
+
+    def test_duplicate_jobs_and_identical_images(self):
+        a = self.publish("a.jpg", PHOTO)
+        b = self.publish("b.jpg", OTHER_PHOTO)
+        placeholder = self.publish("placeholder.jpg", PHOTO)
+        jobs = [
+            (a, self.out / "a.jpg"),
+            (b, self.out / "a.jpg"),           # another URL for a file already taken
+            (a, self.out / "a_copy.jpg"),      # same URL, second file: fetched once
+            (placeholder, self.out / "c.jpg"),  # same content as a.jpg
+        ]
+
+        with mock.patch.object(self.source, "fetch", wraps=self.source.fetch) as fetch:
+            results = self.download(jobs)
+
+        self.assertEqual([r["status"] for r in results], ["downloaded", "duplicate", "downloaded", "downloaded"])
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(duplicate_files(results), [[self.out / "a.jpg", self.out / "a_copy.jpg", self.out / "c.jpg"]])
+        self.assertEqual((self.out / "a.jpg").read_bytes(), PHOTO)
+
+
+class HTTPSourceTest(unittest.TestCase):
+    """HTTPSource revalidates through the shared HTTP cache and replays it offline"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.remote = Path(tmp.name) / "remote"
+        self.remote.mkdir()
+        (self.remote / "a.jpg").write_bytes(PHOTO)
+        self.out = Path(tmp.name) / "people"
+        patch = mock.patch.dict(os.environ, {"HTTP_CACHE_DIR": str(Path(tmp.name) / "http"),
+                                             "HTTP_CACHE_OFFLINE": ""})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        # http.server sends Last-Modified and answers If-Modified-Since with 304
+        handler = functools.partial(SimpleHTTPRequestHandler, directory=str(self.remote))
+        handler.log_message = lambda *args: None
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = f"http://127.0.0.1:{server.server_address[1]}/a.jpg"
+
+    def download(self, offline=None):
+        source = HTTPSource(offline=offline)
+        [result] = download_batch([(self.url, self.out / "a.jpg")], source=source)
+        return result["status"], source.session
+
+    def test_revalidation_and_offline_replay(self):
+        status, session = self.download()
+        self.assertEqual((status, session.misses), ("downloaded", 1))
+
+        status, session = self.download()
+        self.assertEqual((status, session.hits, session.misses), ("current", 1, 0))
+
+        status, session = self.download(offline=True)
+        self.assertEqual(status, "current")
+        self.assertEqual(session.summary(), "HTTP cache: 1 unchanged, 0 downloaded (offline)")
+        self.assertEqual((self.out / "a.jpg").read_bytes(), PHOTO)
+
+    def test_offline_without_a_cached_copy_fails(self):
+        status, _ = self.download(offline=True)
+
+        self.assertEqual(status, "failed")
+        self.assertFalse((self.out / "a.jpg").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Co-authorship by OpenAlex author ID (docs/scripts/coauthorship.py) on fixture records
+
+Run: python -m pytest tests
+"""
+
+import io
+import sys
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR / "docs" / "scripts"))
+
+from coauthorship import CoauthorshipIndex, coauthorship_report
+from fetch_publications import infer_author_id, is_joint, select_joint_publications
+
+OSTERRIEDER = "A5032430973"
+CHAN = "A0000000001"
+OTHER_CHAN = "A0000000002"  # Sarah Chan, a different author
+CHU = "A0000000003"
+
+
+def record(work_id, year, authors):
+    """Store record (extract_store_record) with (name, author ID) authorships"""
+    return {
+        "openalex_id": f"https://openalex.org/{work_id}", "title": f"Work {work_id}", "year": year,
+        "journal": "Journal", "doi": None, "doi_url": None, "citations": 0, "concepts": [], "open_access": False,
+        "authors": [name for name, _ in authors], "author_ids": [author_id for _, author_id in authors],
+        "updated_date": "2025-06-01T00:00:00",
+    }
+
+
+RECORDS = [
+    record("W1", 2024, [("Stephen Chan", CHAN), ("Joerg Osterrieder", OSTERRIEDER), ("Jeffrey Chu", CHU)]),
+    record("W2", 2023, [("Joerg Osterrieder", OSTERRIEDER), ("S. Chan", OTHER_CHAN)]),
+    record("W3", 2022, [("Stephen Chan", CHAN), ("Jeffrey Chu", CHU)]),
+    record("W4", 2017, [("Stephen  CHAN", CHAN), ("Jörg Osterrieder", OSTERRIEDER)]),
+    record("W5", 2016, [("Joerg Osterrieder", OSTERRIEDER)]),
+]
+
+
+class CoauthorshipIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CoauthorshipIndex.from_records({OSTERRIEDER, CHAN, CHU}, RECORDS)
+
+    def test_pairs_are_extracted_by_author_id(self):
+        pairs = self.index.pairs()
+
+        self.assertEqual(
+            {pair: [w["openalex_id"].rsplit("/", 1)[-1] for w in works] for pair, works in pairs.items()},
+            {
+                (CHAN, OSTERRIEDER): ["W1", "W4"],
+                (CHAN, CHU): ["W1", "W3"],
+                (CHU, OSTERRIEDER): ["W1"],
+            },
+        )
+        self.assertEqual([len(works) for works in pairs.values()], [2, 2, 1])
+
+    def test_another_s_chan_is_not_a_member(self):
+        # W2's "S. Chan" passes the old name test but has a different author ID
+        self.assertTrue(is_joint(RECORDS[1]["authors"]))
+        self.assertEqual([w["title"] for w in self.index.coauthored(OSTERRIEDER, CHAN)], ["Work W1", "Work W4"])
+        self.assertNotIn(OTHER_CHAN, {a for pair in self.index.pairs() for a in pair})
+
+    def test_works_of_an_author_newest_first(self):
+        self.assertEqual([w["year"] for w in self.index.works_of(OSTERRIEDER)], [2024, 2023, 2017, 2016])
+
+    def test_report_names_the_members(self):
+        names = {OSTERRIEDER: "Joerg Osterrieder", CHAN: "Stephen Chan", CHU: "Jeffrey Chu"}
+        report = coauthorship_report(self.index, names)
+
+        # Most joint works first, ties by author ID
+        self.assertEqual([pair["authors"] for pair in report], [
+            ["Stephen Chan", "Jeffrey Chu"], ["Stephen Chan", "Joerg Osterrieder"], ["Jeffrey Chu", "Joerg Osterrieder"],
+        ])
+        self.assertEqual([pair["joint_works"] for pair in report], [2, 2, 1])
+
+
+class InferAuthorIdTest(unittest.TestCase):
+
+    def test_exact_name_gives_the_id(self):
+        self.assertEqual(infer_author_id(RECORDS, "Stephen Chan"), CHAN)
+        self.assertEqual(infer_author_id(RECORDS, "Joerg Osterrieder"), OSTERRIEDER)
+
+    def test_unknown_or_ambiguous_name_gives_none(self):
+        self.assertIsNone(infer_author_id(RECORDS, "Maria Iannario"))
+        ambiguous = RECORDS + [record("W6", 2015, [("Stephen Chan", "A0000000009")])]
+        self.assertIsNone(infer_author_id(ambiguous, "Stephen Chan"))
+
+    def test_joint_publications_use_the_inferred_id(self):
+        with redirect_stdout(io.StringIO()):
+            joint = select_joint_publications(RECORDS)
+
+        self.assertEqual([p["title"] for p in joint], ["Work W1", "Work W3", "Work W4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
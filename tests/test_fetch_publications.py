@@ -0,0 +1,164 @@
+"""
+OpenAlex harvesting (docs/scripts/fetch_publications.py) against openalex_stub
+
+The stub replays tests/fixtures/openalex/: responses in the shape of recorded
+OpenAlex replies, whose works are the publications in docs/data/publications.json.
+The tests page them three works at a time; full-page1.json serves the
+same works as one 200-work page for manual runs of the stub. The
+incremental-*.json fixtures answer the from_updated_date:2025-01-01 filter of
+an incremental sync, and incremental-rejected.json refuses another date (as
+for an API plan without that filter).
+
+Run: python -m pytest tests
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR / "docs" / "scripts"))
+
+import fetch_publications
+from fetch_publications import (OSTERRIEDER_ID, OpenAlexClient, fetch_works, load_store, save_store, sync_state_path,
+                                sync_store)
+from openalex_stub import ReplayServer
+
+FIXTURES = Path(__file__).parent / "fixtures" / "openalex"
+ALL_WORKS = f"author.id:{OSTERRIEDER_ID}"
+UPDATED_WORKS = f"author.id:{OSTERRIEDER_ID},from_updated_date:2025-01-01"
+
+
+class StubTestCase(unittest.TestCase):
+    """OpenAlexClient against a ReplayServer of the fixtures"""
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        # Three works per page, so the seven works of the fixtures span several pages
+        for patch in (mock.patch.dict(os.environ, {"HTTP_CACHE_DIR": cache_dir.name, "HTTP_CACHE_OFFLINE": ""}),
+                      mock.patch.object(fetch_publications, "PER_PAGE", 3)):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.stub = ReplayServer(FIXTURES).__enter__()
+        self.addCleanup(self.stub.__exit__)
+        self.client = OpenAlexClient(self.stub.base_url, rate=0, workers=4, retries=3)
+
+    def requested(self, **params):
+        """Parameters of the requests the stub received that include params"""
+        return [p for _, p in self.stub.requests if all(p.get(k) == v for k, v in params.items())]
+
+
+class HarvestTest(StubTestCase):
+    def test_sharded_harvest_follows_cursors_and_dedupes(self):
+        works = self.client.harvest(ALL_WORKS)
+
+        ids = [work["id"] for work in works]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(len(ids), 7)
+        for year in ("2024", "2023", "2017"):
+            self.assertTrue(self.requested(filter=f"{ALL_WORKS},publication_year:{year}", cursor="*"))
+        self.assertEqual(len(self.requested(filter=f"{ALL_WORKS},publication_year:2024", cursor="IlsyMDI0LCAyXSI=")), 1)
+
+    def test_sharding_is_decided_by_a_count_probe(self):
+        self.client.harvest(ALL_WORKS)
+
+        self.assertEqual(len(self.requested(filter=ALL_WORKS, per_page="1")), 1)
+        # No page of the unsharded filter is fetched and thrown away
+        self.assertEqual(self.requested(filter=ALL_WORKS, cursor="*"), [])
+
+    def test_throttled_and_failed_requests_are_retried(self):
+        works = self.client.harvest(ALL_WORKS)
+
+        self.assertEqual(len(self.requested(filter=f"{ALL_WORKS},publication_year:2023", cursor="*")), 3)
+        self.assertIn("https://openalex.org/W4313680464", {work["id"] for work in works})
+        # probe, group_by and four pages; the two retries happen below get()
+        self.assertEqual(self.client.requests, 6)
+        self.assertEqual(len(self.stub.requests), 8)
+
+    def test_unshardable_filter_is_one_cursor_stream(self):
+        works = self.client.harvest(UPDATED_WORKS)
+
+        self.assertEqual(len({work["id"] for work in works}), len(works))
+        self.assertEqual(len(works), 4)
+        self.assertEqual(len(self.requested(filter=UPDATED_WORKS, cursor="*")), 1)
+        self.assertEqual(len(self.requested(filter=UPDATED_WORKS, cursor="IlsyXSI=")), 1)
+        self.assertFalse([p for p in self.stub.requests if "publication_year:" in p[1].get("filter", "")])
+
+    def test_fetch_works_extracts_store_records(self):
+        records = fetch_works(self.client, since="2025-01-01")
+
+        self.assertEqual(len(records), 4)
+        for record in records:
+            self.assertIn(OSTERRIEDER_ID, record["author_ids"])
+            self.assertIn("Joerg Osterrieder", record["authors"])
+
+
+class SyncStoreTest(StubTestCase):
+
+    def setUp(self):
+        super().setUp()
+        store_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(store_dir.cleanup)
+        self.store_path = Path(store_dir.name) / "openalex_works.jsonl"
+        # A work no longer returned by OpenAlex: kept by a merge, dropped by a full sync
+        self.sync(incremental=False)
+        store = load_store(self.store_path)
+        store["https://openalex.org/W0"] = dict(store["https://openalex.org/W2759609844"],
+                                                openalex_id="https://openalex.org/W0")
+        save_store(store, self.store_path)
+        self.stub.requests.clear()
+
+    def sync(self, **options):
+        with redirect_stdout(io.StringIO()):
+            return sync_store(self.client, self.store_path, **options)
+
+    def set_state(self, last_sync, author_ids=(OSTERRIEDER_ID,)):
+        sync_state_path(self.store_path).write_text(
+            json.dumps({"last_sync": last_sync, "author_ids": sorted(author_ids)}), encoding="utf-8")
+
+    def test_incremental_sync_merges_updated_works(self):
+        self.set_state("2025-01-01")
+
+        store = self.sync()
+
+        self.assertTrue(self.requested(filter=UPDATED_WORKS))
+        self.assertFalse(self.requested(filter=ALL_WORKS))
+        self.assertEqual(len(store), 8)
+        self.assertIn("https://openalex.org/W0", store)
+        # Replaced by the updated record (its publication year was removed)
+        self.assertIsNone(store["https://openalex.org/W4313680464"]["year"])
+        self.assertEqual(store["https://openalex.org/W2901383326"]["year"], 2017)
+        self.assertEqual(load_store(self.store_path), store)
+        self.assertEqual(json.loads(sync_state_path(self.store_path).read_text(encoding="utf-8"))["author_ids"],
+                         [OSTERRIEDER_ID])
+
+    def test_rejected_incremental_filter_falls_back_to_a_full_sync(self):
+        self.set_state("2025-06-01")
+
+        store = self.sync()
+
+        self.assertEqual(len(self.requested(filter=f"{ALL_WORKS},from_updated_date:2025-06-01")), 1)
+        self.assertTrue(self.requested(filter=ALL_WORKS, per_page="1"))
+        self.assertEqual(len(store), 7)
+        self.assertNotIn("https://openalex.org/W0", store)
+        self.assertEqual(store["https://openalex.org/W4313680464"]["year"], 2023)
+
+    def test_changed_author_set_forces_a_full_sync(self):
+        self.set_state("2025-01-01", author_ids=(OSTERRIEDER_ID, "A0000000001"))
+
+        store = self.sync()
+
+        self.assertFalse([p for _, p in self.stub.requests if "from_updated_date" in p.get("filter", "")])
+        self.assertEqual(len(store), 7)
+        self.assertNotIn("https://openalex.org/W0", store)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Batch committee selection (scripts/select_committee.py) on hand-made people
+
+Run: python -m pytest tests
+"""
+
+import sys
+import unittest
+from collections import Counter, defaultdict
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR / "scripts"))
+
+from select_committee import score_people, select_batch
+
+
+def person(name, affiliation="FHGR, Switzerland", photo=True, bio=True):
+    return {
+        'name': name, 'key': name.lower(), 'affiliation': affiliation, 'bio': "Bio" if bio else None,
+        'photo': f"{name.lower()}.jpg" if photo else None, 'photo_status': "ok" if photo else None,
+    }
+
+
+PEOPLE = [
+    person("Anna", "FHGR, Switzerland"),
+    person("Ben", "FHGR, Switzerland"),
+    person("Carla", "FHGR, Switzerland"),
+    person("Dan", "AUS, UAE", bio=False),
+    person("Eva", "Bocconi, Italy", photo=False),
+    person("Finn", None),
+]
+
+CONTEXT = {'publications': Counter(), 'texts': defaultdict(list)}
+
+
+def rules(**overrides):
+    return {
+        'size': 10,
+        'require': [],
+        'rules': [
+            {'rule': "photo", 'weight': 3},
+            {'rule': "bio", 'weight': 1},
+            {'rule': "region", 'name': "swiss_mena", 'weight': 2, 'countries': ["Switzerland", "UAE"]},
+        ],
+        **overrides,
+    }
+
+
+def names(items):
+    return [item[0]['name'] for item in items]
+
+
+class ScorePeopleTest(unittest.TestCase):
+
+    def test_weighted_points_rank_best_first(self):
+        ranked = score_people(PEOPLE, rules(), CONTEXT)
+
+        self.assertEqual(names(ranked), ["Anna", "Ben", "Carla", "Dan", "Finn", "Eva"])
+        person_, total, points, eligible = ranked[0]
+        self.assertEqual(points, {'photo': 3.0, 'bio': 1.0, 'swiss_mena': 2.0})
+        self.assertEqual(total, 6.0)
+        self.assertTrue(all(item[3] for item in ranked))
+
+    def test_require_uses_the_configured_rule_parameters(self):
+        ranked = score_people(PEOPLE, rules(require=["swiss_mena"]), CONTEXT)
+
+        eligible = {item[0]['name'] for item in ranked if item[3]}
+        self.assertEqual(eligible, {"Anna", "Ben", "Carla", "Dan"})
+
+    def test_require_by_rule_type_and_unconfigured_parameterless_rule(self):
+        ranked = score_people(PEOPLE, rules(require=["region", "affiliation"]), CONTEXT)
+
+        self.assertEqual({item[0]['name'] for item in ranked if item[3]}, {"Anna", "Ben", "Carla", "Dan"})
+
+    def test_unknown_or_incomplete_required_rule_fails_clearly(self):
+        with self.assertRaisesRegex(ValueError, "unknown rule 'nope'"):
+            score_people(PEOPLE, rules(require=["nope"]), CONTEXT)
+        without_region = rules(require=["region"])
+        without_region['rules'] = without_region['rules'][:2]
+        with self.assertRaisesRegex(ValueError, "needs countries"):
+            score_people(PEOPLE, without_region, CONTEXT)
+
+
+class SelectBatchTest(unittest.TestCase):
+
+    def test_size_and_require(self):
+        selected, skipped = select_batch(rules(size=3, require=["affiliation"], max_per_affiliation=None),
+                                         PEOPLE, CONTEXT)
+
+        self.assertEqual(names(selected), ["Anna", "Ben", "Carla"])
+        self.assertEqual(names(skipped), ["Dan", "Finn", "Eva"])
+
+    def test_max_per_affiliation(self):
+        selected, _ = select_batch(rules(size=4, max_per_affiliation=2), PEOPLE, CONTEXT)
+
+        self.assertEqual(names(selected), ["Anna", "Ben", "Dan", "Finn"])
+
+    def test_include_overrides_rank_require_and_affiliation_cap(self):
+        selected, _ = select_batch(rules(size=3, max_per_affiliation=2, require=["photo"],
+                                         include=["Carla", "Eva"]), PEOPLE, CONTEXT)
+
+        # Included members are kept even if ineligible or over the cap; one place is left
+        self.assertEqual(names(selected), ["Anna", "Carla", "Eva"])
+
+    def test_exclude_overrides_rank(self):
+        selected, _ = select_batch(rules(size=2, exclude=["Anna"]), PEOPLE, CONTEXT)
+
+        self.assertEqual(names(selected), ["Ben", "Carla"])
+
+    def test_full_include_keeps_the_committee(self):
+        selected, _ = select_batch(rules(size=2, include=["Eva", "Finn"]), PEOPLE, CONTEXT)
+
+        self.assertEqual(names(selected), ["Finn", "Eva"])
+
+
+if __name__ == "__main__":
+    unittest.main()